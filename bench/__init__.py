@@ -0,0 +1,23 @@
+from __future__ import division, print_function, unicode_literals
+import timeit
+
+
+def make_parser(package, **kwargs):
+    def error_logger(msg, token=None, lineno=None, lexpos=None):
+        raise ValueError('%s (line %s)' % (msg, lineno))
+
+    l = package.Lexer(error_logger)
+    p = package.Parser(l.tokens, error_logger, **kwargs)
+
+    lexer = l.build()
+    parser = p.build()
+
+    def parse(text):
+        lexer.lineno = 1
+        return parser.parse(text, lexer=lexer)
+
+    return parse
+
+
+def best_time(func, repeat=5, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
@@ -0,0 +1,65 @@
+from __future__ import division, print_function, unicode_literals
+import gc
+
+import jel
+from jel.compiler import Compiler
+
+from . import best_time, make_parser
+from .numbers import number_array
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2
+    tracemalloc = None
+
+
+def retained_memory(func):
+    """
+    Returns the result of func() and the number of bytes allocated by it
+    that are still in use when it returns
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def measure(text, packed):
+    """
+    Returns the memory retained by the AST and the code for `text`, and the
+    time taken to compile it.  (Both are released when this returns.)
+    """
+    parse = make_parser(jel, packed_arrays=packed)
+    root, ast_size = retained_memory(lambda: parse(text))
+    code, code_size = retained_memory(lambda: Compiler().compile(root))
+    compile_time = best_time(lambda: Compiler().compile(root))
+    return ast_size, code_size, compile_time
+
+
+def main():
+    if tracemalloc is None:
+        print('Memory measurements require tracemalloc (Python 3.4+)')
+        return
+
+    print('%8s %8s %12s %12s %12s' % ('count', 'packed', 'ast (KiB)',
+                                      'code (KiB)', 'compile (s)'))
+    for count in (1000, 10000, 100000):
+        text = number_array(count)
+        for packed in (False, True):
+            ast_size, code_size, compile_time = measure(text, packed)
+            print('%8d %8s %12.1f %12.1f %12.6f' % (count,
+                                                    packed,
+                                                    ast_size / 1024,
+                                                    code_size / 1024,
+                                                    compile_time))
+
+
+if __name__ == '__main__':
+    main()
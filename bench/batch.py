@@ -0,0 +1,42 @@
+from __future__ import division, print_function, unicode_literals
+import random
+
+import jel
+from jel.batch import BatchExecutor, evaluate_batch, numpy
+from jel.compiler import Compiler
+
+from . import best_time, make_parser
+
+
+class ScalarBatchExecutor(BatchExecutor):
+
+    # Evaluates every op list row by row
+    def _is_vectorizable(self, ops):
+        return False
+
+
+def main():
+    parse = make_parser(jel)
+    code = Compiler().compile(
+        parse('eye_h > -fixation_width and eye_h < fixation_width')
+        )
+    names = {'fixation_width': 2.0}
+
+    print('%10s %14s %14s' % ('rows', 'scalar (r/s)', 'batch (r/s)'))
+    for count in (1000, 100000, 1000000):
+        rand = random.Random(0)
+        values = [rand.uniform(-5.0, 5.0) for i in range(count)]
+        columns = {'eye_h': (values if numpy is None else
+                             numpy.array(values))}
+        scalar_time = best_time(
+            lambda: ScalarBatchExecutor(columns, names).evaluate(code),
+            repeat=1)
+        batch_time = best_time(lambda: evaluate_batch(code, columns, names),
+                               repeat=3)
+        print('%10d %14.0f %14.0f' % (count,
+                                      count / scalar_time,
+                                      count / batch_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+from __future__ import division, print_function, unicode_literals
+
+import mwel
+from mwel.compiler import Compiler
+
+from . import best_time, make_parser
+
+
+def nested_functions(depth, num_refs):
+    """
+    Generate a module with `depth` nested functions, each declaring a
+    local and referencing every enclosing local `num_refs` times
+    """
+    lines = []
+    for level in range(depth):
+        indent = '    ' * level
+        lines.append('%slocal function f%d(a%d):' % (indent, level, level))
+        lines.append('%s    local v%d = a%d' % (indent, level, level))
+        for _ in range(num_refs):
+            lines.append('%s    v%d = %s' %
+                         (indent, level,
+                          ' + '.join('v%d' % l for l in range(level + 1))))
+    for level in reversed(range(depth)):
+        lines.append('%send' % ('    ' * level))
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    parse = make_parser(mwel)
+    print('%6s %6s %12s' % ('depth', 'refs', 'compile (s)'))
+    for depth in (4, 16, 32, 64):
+        for num_refs in (1, 10):
+            root = parse(nested_functions(depth, num_refs))
+            elapsed = best_time(lambda: Compiler().compile(root))
+            print('%6d %6d %12.6f' % (depth, num_refs, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+from __future__ import division, print_function, unicode_literals
+
+import jel
+import mwel
+from jel.codegen import PythonExecutor
+from jel.compiler import Compiler
+from jel.executor import Executor
+from mwel.codegen import PythonExecutor as MWELPythonExecutor
+from mwel.compiler import Compiler as MWELCompiler
+from mwel.executor import Executor as MWELExecutor
+
+from . import best_time, make_parser
+
+
+expr = ('(eye_h - offset) ** 2 + eye_v ** 2 < radius ** 2 and '
+        'not (eye_h > 10 or eye_v > 10)')
+
+module = '''
+function fib(n):
+    if (n < 2):
+        return n
+    end
+    return fib(n - 1) + fib(n - 2)
+end
+total = 0
+i = 0
+while (i < 2000):
+    total = total + i * 2
+    i = i + 1
+end
+result = fib(15)
+'''
+
+
+def main():
+    code = Compiler().compile(make_parser(jel)(expr))
+    names = {'eye_h': 1.0, 'eye_v': 0.5, 'offset': 0.25, 'radius': 2.0}
+    count = 10000
+
+    print('%8s %14s %14s' % ('', 'ops (s)', 'python (s)'))
+    times = []
+    for executor in (Executor(names), PythonExecutor(names)):
+        times.append(best_time(lambda: [executor.execute(code)
+                                        for i in range(count)]))
+    print('%8s %14.4f %14.4f' % ('jel', times[0], times[1]))
+
+    code = MWELCompiler().compile(make_parser(mwel)(module))
+    times = []
+    for executor_class in (MWELExecutor, MWELPythonExecutor):
+        times.append(best_time(lambda: executor_class().run(code), repeat=3))
+    print('%8s %14.4f %14.4f' % ('mwel', times[0], times[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+from __future__ import division, print_function, unicode_literals
+
+import mwel
+from mwel.codegen import PythonExecutor
+from mwel.compiler import Compiler
+from mwel.executor import Executor
+
+from . import best_time, make_parser
+
+
+module = '''
+total = 0
+i = 0
+while (i < 5000):
+    if (i % 3 == 0):
+        total = total + i
+    else if (i % 3 == 1):
+        total = total - 1
+    else:
+        total = total * 1
+    end
+    i = i + 1
+end
+'''
+
+
+def main():
+    root = make_parser(mwel)(module)
+
+    print('%10s %14s %14s' % ('', 'ops (s)', 'python (s)'))
+    for label, inline_control_flow in (('compound', False),
+                                       ('inline', True)):
+        code = Compiler(inline_control_flow=inline_control_flow).compile(root)
+        times = []
+        for executor_class in (Executor, PythonExecutor):
+            times.append(best_time(lambda: executor_class().run(code),
+                                   repeat=3))
+        print('%10s %14.4f %14.4f' % (label, times[0], times[1]))
+
+
+if __name__ == '__main__':
+    main()
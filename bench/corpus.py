@@ -0,0 +1,143 @@
+from __future__ import division, print_function, unicode_literals
+import random
+
+from .closures import nested_functions
+from .numbers import number_array
+
+
+#
+# Deterministic generators of synthetic JEL expressions and MWEL modules.
+# The same arguments (including the seed) always produce the same source.
+#
+
+binary_ops = ('+', '-', '*', '/', '%')
+
+comparison_ops = ('<', '<=', '>', '>=', '==', '!=')
+
+num_names = 10
+
+
+def name_values():
+    """Returns bindings for every name used by the generated code"""
+    names = dict(('v%d' % i, float(i + 1)) for i in range(num_names))
+    names['f'] = (lambda *args: sum(args))
+    names['obj'] = {'x': 1.0, 'items': (1.0, 2.0, 3.0)}
+    return names
+
+
+def _operand(rand):
+    kind = rand.randint(0, 5)
+    if kind == 0:
+        return '%d' % rand.randint(1, 100)
+    if kind == 1:
+        return 'obj.x'
+    if kind == 2:
+        return 'obj.items[%d]' % rand.randint(0, 2)
+    if kind == 3:
+        return 'f(v%d, %d)' % (rand.randrange(num_names), rand.randint(1, 9))
+    return 'v%d' % rand.randrange(num_names)
+
+
+def long_expression(num_terms, seed=0):
+    """
+    Generate a JEL expression that combines `num_terms` operands with
+    arithmetic, comparison, and logical operators
+    """
+    rand = random.Random(seed)
+    clauses = []
+    remaining = num_terms
+    while remaining > 0:
+        count = min(remaining, rand.randint(2, 8))
+        remaining -= count
+        terms = [_operand(rand) for i in range(count)]
+        arith = terms[0]
+        for term in terms[1:]:
+            arith += ' %s %s' % (rand.choice(binary_ops[:3]), term)
+        clauses.append('(%s) %s %d' % (arith,
+                                       rand.choice(comparison_ops),
+                                       rand.randint(0, 200)))
+    expr = clauses[0]
+    for clause in clauses[1:]:
+        expr += ' %s %s' % (rand.choice(('and', 'or')), clause)
+    return expr
+
+
+def nested_expression(depth, seed=0):
+    """Generate a JEL expression with `depth` levels of parentheses"""
+    rand = random.Random(seed)
+    expr = 'v0'
+    for level in range(depth):
+        expr = '(%s %s v%d)' % (expr,
+                                rand.choice(binary_ops[:3]),
+                                rand.randrange(num_names))
+    return expr
+
+
+def object_literal(count, seed=0):
+    """Generate a JEL object literal with `count` members"""
+    rand = random.Random(seed)
+    return '{%s}' % ', '.join('k%d: %s' % (i, _operand(rand))
+                              for i in range(count))
+
+
+def long_module(num_stmts, seed=0):
+    """
+    Generate an MWEL module with about `num_stmts` statements: a mix of
+    assignments, conditionals, and bounded loops
+    """
+    rand = random.Random(seed)
+    lines = ['total = 0']
+    for i in range(num_stmts):
+        kind = i % 4
+        target = 'v%d' % rand.randrange(num_names)
+        value = long_expression(rand.randint(1, 4), rand.randrange(2**32))
+        if kind == 0:
+            lines.append('%s = %s' % (target, value))
+        elif kind == 1:
+            lines.append('%s += %s' % (target, _operand(rand)))
+        elif kind == 2:
+            lines.append('if (%s):' % value)
+            lines.append('    total = total + 1')
+            lines.append('else:')
+            lines.append('    total = total - 1')
+            lines.append('end')
+        else:
+            lines.append('local i%d = 0' % i)
+            lines.append('while (i%d < 3):' % i)
+            lines.append('    total = total + %s' % _operand(rand))
+            lines.append('    i%d = i%d + 1' % (i, i))
+            lines.append('end')
+    return '\n'.join(lines) + '\n'
+
+
+def closure_module(num_functions, seed=0):
+    """
+    Generate an MWEL module defining `num_functions` functions, each of
+    which returns a closure over its argument and a local, and calls them
+    """
+    rand = random.Random(seed)
+    lines = ['total = 0']
+    for i in range(num_functions):
+        lines.append('function make%d(a):' % i)
+        lines.append('    local k = a * %d' % rand.randint(1, 9))
+        lines.append('    return function (x) x + k + a end')
+        lines.append('end')
+        lines.append('total = total + make%d(%d)(v%d)' %
+                     (i, rand.randint(1, 9), rand.randrange(num_names)))
+    return '\n'.join(lines) + '\n'
+
+
+def corpus(scale=1, seed=0):
+    """
+    Returns a list of (name, language, source) test cases, where language
+    is 'jel' or 'mwel', sized in proportion to `scale`
+    """
+    return [
+        ('long_expression', 'jel', long_expression(200 * scale, seed)),
+        ('nested_expression', 'jel', nested_expression(50 * scale, seed)),
+        ('number_array', 'jel', number_array(500 * scale, seed)),
+        ('object_literal', 'jel', object_literal(100 * scale, seed)),
+        ('long_module', 'mwel', long_module(50 * scale, seed)),
+        ('closure_module', 'mwel', closure_module(20 * scale, seed)),
+        ('nested_functions', 'mwel', nested_functions(4 * scale, 4)),
+        ]
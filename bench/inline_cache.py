@@ -0,0 +1,55 @@
+from __future__ import division, print_function, unicode_literals
+
+import mwel
+from jel.executor import HostObject
+from mwel.compiler import Compiler
+from mwel.executor import Executor
+from mwel.inline_cache import caching_executor_class
+
+from . import best_time, make_parser
+
+
+module = '''
+function scale(value, factor):
+    return value * factor
+end
+i = 0
+while (i < 3000):
+    eye.h = scale(eye.h, 0.5) + offset.h
+    eye.v = scale(factor = 2, value = eye.v) - offset.v
+    i = i + 1
+end
+'''
+
+
+class Position(object):
+
+    def __init__(self, h, v):
+        self.h = h
+        self.v = v
+
+
+HostObject.register(Position)
+
+
+def main():
+    root = make_parser(mwel)(module)
+    code = Compiler(inline_control_flow=True).compile(root)
+
+    def names():
+        return {'eye': Position(1.0, 1.0), 'offset': {'h': 0.25, 'v': 0.5}}
+
+    print('%10s %12s' % ('', 'time (s)'))
+    for executor_class in (Executor, caching_executor_class(Executor)):
+        elapsed = best_time(lambda: executor_class(names()).run(code),
+                            repeat=3)
+        print('%10s %12.4f' % (executor_class.__name__[:10], elapsed))
+
+    executor = caching_executor_class(Executor)(names())
+    executor.run(code)
+    for op_name, stats in sorted(executor.cache_stats().items()):
+        print('%14s %s' % (op_name, stats))
+
+
+if __name__ == '__main__':
+    main()
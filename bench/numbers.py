@@ -0,0 +1,52 @@
+from __future__ import division, print_function, unicode_literals
+import random
+
+import jel
+from jel.compiler import Compiler
+
+from . import best_time, make_parser
+
+
+def number_array(count, seed=0):
+    """
+    Generate a JEL array literal containing `count` numbers, a mix of
+    integers, fractions, and numbers with exponents
+    """
+    rand = random.Random(seed)
+    items = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            items.append('%d' % rand.randint(0, 100000))
+        elif kind == 1:
+            items.append('%.6f' % rand.uniform(0, 1000))
+        else:
+            items.append('%.3fe%d' % (rand.uniform(1, 10), rand.randint(-5, 5)))
+    return '[' + ', '.join(items) + ']'
+
+
+def main():
+    parse = make_parser(jel)
+    lexer = jel.Lexer(None).build()
+
+    def lex(text):
+        lexer.input(text)
+        while lexer.token():
+            pass
+
+    print('%8s %14s %14s %14s' % ('count', 'lex (n/s)', 'parse (n/s)',
+                                  'compile (n/s)'))
+    for count in (1000, 10000, 100000):
+        text = number_array(count)
+        root = parse(text)
+        lex_time = best_time(lambda: lex(text), repeat=3)
+        parse_time = best_time(lambda: parse(text), repeat=3)
+        compile_time = best_time(lambda: Compiler().compile(root), repeat=3)
+        print('%8d %14.0f %14.0f %14.0f' % (count,
+                                            count / lex_time,
+                                            count / parse_time,
+                                            count / compile_time))
+
+
+if __name__ == '__main__':
+    main()
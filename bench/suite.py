@@ -0,0 +1,126 @@
+from __future__ import division, print_function, unicode_literals
+import argparse
+import json
+import platform
+
+import jel
+import mwel
+from jel.compiler import Compiler
+from jel.executor import Executor
+from mwel.compiler import Compiler as MWELCompiler
+from mwel.executor import Executor as MWELExecutor
+
+from . import best_time, make_parser
+from .corpus import corpus, name_values
+
+
+languages = {
+    'jel': (jel, Compiler),
+    'mwel': (mwel, MWELCompiler),
+    }
+
+phases = ('lex', 'parse', 'compile', 'end_to_end')
+
+# Ratio of current to baseline time above which a result is flagged
+slowdown_threshold = 1.1
+
+
+def run_case(language, source, repeat):
+    """Returns the best time, in seconds, of each phase for `source`"""
+    package, compiler_class = languages[language]
+    lexer = package.Lexer(None).build()
+    parse = make_parser(package)
+
+    def lex():
+        lexer.input(source)
+        while lexer.token():
+            pass
+
+    def execute(code):
+        if language == 'jel':
+            return Executor(name_values()).execute(code)
+        return MWELExecutor(name_values()).run(code)
+
+    root = parse(source)
+    return {
+        'lex': best_time(lex, repeat=repeat),
+        'parse': best_time(lambda: parse(source), repeat=repeat),
+        'compile': best_time(lambda: compiler_class().compile(root),
+                             repeat=repeat),
+        'end_to_end': best_time(
+            lambda: execute(compiler_class().compile(parse(source))),
+            repeat=repeat),
+        }
+
+
+def run_suite(scales, repeat, seed=0):
+    results = {}
+    for scale in scales:
+        for name, language, source in corpus(scale, seed):
+            key = '%s/%d' % (name, scale)
+            results[key] = run_case(language, source, repeat)
+            results[key]['size'] = len(source)
+    return {
+        'python': platform.python_version(),
+        'seed': seed,
+        'results': results,
+        }
+
+
+def print_results(run, baseline=None):
+    header = '%-24s %8s' % ('case', 'size')
+    for phase in phases:
+        header += ' %12s' % phase
+    print(header)
+
+    base_results = (baseline or {}).get('results', {})
+    for key in sorted(run['results']):
+        result = run['results'][key]
+        line = '%-24s %8d' % (key, result['size'])
+        for phase in phases:
+            line += ' %12.6f' % result[phase]
+        print(line)
+
+        base = base_results.get(key)
+        if base is not None:
+            line = '%-24s %8s' % ('  vs. baseline', '')
+            for phase in phases:
+                ratio = result[phase] / base[phase]
+                line += ' %11.2fx' % ratio
+                if ratio > slowdown_threshold:
+                    line = line[:-1] + '!'
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark lexing, parsing, compiling, and end-to-end '
+                    'execution of a synthetic JEL/MWEL corpus'
+        )
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 4],
+                        help='corpus sizes to run (default: 1 4)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per measurement (default: 3)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline',
+                        help='compare with results saved by --output '
+                             '(slowdowns over %d%% are marked with !)' %
+                             round((slowdown_threshold - 1) * 100))
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    run = run_suite(args.scales, args.repeat, args.seed)
+    print_results(run, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,17 @@
 from __future__ import division, print_function, unicode_literals
 
+from jel import instrument as _instrument
+
 from .lexer import Lexer
 from .parser import Parser
 
 
-def parse(text):
+def parse(text, instrument=None):
+    """
+    Parses `text`, printing any errors.  If `instrument` is given, it's
+    called with a jel.instrument.Measurement for each phase (lexing and
+    parsing).
+    """
     def print_error(msg, token=None, lineno=None, lexpos=None):
         print(msg, end='')
         if (lineno is not None) and (lexpos is not None):
@@ -18,4 +25,4 @@ def parse(text):
     lexer = l.build()
     parser = p.build(debug=True)
 
-    return parser.parse(text, lexer=lexer)
+    return _instrument.parse(parser, lexer, text, instrument)
@@ -0,0 +1,170 @@
+from __future__ import division, print_function, unicode_literals
+import array
+import bisect
+import itertools
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+
+class ArrayValue(Sequence):
+
+    """
+    Base class for immutable array values with a representation more
+    compact or lazier than a tuple.
+
+    Array values compare equal to tuples (and to other array values) with
+    the same items, and hash like them, so they can be used wherever a
+    tuple array is expected.
+    """
+
+    __slots__ = ()
+
+    def materialize(self):
+        return tuple(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, (tuple, ArrayValue)):
+            return NotImplemented
+        return ((len(self) == len(other)) and
+                all(a == b for a, b in zip(self, other)))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return hash(self.materialize())
+
+    def __add__(self, other):
+        if not isinstance(other, (tuple, ArrayValue)):
+            return NotImplemented
+        return concat_arrays((self, other))
+
+    def __radd__(self, other):
+        if not isinstance(other, (tuple, ArrayValue)):
+            return NotImplemented
+        return concat_arrays((other, self))
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.materialize())
+
+
+class PackedArray(ArrayValue):
+
+    """
+    An array of numbers stored as C doubles in an array.array, rather than
+    as a tuple of float objects
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, values=()):
+        if isinstance(values, array.array) and values.typecode == 'd':
+            self._items = values
+        else:
+            self._items = array.array(str('d'), values)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PackedArray(self._items[index])
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, value):
+        return value in self._items
+
+    def __eq__(self, other):
+        if isinstance(other, PackedArray):
+            return self._items == other._items
+        return super(PackedArray, self).__eq__(other)
+
+    __hash__ = ArrayValue.__hash__
+
+    def __reduce__(self):
+        return (PackedArray, (self._items,))
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self._items.__sizeof__()
+
+
+class ConcatArray(ArrayValue):
+
+    """
+    The concatenation of several arrays, which are stored rather than
+    copied.  Nested concatenations are flattened, so indexing takes time
+    logarithmic in the number of parts.
+    """
+
+    __slots__ = ('parts', '_ends')
+
+    def __init__(self, parts):
+        flattened = []
+        for part in parts:
+            if isinstance(part, ConcatArray):
+                flattened.extend(part.parts)
+            elif len(part) > 0:
+                flattened.append(part)
+        self.parts = tuple(flattened)
+
+        self._ends = []
+        end = 0
+        for part in self.parts:
+            end += len(part)
+            self._ends.append(end)
+
+    def __len__(self):
+        return (self._ends[-1] if self._ends else 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.materialize()[index]
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError('Array index out of range')
+        part_index = bisect.bisect_right(self._ends, index)
+        start = (self._ends[part_index - 1] if part_index > 0 else 0)
+        return self.parts[part_index][index - start]
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self.parts)
+
+    def __contains__(self, value):
+        return any((value in part) for part in self.parts)
+
+
+def concat_arrays(arrays):
+    """
+    Returns the concatenation of `arrays`.  Adjacent tuples are joined
+    eagerly, since they're already materialized, while lazy arrays are
+    kept as they are.
+    """
+    parts = []
+    for array in arrays:
+        if isinstance(array, ConcatArray):
+            array_parts = array.parts
+        else:
+            array_parts = (array,)
+        for part in array_parts:
+            if parts and isinstance(part, tuple) and isinstance(parts[-1],
+                                                                tuple):
+                parts[-1] += part
+            else:
+                parts.append(tuple(part) if isinstance(part, list) else part)
+
+    parts = [p for p in parts if len(p) > 0]
+    if not parts:
+        return ()
+    if len(parts) == 1:
+        return parts[0]
+    return ConcatArray(parts)
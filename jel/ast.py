@@ -1,10 +1,37 @@
 from __future__ import division, print_function, unicode_literals
+import collections
+
+
+#
+# Fields of each AST class that may hold child nodes (see AST._child_fields),
+# and those that never do, computed on first use
+#
+
+_field_plans = {}
+
+
+def _field_plan(cls):
+    plan = _field_plans.get(cls)
+    if plan is None:
+        children = cls._child_fields
+        if children is None:
+            children = cls._fields
+        data = tuple(f for f in cls._fields if f not in children)
+        plan = _field_plans[cls] = (data, tuple(children))
+    return plan
+
+
+_hash_mask = (1 << 61) - 1
 
 
 class AST(object):
 
     _fields = ()
 
+    # Fields that may hold a child node, a sequence of nodes, or a mapping
+    # of names to nodes (or None).  None means that any field may.
+    _child_fields = None
+
     @property
     def _name(self):
         return type(self).__name__
@@ -19,13 +46,69 @@ class AST(object):
                             (self._name, kwargs.popitem()[0]))
 
     def __eq__(self, other):
-        return ((type(other) is type(self)) and
-                all(getattr(self, field) == getattr(other, field)
-                    for field in self._fields))
+        pending = [(self, other)]
+        while pending:
+            a, b = pending.pop()
+            if a is b:
+                continue
+            if isinstance(a, AST):
+                if type(b) is not type(a):
+                    return False
+                data, children = _field_plan(type(a))
+                for field in data:
+                    if getattr(a, field) != getattr(b, field):
+                        return False
+                for field in children:
+                    pending.append((getattr(a, field), getattr(b, field)))
+            elif isinstance(a, (tuple, list)):
+                if (type(b) is not type(a)) or (len(b) != len(a)):
+                    return False
+                pending.extend(zip(a, b))
+            elif isinstance(a, dict):
+                if type(b) is not type(a):
+                    return False
+                if isinstance(a, collections.OrderedDict):
+                    if list(a) != list(b):
+                        return False
+                elif set(a) != set(b):
+                    return False
+                pending.extend((a[key], b[key]) for key in a)
+            elif a != b:
+                return False
+        return True
 
     def __ne__(self, other):
         return not (self == other)
 
+    def structural_hash(self):
+        """
+        Returns a hash of the type and fields of this node and all its
+        descendants.  Nodes that compare equal have the same structural
+        hash.
+        """
+        result = 0
+        pending = [self]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, AST):
+                cls = type(value)
+                data, children = _field_plan(cls)
+                token = (cls, tuple(getattr(value, f) for f in data))
+                pending.extend(getattr(value, f) for f in children)
+            elif isinstance(value, (tuple, list)):
+                token = (type(value), len(value))
+                pending.extend(value)
+            elif isinstance(value, dict):
+                keys = list(value)
+                if not isinstance(value, collections.OrderedDict):
+                    keys.sort()
+                token = (type(value), tuple(keys))
+                pending.extend(value[key] for key in keys)
+            else:
+                token = value
+            result = ((result * 1000003) ^ hash(token)) & _hash_mask
+        return result
+
     def __repr__(self):
         args = ', '.join('%s=%r' % (f, getattr(self, f)) for f in self._fields)
         return '%s(%s)' % (self._name, args)
@@ -34,71 +117,91 @@ class AST(object):
 class Expr(AST):
 
     _parenthetic = False
+    _shared = False
 
 
 class OrExpr(Expr):
 
     _fields = ('operands',)
+    _child_fields = ('operands',)
 
 
 class AndExpr(Expr):
 
     _fields = ('operands',)
+    _child_fields = ('operands',)
 
 
 class BinaryOpExpr(Expr):
 
     _fields = ('op', 'operands')
+    _child_fields = ('operands',)
 
 
 class UnaryOpExpr(Expr):
 
     _fields = ('op', 'operand')
+    _child_fields = ('operand',)
 
 
 class ComparisonExpr(Expr):
 
     _fields = ('ops', 'operands')
+    _child_fields = ('operands',)
 
 
 class CallExpr(Expr):
 
     _fields = ('target', 'args')
+    _child_fields = ('target', 'args')
 
 
 class SubscriptExpr(Expr):
 
     _fields = ('target', 'value')
+    _child_fields = ('target', 'value')
 
 
 class AttributeExpr(Expr):
 
     _fields = ('target', 'name')
+    _child_fields = ('target',)
 
 
 class ObjectLiteralExpr(Expr):
 
     _fields = ('items',)
+    _child_fields = ('items',)
 
 
 class ArrayLiteralExpr(Expr):
 
     _fields = ('items',)
+    _child_fields = ('items',)
+
+
+class NumberArrayLiteralExpr(Expr):
+
+    _fields = ('values',)
+    _child_fields = ()
 
 
 class StringLiteralExpr(Expr):
 
     _fields = ('value',)
+    _child_fields = ()
 
 
 class NumberLiteralExpr(Expr):
 
     _fields = ('value', 'tag')
+    _child_fields = ()
 
 
 class BooleanLiteralExpr(Expr):
 
     _fields = ('value',)
+    _child_fields = ()
 
 
 class NullLiteralExpr(Expr):
@@ -108,3 +211,4 @@ class NullLiteralExpr(Expr):
 class IdentifierExpr(Expr):
 
     _fields = ('value',)
+    _child_fields = ()
@@ -0,0 +1,305 @@
+from __future__ import division, print_function, unicode_literals
+import numbers
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import opcodes
+from .executor import Executor
+
+
+def _logical_not(value):
+    return numpy.logical_not(value)
+
+
+class _Row(Mapping):
+
+    # Names visible to the scalar executor while it evaluates row `index`:
+    # column values, falling back to the executor's other names
+
+    def __init__(self, columns, names):
+        self.columns = columns
+        self.names = names
+        self.index = 0
+
+    def __getitem__(self, name):
+        if name in self.columns:
+            return self.columns[name][self.index]
+        return self.names[name]
+
+    def __contains__(self, name):
+        return (name in self.columns) or (name in self.names)
+
+    def __iter__(self):
+        for name in self.columns:
+            yield name
+        for name in self.names:
+            if name not in self.columns:
+                yield name
+
+    def __len__(self):
+        return len(set(self.columns) | set(self.names))
+
+
+class BatchExecutor(Executor):
+
+    """
+    Evaluates a compiled expression over many bindings at once.
+
+    `columns` maps names to equal-length sequences (typically NumPy
+    arrays), and the expression is evaluated once per row, with each
+    column name bound to that row's value.  `names` holds bindings shared
+    by all rows.
+
+    If NumPy is available, each op list that contains only arithmetic,
+    comparison, and logical ops is evaluated in a single vectorized pass
+    over whole columns, and the result is a NumPy array.  Other op lists
+    (e.g. ones containing calls, subscripts, or `in`) fall back to
+    evaluation row by row with the scalar Executor.  If any operand of
+    'and', 'or', or a chained comparison (other than the first) needs that
+    fallback, then, as in the scalar Executor, each operand is evaluated
+    only for the rows whose results it might still change.
+    Vectorized evaluation follows NumPy's semantics, so division by zero
+    yields inf or nan rather than an error.  Without NumPy, every
+    expression is evaluated row by row, and the result is a list.
+    """
+
+    scalar_executor_class = Executor
+
+    unary_ops = dict(Executor.unary_ops)
+    unary_ops['not'] = _logical_not
+
+    vectorized_ops = frozenset((
+        'APPLY_TAG',
+        'BINARY_OP',
+        'COMPARE_OP',
+        'LOAD_CONST',
+        'LOAD_NAME',
+        'LOGICAL_AND',
+        'LOGICAL_OR',
+        'UNARY_OP',
+        ))
+
+    # Membership tests have no elementwise equivalent
+    unvectorized_comparisons = ('in', 'not in')
+
+    def __init__(self, columns, names=None, tags=None):
+        super(BatchExecutor, self).__init__(names, tags)
+        self.columns = columns
+        self.num_rows = None
+        for values in columns.values():
+            if self.num_rows is None:
+                self.num_rows = len(values)
+            elif len(values) != self.num_rows:
+                raise ValueError('Columns must all have the same length')
+        if self.num_rows is None:
+            self.num_rows = 0
+
+        cc = self.compiler_class
+        self._vectorized_codes = set(cc.op_codes[name] for name in
+                                     self.vectorized_ops)
+        for names in (cc.specialized_binary_ops,
+                      cc.specialized_comparison_ops,
+                      cc.specialized_unary_ops):
+            for op, name in names.items():
+                if op not in self.unvectorized_comparisons:
+                    self._vectorized_codes.add(cc.op_codes[name])
+        self._compare_op = cc.op_codes['COMPARE_OP']
+        self._unvectorized_comparison_codes = frozenset(
+            cc.comparison_op_codes[op] for op in self.unvectorized_comparisons
+            )
+        self._load_const = cc.op_codes['LOAD_CONST']
+
+        self._vectorizable = {}
+        self._fully_vectorizable = {}
+        self._arrays = {}
+
+    def evaluate(self, code):
+        """
+        Returns the values of `code` for every row, as a NumPy array or
+        (without NumPy) a list
+        """
+        if numpy is None:
+            return self._execute_rows(code)
+        with numpy.errstate(all='ignore'):
+            result = self.execute(code)
+        result = numpy.asarray(result)
+        if result.shape != (self.num_rows,):
+            # The expression doesn't depend on any column
+            result = numpy.array(numpy.broadcast_to(result,
+                                                    (self.num_rows,)))
+        return result
+
+    def execute(self, ops):
+        if self._is_vectorizable(ops):
+            return super(BatchExecutor, self).execute(ops)
+        return self._execute_rows(ops)
+
+    def _is_vectorizable(self, ops):
+        if numpy is None:
+            return False
+        entry = self._vectorizable.get(id(ops))
+        if entry is None or entry[0] is not ops:
+            entry = (ops, all(self._is_vectorizable_op(op) for op in ops))
+            self._vectorizable[id(ops)] = entry
+        return entry[1]
+
+    def _is_vectorizable_op(self, op):
+        code, args = op[0], op[3]
+        if code not in self._vectorized_codes:
+            return False
+        if code == self._compare_op:
+            return not any((c in self._unvectorized_comparison_codes)
+                           for c in args[0])
+        if code == self._load_const:
+            value = args[0]
+            return (isinstance(value, (numbers.Number, type(''))) or
+                    value is None)
+        return True
+
+    def _execute_rows(self, ops):
+        row = _Row(self.columns, self.names)
+        executor = self.scalar_executor_class(row, self.tags)
+        results = []
+        for index in range(self.num_rows):
+            row.index = index
+            results.append(executor.execute(ops))
+
+        if numpy is None:
+            return results
+        if all(isinstance(r, (numbers.Number, numpy.bool_)) for r in results):
+            return numpy.array(results)
+        column = numpy.empty(len(results), dtype=object)
+        for index, value in enumerate(results):
+            column[index] = value
+        return column
+
+    def load_name(self, stack, name):
+        if name in self.columns:
+            array = self._arrays.get(name)
+            if array is None:
+                array = self._arrays[name] = numpy.asarray(self.columns[name])
+            stack.append(array)
+        else:
+            super(BatchExecutor, self).load_name(stack, name)
+
+    def _is_fully_vectorizable(self, ops):
+        # Whether `ops`, including the op lists nested in it, never falls
+        # back to evaluation row by row
+        entry = self._fully_vectorizable.get(id(ops))
+        if entry is None or entry[0] is not ops:
+            nested = []
+
+            def collect(nested_ops, is_expr, num_args):
+                nested.append(nested_ops)
+                return nested_ops
+
+            for op in ops:
+                opcodes.map_nested_code(op, collect)
+            entry = (ops, (self._is_vectorizable(ops) and
+                           all(self._is_fully_vectorizable(o)
+                               for o in nested)))
+            self._fully_vectorizable[id(ops)] = entry
+        return entry[1]
+
+    def compare_op(self, stack, ops, operand_ops):
+        if all(self._is_fully_vectorizable(o) for o in operand_ops[1:]):
+            # Evaluating every operand for every row has no visible effect
+            lhs = self.execute(operand_ops[0])
+            result = True
+            for op, rhs_ops in zip(ops, operand_ops[1:]):
+                rhs = self.execute(rhs_ops)
+                result = numpy.logical_and(
+                    result, self._comparison_ops[op](lhs, rhs))
+                lhs = rhs
+            stack.append(result)
+            return
+
+        # Like the scalar executor, evaluate each operand only for the rows
+        # whose preceding comparisons are all true
+        result = numpy.zeros(self.num_rows, dtype=bool)
+        rows = numpy.arange(self.num_rows)
+        lhs = self._operand(operand_ops[0], rows)
+        for op, rhs_ops in zip(ops, operand_ops[1:]):
+            if not len(rows):
+                break
+            rhs = self._operand(rhs_ops, rows)
+            truth = self._truth(self._comparison_ops[op](lhs, rhs), rows)
+            rows = rows[truth]
+            lhs = rhs[truth]
+        result[rows] = True
+        stack.append(result)
+
+    def logical_and(self, stack, operand_ops):
+        stack.append(self._logical_op(operand_ops, False))
+
+    def logical_or(self, stack, operand_ops):
+        stack.append(self._logical_op(operand_ops, True))
+
+    def _logical_op(self, operand_ops, deciding):
+        if all(self._is_fully_vectorizable(o) for o in operand_ops[1:]):
+            combine = (numpy.logical_or if deciding else numpy.logical_and)
+            result = (not deciding)
+            for o in operand_ops:
+                result = combine(result, self.execute(o))
+            return result
+
+        # Otherwise, each operand is evaluated only for the rows whose
+        # result isn't yet decided (by a false operand for 'and', or a true
+        # one for 'or')
+        result = numpy.empty(self.num_rows, dtype=bool)
+        result.fill(not deciding)
+        rows = numpy.arange(self.num_rows)
+        for ops in operand_ops:
+            if not len(rows):
+                break
+            truth = self._truth(self._operand(ops, rows), rows)
+            result[rows[truth == deciding]] = deciding
+            rows = rows[truth != deciding]
+        return result
+
+    def _operand(self, ops, rows):
+        # Returns the values of `ops` for `rows` (an array of row indices),
+        # evaluated as if the columns held only those rows
+        executor = self
+        if len(rows) < self.num_rows:
+            executor = self._subset(rows)
+        values = executor.execute(ops)
+        return numpy.broadcast_to(numpy.asarray(values), (len(rows),))
+
+    def _subset(self, rows):
+        columns = {}
+        for name, values in self.columns.items():
+            if isinstance(values, numpy.ndarray):
+                columns[name] = values[rows]
+            else:
+                columns[name] = [values[index] for index in rows]
+        executor = type(self)(columns, self.names, self.tags)
+        executor._vectorizable = self._vectorizable
+        executor._fully_vectorizable = self._fully_vectorizable
+        return executor
+
+    @staticmethod
+    def _truth(values, rows):
+        values = numpy.asarray(values)
+        if values.dtype.kind in 'biuf':
+            truth = values.astype(bool)
+        else:
+            truth = numpy.array([bool(v) for v in values.flat], dtype=bool)
+            truth = truth.reshape(values.shape)
+        return numpy.broadcast_to(truth, rows.shape)
+
+
+def evaluate_batch(code, columns, names=None, tags=None):
+    """
+    Evaluates the compiled expression `code` for every row of `columns`.
+    See BatchExecutor.
+    """
+    return BatchExecutor(columns, names, tags).evaluate(code)
@@ -0,0 +1,167 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import sys
+import threading
+
+from . import opcodes
+from .compiler import Compiler
+from .lexer import Lexer
+from .parser import Parser
+
+
+class ParseError(ValueError):
+
+    def __init__(self, msg, lineno=None, lexpos=None):
+        super(ParseError, self).__init__(msg)
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+def code_size(code):
+    """
+    Returns the approximate memory footprint, in bytes, of `code` and
+    every op list nested within it
+    """
+    size = [0]
+    getsizeof = sys.getsizeof
+
+    def count_ops(ops, is_expr=None, num_args=None):
+        size[0] += getsizeof(ops)
+        for op in ops:
+            size[0] += getsizeof(op) + getsizeof(op[3])
+            for arg in op[3]:
+                if not isinstance(arg, tuple):
+                    size[0] += getsizeof(arg)
+            opcodes.map_nested_code(op, count_ops)
+        return ops
+
+    count_ops(code)
+    return size[0]
+
+
+CacheStats = collections.namedtuple('CacheStats', ('hits',
+                                                   'misses',
+                                                   'evictions',
+                                                   'entries',
+                                                   'bytes'))
+
+
+class CompiledCache(object):
+
+    """
+    A thread-safe, least-recently-used cache of compiled code, keyed by
+    source text and compiler options.
+
+    get() returns the cached Code object for a source string, parsing and
+    compiling it on a miss.  The cache holds at most `max_entries` entries
+    and (if `max_bytes` is not None) at most `max_bytes` bytes of source
+    and code, as estimated by code_size.  Least recently used entries are
+    evicted first.  Cached code objects are shared, so callers must not
+    modify them.
+
+    Each thread parses with its own lexer and parser, and compilation
+    happens outside the cache's lock, so a slow compile doesn't delay
+    lookups by other threads.
+    """
+
+    def __init__(self,
+                 max_entries=1000,
+                 max_bytes=None,
+                 lexer_class=Lexer,
+                 parser_class=Parser,
+                 compiler_class=Compiler,
+                 parser_options=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lexer_class = lexer_class
+        self.parser_class = parser_class
+        self.compiler_class = compiler_class
+        self.parser_options = (parser_options or {})
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._bytes = 0
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, source, **compiler_options):
+        """
+        Returns the compiled code for `source`, compiled with
+        `compiler_options`.  Raises ParseError if `source` is invalid.
+        """
+        key = (source, tuple(sorted(compiler_options.items())))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.pop(key)
+                self._entries[key] = entry
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        code = self.compile(source, **compiler_options)
+        size = sys.getsizeof(source) + code_size(code)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Another thread compiled the same source first
+                return entry[0]
+            if (self.max_bytes is None) or (size <= self.max_bytes):
+                self._entries[key] = (code, size)
+                self._bytes += size
+                self._evict()
+        return code
+
+    def _evict(self):
+        entries = self._entries
+        while ((len(entries) > self.max_entries) or
+               ((self.max_bytes is not None) and
+                (self._bytes > self.max_bytes))):
+            size = entries.popitem(last=False)[1][1]
+            self._bytes -= size
+            self._evictions += 1
+
+    def compile(self, source, **compiler_options):
+        """Parses and compiles `source`, bypassing the cache"""
+        parse = getattr(self._local, 'parse', None)
+        if parse is None:
+            parse = self._local.parse = self._make_parser()
+        root = parse(source)
+        if root is None:
+            raise ParseError('Source contains no code')
+        return self.compiler_class(**compiler_options).compile(root)
+
+    def _make_parser(self):
+        def error_logger(msg, token=None, lineno=None, lexpos=None):
+            raise ParseError(msg, lineno, lexpos)
+
+        l = self.lexer_class(error_logger)
+        p = self.parser_class(l.tokens, error_logger, **self.parser_options)
+        lexer = l.build()
+        parser = p.build()
+
+        def parse(source):
+            lexer.lineno = 1
+            return parser.parse(source, lexer=lexer)
+
+        return parse
+
+    def clear(self):
+        """Removes all entries (but doesn't reset the statistics)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Returns a CacheStats describing the cache's use so far"""
+        with self._lock:
+            return CacheStats(self._hits,
+                              self._misses,
+                              self._evictions,
+                              len(self._entries),
+                              self._bytes)
@@ -0,0 +1,396 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import itertools
+import linecache
+import operator
+import sys
+import weakref
+
+from .executor import ExecutionError, Executor, get_attr, get_item
+from .opcodes import Code
+
+
+#
+# Operator functions that can be replaced by the equivalent Python syntax
+#
+
+_binary_syntax = {
+    operator.add: '%s + %s',
+    operator.sub: '%s - %s',
+    operator.mul: '%s * %s',
+    operator.truediv: '%s / %s',
+    operator.mod: '%s %% %s',
+    operator.pow: '%s ** %s',
+    operator.lt: '%s < %s',
+    operator.le: '%s <= %s',
+    operator.gt: '%s > %s',
+    operator.ge: '%s >= %s',
+    operator.ne: '%s != %s',
+    operator.eq: '%s == %s',
+    }
+
+_unary_syntax = {
+    operator.not_: 'not %s',
+    operator.pos: '+%s',
+    operator.neg: '-%s',
+    }
+
+
+# Names of the source files of generated functions, mapped to weak
+# references to the functions.  Each function's source is registered with
+# linecache, so that tracebacks can show it, until the function is
+# collected.
+_source_refs = {}
+
+
+def _register_source(filename, lines, function):
+    def forget(ref):
+        linecache.cache.pop(filename, None)
+        _source_refs.pop(filename, None)
+
+    linecache.cache[filename] = (sum(len(l) for l in lines),
+                                 None,
+                                 lines,
+                                 filename)
+    _source_refs[filename] = weakref.ref(function, forget)
+
+
+def _compiler_flags():
+    # Generated code must use true division, even on Python 2
+    import __future__
+    return __future__.division.compiler_flag
+
+
+class _FunctionBuilder(object):
+
+    # Source, constants, and line locations of one generated function
+
+    def __init__(self):
+        self.lines = []
+        self.locations = {}
+        self.consts = []
+        self._const_names = {}
+        self._temps = itertools.count()
+        self.indent = 1
+        self.block_depth = 0
+
+    def emit(self, line, op=None):
+        self.lines.append('    ' * self.indent + line)
+        if op is not None:
+            # Lines are numbered from 1, and the first line holds the def
+            self.locations[len(self.lines) + 1] = (op[1], op[2])
+
+    def temp(self):
+        return '_t%d' % next(self._temps)
+
+    def const(self, value):
+        key = id(value)
+        if key not in self._const_names:
+            self._const_names[key] = '_k%d' % len(self.consts)
+            self.consts.append(value)
+        return self._const_names[key]
+
+
+class CodeGenerator(object):
+
+    """
+    Translates op lists into Python functions.
+
+    Each op list becomes the source of a Python function, which is compiled
+    once with compile() and cached on the op list's Code object.  The
+    function takes an executor as its first argument (followed by the
+    values that start on the stack), and uses it for name lookup, tags,
+    and other run-time services, so the same function serves every
+    executor of the same class.  Stack values are held in local variables,
+    so ops that only rearrange the stack generate no code.
+
+    Every op generates its own source line, and errors raised by generated
+    code are reported as ExecutionErrors located at the op that raised
+    them, just as Executor reports them.
+
+    Python limits the number of statically nested blocks in a function, so
+    nested op lists that would be emitted more than `max_block_depth`
+    blocks deep are run by the executor instead, as separate functions.
+    """
+
+    max_block_depth = 16
+
+    def __init__(self, executor_class=Executor):
+        self.executor_class = executor_class
+        cc = executor_class.compiler_class
+        self.op_names = cc.op_names
+        self.compiler_class = cc
+
+        self._specialized = {}
+        for names, functions, syntax in (
+                (cc.specialized_binary_ops, executor_class.binary_ops,
+                 _binary_syntax),
+                (cc.specialized_comparison_ops, executor_class.comparison_ops,
+                 _binary_syntax),
+                (cc.specialized_unary_ops, executor_class.unary_ops,
+                 _unary_syntax),
+                ):
+            for op, name in names.items():
+                self._specialized[cc.op_codes[name]] = (functions[op], syntax)
+
+        self._counter = itertools.count()
+
+    def function(self, ops, num_args=0, native_return=False):
+        """
+        Returns the Python function for `ops`, generating it if necessary.
+
+        If `native_return` is true, return ops return from the generated
+        function.  Otherwise, they raise the executor's control exception
+        for returns, so that they can unwind through compound calls.
+        """
+        key = (self.executor_class, num_args, native_return)
+        cache = getattr(ops, 'python_functions', None)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        function = self.generate(ops, num_args, native_return)
+
+        if isinstance(ops, Code):
+            if cache is None:
+                cache = ops.python_functions = {}
+            cache[key] = function
+        return function
+
+    def generate(self, ops, num_args=0, native_return=False):
+        builder = _FunctionBuilder()
+        self.native_return = native_return
+        self.builder = builder
+
+        args = ['_a%d' % i for i in range(num_args)]
+        self.emit_prologue()
+        stack = list(args)
+        self.emit_ops(ops, stack)
+        builder.emit('return %s' % (stack[-1] if stack else 'None'))
+
+        filename = '<generated code %d>' % next(self._counter)
+        lines = ['def _code(%s):' % ', '.join(['_x'] + args)] + builder.lines
+        source = '\n'.join(lines) + '\n'
+
+        namespace = self.namespace()
+        namespace.update(('_k%d' % i, value) for i, value in
+                         enumerate(builder.consts))
+        exec(compile(source, filename, 'exec', _compiler_flags(), True),
+             namespace)
+        del self.builder
+
+        function = self._wrap(namespace['_code'], filename, builder.locations)
+        _register_source(filename, [l + '\n' for l in lines], function)
+        return function
+
+    def namespace(self):
+        return {
+            '_OrderedDict': collections.OrderedDict,
+            '_get_attr': get_attr,
+            '_get_item': get_item,
+            }
+
+    def _wrap(self, function, filename, locations):
+        control_exceptions = self.executor_class.control_exceptions
+
+        def wrapper(executor, *args):
+            try:
+                return function(executor, *args)
+            except control_exceptions:
+                raise
+            except Exception as e:
+                lineno = lexpos = None
+                tb = sys.exc_info()[2]
+                while tb is not None:
+                    if tb.tb_frame.f_code.co_filename == filename:
+                        lineno, lexpos = locations.get(tb.tb_lineno,
+                                                       (lineno, lexpos))
+                    tb = tb.tb_next
+                wrapped = ExecutionError.wrap(e, lineno, lexpos)
+                if wrapped is e:
+                    raise
+                raise wrapped
+
+        wrapper.source_filename = filename
+        return wrapper
+
+    def emit_prologue(self):
+        self.builder.emit('_lookup_name = _x.lookup_name')
+
+    def emit_ops(self, ops, stack):
+        for op in ops:
+            name = self.op_names[op[0]]
+            if op[0] in self._specialized:
+                self.specialized_op(op, stack, *self._specialized[op[0]])
+            else:
+                getattr(self, name.lower())(op, stack, *op[3])
+
+    def emit_expr(self, ops):
+        # Emits code for the nested expression op list `ops`, and returns
+        # the name holding its value
+        if self.builder.block_depth >= self.max_block_depth:
+            temp = self.builder.temp()
+            self.builder.emit('%s = _x.execute(%s)' % (temp, self.const(ops)))
+            return temp
+        stack = []
+        self.emit_ops(ops, stack)
+        return stack.pop()
+
+    def begin_block(self, line, op):
+        self.builder.emit(line, op)
+        self.builder.indent += 1
+        self.builder.block_depth += 1
+
+    def end_block(self):
+        self.builder.indent -= 1
+        self.builder.block_depth -= 1
+
+    def assign(self, op, stack, expr):
+        temp = self.builder.temp()
+        self.builder.emit('%s = %s' % (temp, expr), op)
+        stack.append(temp)
+
+    def const(self, value):
+        return self.builder.const(value)
+
+    def pop(self, stack, count):
+        values = stack[len(stack)-count:]
+        del stack[len(stack)-count:]
+        return values
+
+    def operator_expr(self, function, syntax, operands):
+        if function in syntax:
+            return syntax[function] % operands
+        return '%s(%s)' % (self.const(function), ', '.join(operands))
+
+    def specialized_op(self, op, stack, function, syntax):
+        count = (1 if syntax is _unary_syntax else 2)
+        operands = tuple(self.pop(stack, count))
+        self.assign(op, stack, self.operator_expr(function, syntax, operands))
+
+    #
+    # Op translations
+    #
+
+    def apply_tag(self, op, stack, tag):
+        value = stack.pop()
+        self.assign(op, stack, '_x.convert_tag(%s, %s)' % (value,
+                                                            self.const(tag)))
+
+    def binary_op(self, op, stack, code):
+        operands = tuple(self.pop(stack, 2))
+        function = self.executor_class.binary_ops[
+            self.compiler_class.binary_op_names[code]
+            ]
+        self.assign(op, stack, self.operator_expr(function,
+                                                  _binary_syntax,
+                                                  operands))
+
+    def build_array(self, op, stack, count):
+        items = self.pop(stack, count)
+        self.assign(op, stack, '(%s)' % ''.join(i + ', ' for i in items))
+
+    def build_object(self, op, stack, keys):
+        values = self.pop(stack, len(keys))
+        self.assign(op, stack, '_OrderedDict(zip(%s, (%s)))' %
+                    (self.const(keys), ''.join(v + ', ' for v in values)))
+
+    def call_function(self, op, stack, arg_list):
+        target = stack.pop()
+        self.assign(op, stack, self.call_expr(target, arg_list))
+
+    def call_expr(self, target, arg_list):
+        args = [self.emit_expr(arg) for arg in arg_list]
+        return '%s(%s)' % (target, ', '.join(args))
+
+    def compare_op(self, op, stack, ops, operand_ops):
+        builder = self.builder
+        result = builder.temp()
+        builder.emit('%s = False' % result, op)
+        self.begin_short_circuit(op)
+        lhs = self.emit_expr(operand_ops[0])
+        for code, rhs_ops in zip(ops, operand_ops[1:]):
+            rhs = self.emit_expr(rhs_ops)
+            function = self.executor_class.comparison_ops[
+                self.compiler_class.comparison_op_names[code]
+                ]
+            builder.emit('if not (%s): break' %
+                         self.operator_expr(function,
+                                            _binary_syntax,
+                                            (lhs, rhs)),
+                         op)
+            lhs = rhs
+        builder.emit('%s = True' % result, op)
+        self.end_short_circuit(op)
+        stack.append(result)
+
+    def begin_short_circuit(self, op):
+        # Code emitted between begin_short_circuit and end_short_circuit
+        # can skip the rest with 'break'.  Long chains of operands are
+        # emitted at constant depth, rather than in nested blocks, which
+        # Python limits.
+        self.begin_block('while True:', op)
+
+    def end_short_circuit(self, op):
+        self.builder.emit('break', op)
+        self.end_block()
+
+    def load_attr(self, op, stack, name):
+        target = stack.pop()
+        self.assign(op, stack, '_get_attr(%s, %s)' % (target,
+                                                       self.const(name)))
+
+    def load_const(self, op, stack, value):
+        stack.append(self.const(value))
+
+    def load_name(self, op, stack, name):
+        self.assign(op, stack, '_lookup_name(%s)' % self.const(name))
+
+    def load_subscr(self, op, stack):
+        target, index = self.pop(stack, 2)
+        self.assign(op, stack, '_get_item(%s, %s)' % (target, index))
+
+    def logical_and(self, op, stack, operand_ops):
+        self._logical_op(op, stack, operand_ops, 'if not %s: break', True)
+
+    def logical_or(self, op, stack, operand_ops):
+        self._logical_op(op, stack, operand_ops, 'if %s: break', False)
+
+    def _logical_op(self, op, stack, operand_ops, test, all_value):
+        # Operands are evaluated only until one decides the result, as in
+        # Executor.logical_and and Executor.logical_or
+        builder = self.builder
+        result = builder.temp()
+        builder.emit('%s = %r' % (result, not all_value), op)
+        self.begin_short_circuit(op)
+        for operand in operand_ops:
+            value = self.emit_expr(operand)
+            builder.emit(test % value, op)
+        builder.emit('%s = %r' % (result, all_value), op)
+        self.end_short_circuit(op)
+        stack.append(result)
+
+    def unary_op(self, op, stack, code):
+        operand = stack.pop()
+        function = self.executor_class.unary_ops[
+            self.compiler_class.unary_op_names[code]
+            ]
+        self.assign(op, stack, self.operator_expr(function,
+                                                  _unary_syntax,
+                                                  (operand,)))
+
+
+class PythonExecutor(Executor):
+
+    """
+    Executor that runs op lists as Python functions generated by
+    CodeGenerator, rather than dispatching each op in turn
+    """
+
+    code_generator_class = CodeGenerator
+
+    def __init__(self, *args, **kwargs):
+        super(PythonExecutor, self).__init__(*args, **kwargs)
+        self.code_generator = self.code_generator_class(type(self))
+
+    def execute(self, ops, args=()):
+        return self.code_generator.function(ops, len(args))(self, *args)
@@ -1,16 +1,16 @@
 from __future__ import division, print_function, unicode_literals
-from contextlib import contextmanager
+from functools import partial
 import re
 
-
-def gen_codes(*ops):
-    sorted_ops = tuple(sorted(ops))
-    return sorted_ops, dict((op, code) for code, op in enumerate(sorted_ops))
+from . import ast, opcodes
+from .instrument import count_ops, run_phase
+from .opcodes import Code, gen_codes
 
 
 class Compiler(object):
 
     op_names, op_codes = gen_codes(
+        opcodes.op_names,
         'APPLY_TAG',
         'BINARY_OP',
         'BUILD_ARRAY',
@@ -24,28 +24,75 @@ class Compiler(object):
         'LOGICAL_AND',
         'LOGICAL_OR',
         'UNARY_OP',
-        )
 
-    binary_op_names, binary_op_codes = gen_codes(
-        '+', '-', '*', '/', '%', '**',
+        # Specialized ops (one per operator), emitted in place of
+        # BINARY_OP, UNARY_OP, and non-chained COMPARE_OP when the
+        # compiler is created with specialized_ops=True
+        'BINARY_ADD',
+        'BINARY_DIV',
+        'BINARY_MOD',
+        'BINARY_MUL',
+        'BINARY_POW',
+        'BINARY_SUB',
+        'COMPARE_EQ',
+        'COMPARE_GE',
+        'COMPARE_GT',
+        'COMPARE_IN',
+        'COMPARE_LE',
+        'COMPARE_LT',
+        'COMPARE_NE',
+        'COMPARE_NOT_IN',
+        'UNARY_NEG',
+        'UNARY_NOT',
+        'UNARY_POS',
         )
 
-    unary_op_names, unary_op_codes = gen_codes(
-        'not', '+', '-',
-        )
+    binary_op_names, binary_op_codes = gen_codes(opcodes.binary_op_names)
+
+    unary_op_names, unary_op_codes = gen_codes(opcodes.unary_op_names)
 
     comparison_op_names, comparison_op_codes = gen_codes(
-        '<', '<=', '>', '>=', '!=', '==', 'in', 'not in',
+        opcodes.comparison_op_names
         )
 
+    specialized_binary_ops = {
+        '+': 'BINARY_ADD',
+        '-': 'BINARY_SUB',
+        '*': 'BINARY_MUL',
+        '/': 'BINARY_DIV',
+        '%': 'BINARY_MOD',
+        '**': 'BINARY_POW',
+        }
+
+    specialized_unary_ops = {
+        'not': 'UNARY_NOT',
+        '+': 'UNARY_POS',
+        '-': 'UNARY_NEG',
+        }
+
+    specialized_comparison_ops = {
+        '<': 'COMPARE_LT',
+        '<=': 'COMPARE_LE',
+        '>': 'COMPARE_GT',
+        '>=': 'COMPARE_GE',
+        '!=': 'COMPARE_NE',
+        '==': 'COMPARE_EQ',
+        'in': 'COMPARE_IN',
+        'not in': 'COMPARE_NOT_IN',
+        }
+
     _cc_to_us_re = re.compile(r'(((?<=[a-z])[A-Z])|([A-Z](?![A-Z]|$)))')
 
     @classmethod
     def _cc_to_us(cls, s):
         return cls._cc_to_us_re.sub('_\\1', s).lower().strip('_')
 
-    def __init__(self):
+    def __init__(self, specialized_ops=False, tags=None, instrument=None):
+        self.specialized_ops = specialized_ops
+        self.tags = tags
+        self.instrument = instrument
         self._ops = []
+        self._values = []
         for name, code in self.op_codes.items():
             gen_name = name.lower()
             assert not hasattr(self, gen_name)
@@ -56,78 +103,219 @@ class Compiler(object):
             self._ops[-1].append((code, lineno, lexpos, args))
         return genop
 
+    #
+    # Compilation is driven by an explicit stack of work items, so that the
+    # depth of the AST isn't limited by Python's recursion limit.  Each
+    # node's handler either generates its ops directly or returns a list of
+    # steps, which are executed in order.  A step is either a node, whose
+    # handler is run in turn, or a callable, which is called with no
+    # arguments.  Steps that compile a node into a separate (nested) op
+    # list, as returned by _nested, leave the resulting Code on a value
+    # stack, from which later steps take it with _pop_values.
+    #
+
     def genops(self, node):
-        getattr(self, self._cc_to_us(type(node).__name__))(node)
+        self._run((node,))
+
+    def _run(self, steps):
+        work = list(reversed(steps))
+        handlers = {}
+        while work:
+            item = work.pop()
+            if isinstance(item, ast.AST):
+                node_type = type(item)
+                handler = handlers.get(node_type)
+                if handler is None:
+                    handler = handlers[node_type] = getattr(
+                        self,
+                        self._cc_to_us(node_type.__name__),
+                        )
+                steps = handler(item)
+                if steps:
+                    work.extend(reversed(steps))
+            else:
+                item()
+
+    def _begin_op_list(self):
+        self._ops.append([])
+
+    def _end_op_list(self):
+        self._values.append(Code(self._ops.pop()))
+
+    def _nested(self, node):
+        return [self._begin_op_list, node, self._end_op_list]
 
-    def _new_op_list(self):
-        @contextmanager
-        def op_list():
-            self._ops.append([])
-            yield self._ops[-1]
-            self._ops.pop()
-        return op_list()
+    def _nested_all(self, nodes):
+        steps = []
+        for node in nodes:
+            steps += self._nested(node)
+        return steps
+
+    def _pop_values(self, count):
+        values = self._values
+        start = len(values) - count
+        popped = tuple(values[start:])
+        del values[start:]
+        return popped
+
+    def _reset(self):
+        # Discards the state of a compilation that raised an exception
+        del self._ops[:]
+        del self._values[:]
 
     def compile(self, root):
-        with self._new_op_list() as ops:
-            self.genops(root)
-        return tuple(ops)
+        if (self.instrument is not None) and (not self._ops):
+            return run_phase(self.instrument,
+                             'compile',
+                             (lambda: self._compile(root)),
+                             count_ops)
+        return self._compile(root)
+
+    def _compile(self, root):
+        outermost = not self._ops
+        try:
+            self._run(self._nested(root))
+        except BaseException:
+            if outermost:
+                self._reset()
+            raise
+        code = self._values.pop()
+        if outermost:
+            # Verify the stack usage of the complete code object, recording
+            # the maximum depth of each op list
+            opcodes.verify_stack(code, isinstance(root, ast.Expr))
+        return code
 
     def or_expr(self, node):
-        operand_ops = tuple(self.compile(o) for o in node.operands)
-        self.logical_or(node.lineno, node.lexpos, operand_ops)
+        return self._nested_all(node.operands) + [
+            partial(self._logical_op, self.logical_or, node)
+            ]
 
     def and_expr(self, node):
-        operand_ops = tuple(self.compile(o) for o in node.operands)
-        self.logical_and(node.lineno, node.lexpos, operand_ops)
+        return self._nested_all(node.operands) + [
+            partial(self._logical_op, self.logical_and, node)
+            ]
+
+    def _logical_op(self, genop, node):
+        genop(node.lineno,
+              node.lexpos,
+              self._pop_values(len(node.operands)))
 
     def binary_op_expr(self, node):
-        self.genops(node.operands[0])
-        self.genops(node.operands[1])
-        self.binary_op(node.lineno, node.lexpos, self.binary_op_codes[node.op])
+        return [
+            node.operands[0],
+            node.operands[1],
+            partial(self._binary_op, node.lineno, node.lexpos, node.op),
+            ]
+
+    def _binary_op(self, lineno, lexpos, op):
+        if self.specialized_ops:
+            genop = getattr(self, self.specialized_binary_ops[op].lower())
+            genop(lineno, lexpos)
+        else:
+            self.binary_op(lineno, lexpos, self.binary_op_codes[op])
 
     def unary_op_expr(self, node):
-        self.genops(node.operand)
-        self.unary_op(node.lineno, node.lexpos, self.unary_op_codes[node.op])
+        return [node.operand, partial(self._unary_op, node)]
+
+    def _unary_op(self, node):
+        if self.specialized_ops:
+            genop = getattr(self, self.specialized_unary_ops[node.op].lower())
+            genop(node.lineno, node.lexpos)
+        else:
+            self.unary_op(node.lineno,
+                          node.lexpos,
+                          self.unary_op_codes[node.op])
 
     def comparison_expr(self, node):
+        if self.specialized_ops and len(node.ops) == 1:
+            op = self.specialized_comparison_ops[node.ops[0]]
+            return [
+                node.operands[0],
+                node.operands[1],
+                partial(getattr(self, op.lower()),
+                        node.lineno[0],
+                        node.lexpos[0]),
+                ]
+
+        return self._nested_all(node.operands) + [
+            partial(self._compare_op, node)
+            ]
+
+    def _compare_op(self, node):
         ops = tuple(self.comparison_op_codes[o] for o in node.ops)
-        operand_ops = tuple(self.compile(o) for o in node.operands)
+        operand_ops = self._pop_values(len(node.operands))
         self.compare_op(node.lineno, node.lexpos, ops, operand_ops)
 
     def call_expr(self, node):
-        self.genops(node.target)
-        self.call_function(node.lineno,
-                           node.lexpos,
-                           self.compile_arg_list(node))
+        return ([node.target] +
+                self.compile_arg_list(node) +
+                [partial(self._call, self.call_function, node)])
+
+    def _call(self, genop, node):
+        genop(node.lineno, node.lexpos, self._values.pop())
 
     def compile_arg_list(self, node):
-        return tuple(self.compile(arg) for arg in node.args)
+        """
+        Returns steps that compile the arguments of `node`, leaving the
+        argument list on the value stack
+        """
+        return self._nested_all(node.args) + [
+            partial(self._push_arg_list, len(node.args))
+            ]
+
+    def _push_arg_list(self, count):
+        self._values.append(self._pop_values(count))
 
     def subscript_expr(self, node):
-        self.genops(node.target)
-        self.genops(node.value)
-        self.load_subscr(node.lineno, node.lexpos)
+        return [
+            node.target,
+            node.value,
+            partial(self.load_subscr, node.lineno, node.lexpos),
+            ]
 
     def attribute_expr(self, node):
-        self.genops(node.target)
-        self.load_attr(node.lineno, node.lexpos, node.name)
+        return [
+            node.target,
+            partial(self.load_attr, node.lineno, node.lexpos, node.name),
+            ]
 
     def object_literal_expr(self, node):
-        for value in node.items.values():
-            self.genops(value)
-        self.build_object(node.lineno, node.lexpos, tuple(node.items.keys()))
+        return list(node.items.values()) + [
+            partial(self.build_object,
+                    node.lineno,
+                    node.lexpos,
+                    tuple(node.items.keys())),
+            ]
 
     def array_literal_expr(self, node):
-        for item in node.items:
-            self.genops(item)
-        self.build_array(node.lineno, node.lexpos, len(node.items))
+        return list(node.items) + [
+            partial(self.build_array,
+                    node.lineno,
+                    node.lexpos,
+                    len(node.items)),
+            ]
+
+    def number_array_literal_expr(self, node):
+        self.load_const(node.lineno, node.lexpos, node.values)
 
     def string_literal_expr(self, node):
         self.load_const(node.lineno, node.lexpos, node.value)
 
     def number_literal_expr(self, node):
-        self.load_const(node.lineno, node.lexpos, float(node.value))
-        if node.tag is not None:
+        try:
+            value = float(node.value)
+        except OverflowError:
+            # Integer literal too large for a float
+            value = float('inf')
+        if node.tag is None:
+            self.load_const(node.lineno, node.lexpos, value)
+        elif (self.tags is not None) and (node.tag in self.tags):
+            self.load_const(node.lineno,
+                            node.lexpos,
+                            self.tags.convert(value, node.tag))
+        else:
+            self.load_const(node.lineno, node.lexpos, value)
             self.apply_tag(node.lineno, node.lexpos, node.tag)
 
     def boolean_literal_expr(self, node):
@@ -0,0 +1,239 @@
+from __future__ import division, print_function, unicode_literals
+import abc
+import collections
+import operator
+
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
+
+from .compiler import Compiler
+
+
+class ExecutionError(Exception):
+
+    def __init__(self, msg, lineno=None, lexpos=None):
+        super(ExecutionError, self).__init__(msg)
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    @classmethod
+    def wrap(cls, e, lineno, lexpos):
+        """
+        Returns `e` as an ExecutionError located at lineno and lexpos,
+        unless it already has a location
+        """
+        if isinstance(e, cls):
+            if e.lineno is None:
+                e.lineno, e.lexpos = lineno, lexpos
+            return e
+        return cls('%s: %s' % (type(e).__name__, e), lineno, lexpos)
+
+
+class HostObject(abc.ABCMeta(str('HostObject'), (object,), {})):
+
+    """
+    Abstract base class for host types whose attributes JEL code can
+    access.  Register a type with HostObject.register to expose its public
+    attributes (those whose names don't start with an underscore).  Other
+    objects, apart from Mappings, don't support attribute access.
+    """
+
+    __slots__ = ()
+
+
+def check_attr_access(target, name):
+    """
+    Raises an error unless `target`, which isn't a Mapping, exposes
+    attribute `name`
+    """
+    if not isinstance(target, HostObject):
+        raise TypeError("'%s' object does not support attribute access" %
+                        type(target).__name__)
+    if name.startswith('_'):
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (type(target).__name__, name))
+
+
+def get_attr(target, name):
+    if isinstance(target, Mapping):
+        return target[name]
+    check_attr_access(target, name)
+    return getattr(target, name)
+
+
+def get_item(target, index):
+    if (isinstance(index, float) and
+        isinstance(target, Sequence)):
+        index = int(index)
+    return target[index]
+
+
+class Executor(object):
+
+    """
+    Reference executor for op lists produced by Compiler.compile.
+
+    Ops are dispatched through a table indexed by op code.  Ops from the
+    specialized instruction set (Compiler(specialized_ops=True)) are
+    handled with a single dispatch, while the generic BINARY_OP, UNARY_OP,
+    and COMPARE_OP ops perform a second lookup on their operator code.
+    """
+
+    compiler_class = Compiler
+
+    # Exceptions used for control flow, which pass through execute
+    # unchanged
+    control_exceptions = ()
+
+    binary_ops = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+        '%': operator.mod,
+        '**': operator.pow,
+        }
+
+    unary_ops = {
+        'not': operator.not_,
+        '+': operator.pos,
+        '-': operator.neg,
+        }
+
+    comparison_ops = {
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+        '!=': operator.ne,
+        '==': operator.eq,
+        'in': (lambda a, b: a in b),
+        'not in': (lambda a, b: a not in b),
+        }
+
+    def __init__(self, names=None, tags=None):
+        self.names = ({} if names is None else names)
+        self.tags = ({} if tags is None else tags)
+
+        cc = self.compiler_class
+        self._dispatch = [None] * len(cc.op_names)
+        for name, code in cc.op_codes.items():
+            self._dispatch[code] = getattr(self, name.lower(), None)
+
+        self._binary_ops = tuple(self.binary_ops[op]
+                                 for op in cc.binary_op_names)
+        self._unary_ops = tuple(self.unary_ops[op]
+                                for op in cc.unary_op_names)
+        self._comparison_ops = tuple(self.comparison_ops[op]
+                                     for op in cc.comparison_op_names)
+
+        for specializations, functions in (
+                (cc.specialized_binary_ops, self.binary_ops),
+                (cc.specialized_comparison_ops, self.comparison_ops),
+                ):
+            for op, name in specializations.items():
+                self._dispatch[cc.op_codes[name]] = \
+                    self._make_binary_handler(functions[op])
+
+        for op, name in cc.specialized_unary_ops.items():
+            self._dispatch[cc.op_codes[name]] = \
+                self._make_unary_handler(self.unary_ops[op])
+
+    @staticmethod
+    def _make_binary_handler(func):
+        def handler(stack):
+            rhs = stack.pop()
+            stack[-1] = func(stack[-1], rhs)
+        return handler
+
+    @staticmethod
+    def _make_unary_handler(func):
+        def handler(stack):
+            stack[-1] = func(stack[-1])
+        return handler
+
+    def execute(self, ops, args=()):
+        """
+        Executes `ops`, starting with `args` on the stack, and returns the
+        value left on the stack (or None, if the stack is empty)
+        """
+        stack = list(args)
+        dispatch = self._dispatch
+        for code, lineno, lexpos, args in ops:
+            try:
+                dispatch[code](stack, *args)
+            except self.control_exceptions:
+                raise
+            except Exception as e:
+                wrapped = ExecutionError.wrap(e, lineno, lexpos)
+                if wrapped is e:
+                    raise
+                raise wrapped
+        return (stack.pop() if stack else None)
+
+    def apply_tag(self, stack, tag):
+        stack[-1] = self.convert_tag(stack[-1], tag)
+
+    def convert_tag(self, value, tag):
+        if tag not in self.tags:
+            raise ExecutionError('Unknown tag: %r' % str(tag))
+        return self.tags[tag](value)
+
+    def binary_op(self, stack, op):
+        rhs = stack.pop()
+        stack[-1] = self._binary_ops[op](stack[-1], rhs)
+
+    def build_array(self, stack, count):
+        start = len(stack) - count
+        items = tuple(stack[start:])
+        del stack[start:]
+        stack.append(items)
+
+    def build_object(self, stack, keys):
+        start = len(stack) - len(keys)
+        items = collections.OrderedDict(zip(keys, stack[start:]))
+        del stack[start:]
+        stack.append(items)
+
+    def call_function(self, stack, arg_list):
+        args = tuple(self.execute(arg) for arg in arg_list)
+        stack[-1] = stack[-1](*args)
+
+    def compare_op(self, stack, ops, operand_ops):
+        lhs = self.execute(operand_ops[0])
+        for op, rhs_ops in zip(ops, operand_ops[1:]):
+            rhs = self.execute(rhs_ops)
+            if not self._comparison_ops[op](lhs, rhs):
+                stack.append(False)
+                return
+            lhs = rhs
+        stack.append(True)
+
+    def load_attr(self, stack, name):
+        stack[-1] = get_attr(stack[-1], name)
+
+    def load_const(self, stack, value):
+        stack.append(value)
+
+    def load_name(self, stack, name):
+        stack.append(self.lookup_name(name))
+
+    def lookup_name(self, name):
+        if name not in self.names:
+            raise ExecutionError('Undefined name: %r' % str(name))
+        return self.names[name]
+
+    def load_subscr(self, stack):
+        index = stack.pop()
+        stack[-1] = get_item(stack[-1], index)
+
+    def logical_and(self, stack, operand_ops):
+        stack.append(all(self.execute(o) for o in operand_ops))
+
+    def logical_or(self, stack, operand_ops):
+        stack.append(any(self.execute(o) for o in operand_ops))
+
+    def unary_op(self, stack, op):
+        stack[-1] = self._unary_ops[op](stack[-1])
@@ -0,0 +1,216 @@
+from __future__ import division, print_function, unicode_literals
+import abc
+import collections
+import operator
+import weakref
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from .executor import ExecutionError, check_attr_access
+from .opcodes import Code
+
+try:
+    _abc_cache_token = abc.get_cache_token
+except AttributeError:
+    # Python 2
+    def _abc_cache_token():
+        return abc.ABCMeta._abc_invalidation_counter
+
+
+class InlineCache(object):
+
+    """
+    The inline cache of a single op.  `value` (e.g. a function that gets an
+    attribute of objects of one type) was resolved for `key` (e.g. that
+    type), and remains valid as long as `token` is unchanged.
+    """
+
+    __slots__ = ('op_name', 'key', 'token', 'value', 'hits', 'misses',
+                 'invalidations', '__weakref__')
+
+    def __init__(self, op_name):
+        self.op_name = op_name
+        self.key = self.token = self.value = None
+        self.hits = self.misses = self.invalidations = 0
+
+    def fill(self, key, token, value):
+        if self.key is None:
+            self.misses += 1
+        elif (key == self.key) and (token != self.token):
+            self.invalidations += 1
+        else:
+            self.misses += 1
+        self.key = key
+        self.token = token
+        self.value = value
+        return value
+
+
+CacheStats = collections.namedtuple('CacheStats', ('hits',
+                                                   'misses',
+                                                   'invalidations'))
+
+
+def attr_getter(target, name):
+    """
+    Returns a function that gets attribute `name` of objects like `target`,
+    as jel.executor.get_attr does
+    """
+    if isinstance(target, Mapping):
+        return operator.itemgetter(name)
+    check_attr_access(target, name)
+    return operator.attrgetter(str(name))
+
+
+class InlineCacheMixin(object):
+
+    """
+    Mixin for Executor classes that gives each execution of a cached op
+    (see `cached_ops`) an inline cache, which remembers how the op was
+    performed the last time it ran, so that the work can be skipped if the
+    op sees the same kind of value again.  For example, LOAD_ATTR caches a
+    function that gets the attribute from objects of the target's type,
+    saving the check for a Mapping target.
+
+    Each op list gets its caches the first time it's executed by the
+    executor.  If the op list is a Code object, they're stored on it, so
+    they live only as long as it does (the executor holds them weakly).
+    A cache that depends on whether a type is registered with an abstract
+    base class (such as Mapping) is invalidated when any abstract base
+    class registration changes.  Hit, miss, and invalidation counts are
+    available from cache_stats.
+
+    The mixin replaces Executor.execute, so executors that don't dispatch
+    ops (e.g. PythonExecutor) gain nothing from it.
+    """
+
+    cached_ops = ('LOAD_ATTR',)
+
+    def __init__(self, *args, **kwargs):
+        super(InlineCacheMixin, self).__init__(*args, **kwargs)
+        op_codes = self.compiler_class.op_codes
+        self._cached_dispatch = list(self._dispatch)
+        for name in self.cached_ops:
+            if name in op_codes:
+                self._cached_dispatch[op_codes[name]] = getattr(
+                    self,
+                    'cached_' + name.lower(),
+                    )
+        self.clear_caches()
+
+    def clear_caches(self):
+        self.inline_caches = weakref.WeakSet()
+        # Op lists key their steps by a weak reference to this object,
+        # which dies with the executor (or when the caches are cleared)
+        self._cache_owner = _CacheOwner()
+        self._cache_key = weakref.ref(self._cache_owner)
+
+    def cache_stats(self):
+        """
+        Returns a dict mapping the name of each cached op to a CacheStats
+        holding the total counts of its caches (for op lists that are
+        still alive)
+        """
+        totals = {}
+        for cache in self.inline_caches:
+            counts = totals.setdefault(cache.op_name, [0, 0, 0])
+            counts[0] += cache.hits
+            counts[1] += cache.misses
+            counts[2] += cache.invalidations
+        return dict((name, CacheStats(*counts)) for name, counts in
+                    totals.items())
+
+    def prepare(self, ops):
+        """
+        Returns a copy of `ops` in which the args of each cached op are
+        preceded by its cache.  The copy mustn't refer to the executor,
+        since the op list keeps it.
+        """
+        prepared = getattr(ops, 'inline_cache_steps', None)
+        if prepared is not None:
+            steps = prepared.get(self._cache_key)
+            if steps is not None:
+                return steps
+
+        op_names = self.compiler_class.op_names
+        dispatch = self._dispatch
+        cached_dispatch = self._cached_dispatch
+        steps = []
+        for op in ops:
+            code = op[0]
+            if cached_dispatch[code] is dispatch[code]:
+                steps.append(op)
+            else:
+                cache = InlineCache(op_names[code])
+                self.inline_caches.add(cache)
+                steps.append(op[:3] + ((cache,) + op[3],))
+        steps = tuple(steps)
+
+        if isinstance(ops, Code):
+            if prepared is None:
+                prepared = ops.inline_cache_steps = {}
+            else:
+                # Drop the steps of executors that have died
+                for key in [k for k in prepared if k() is None]:
+                    del prepared[key]
+            prepared[self._cache_key] = steps
+        return steps
+
+    def execute(self, ops, args=()):
+        prepared = getattr(ops, 'inline_cache_steps', None)
+        steps = (prepared.get(self._cache_key) if prepared is not None
+                 else None)
+        if steps is None:
+            steps = self.prepare(ops)
+        stack = list(args)
+        dispatch = self._cached_dispatch
+        for code, lineno, lexpos, args in steps:
+            try:
+                dispatch[code](stack, *args)
+            except self.control_exceptions:
+                raise
+            except Exception as e:
+                wrapped = ExecutionError.wrap(e, lineno, lexpos)
+                if wrapped is e:
+                    raise
+                raise wrapped
+        return (stack.pop() if stack else None)
+
+    #
+    # Cached op handlers
+    #
+
+    def cached_load_attr(self, stack, cache, name):
+        target = stack[-1]
+        getter = cache.value
+        token = _abc_cache_token()
+        if (type(target) is cache.key) and (token == cache.token):
+            cache.hits += 1
+        else:
+            getter = cache.fill(type(target), token, attr_getter(target,
+                                                                  name))
+        stack[-1] = getter(target)
+
+
+class _CacheOwner(object):
+
+    __slots__ = ('__weakref__',)
+
+
+_caching_classes = {}
+
+
+def caching_executor_class(executor_class, mixin_class=InlineCacheMixin):
+    """Returns a subclass of `executor_class` that uses `mixin_class`"""
+    key = (executor_class, mixin_class)
+    cls = _caching_classes.get(key)
+    if cls is None:
+        cls = _caching_classes[key] = type(
+            str('Caching' + executor_class.__name__),
+            (mixin_class, executor_class),
+            {},
+            )
+    return cls
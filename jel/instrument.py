@@ -0,0 +1,155 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from . import ast, opcodes
+
+
+#
+# Wall time and size of one run of a pipeline phase.  `count` is the number
+# of tokens (for 'lex'), AST nodes ('parse'), or ops ('compile') produced.
+# `peak_bytes` is the peak memory allocated during the phase, or None if
+# tracemalloc isn't tracing.
+#
+
+Measurement = collections.namedtuple('Measurement', ('phase',
+                                                     'seconds',
+                                                     'count',
+                                                     'peak_bytes'))
+
+
+def _can_trace():
+    # Measuring the peak of a single phase requires tracemalloc.reset_peak
+    # (Python 3.9+)
+    return ((tracemalloc is not None) and
+            tracemalloc.is_tracing() and
+            hasattr(tracemalloc, 'reset_peak'))
+
+
+def run_phase(instrument, phase, func, count):
+    """
+    Calls func() and reports a Measurement of it, with count(result) as
+    its count, to the callable `instrument`.  Returns func's result.
+    """
+    tracing = _can_trace()
+    if tracing:
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    start = timeit.default_timer()
+    result = func()
+    seconds = timeit.default_timer() - start
+
+    peak_bytes = None
+    if tracing:
+        peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - start_bytes)
+    instrument(Measurement(phase, seconds, count(result), peak_bytes))
+    return result
+
+
+class _TokenStream(object):
+
+    # Replays a list of tokens to the parser
+
+    def __init__(self, tokens):
+        self._tokens = iter(tokens)
+
+    def input(self, text):
+        pass
+
+    def token(self):
+        return next(self._tokens, None)
+
+
+def _lex(lexer, text):
+    lexer.input(text)
+    return list(iter(lexer.token, None))
+
+
+def parse(parser, lexer, text, instrument=None):
+    """
+    Parses `text`.  If `instrument` is not None, lexing and parsing are
+    run (and reported to it) as separate phases.
+    """
+    if instrument is None:
+        return parser.parse(text, lexer=lexer)
+    tokens = run_phase(instrument, 'lex', (lambda: _lex(lexer, text)), len)
+    return run_phase(instrument,
+                     'parse',
+                     (lambda: parser.parse(lexer=_TokenStream(tokens))),
+                     count_nodes)
+
+
+def count_nodes(root):
+    """Returns the number of AST nodes in the tree rooted at `root`"""
+    count = 0
+    pending = [root]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, ast.AST):
+            count += 1
+            pending.extend(getattr(value, f) for f in value._fields)
+        elif isinstance(value, (tuple, list)):
+            pending.extend(value)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+    return count
+
+
+def count_ops(code):
+    """Returns the number of ops in `code` and every op list nested in it"""
+    count = [0]
+
+    def count_nested(ops, is_expr=None, num_args=None):
+        count[0] += len(ops)
+        for op in ops:
+            opcodes.map_nested_code(op, count_nested)
+        return ops
+
+    count_nested(code)
+    return count[0]
+
+
+class PipelineStats(object):
+
+    """
+    An instrument callback that accumulates Measurements: the number of
+    runs, total time, and total count of each phase, and the largest peak
+    allocation seen (if known)
+    """
+
+    phases = ('lex', 'parse', 'compile')
+
+    def __init__(self):
+        self.runs = collections.Counter()
+        self.seconds = collections.defaultdict(float)
+        self.counts = collections.Counter()
+        self.peak_bytes = {}
+
+    def __call__(self, measurement):
+        phase = measurement.phase
+        self.runs[phase] += 1
+        self.seconds[phase] += measurement.seconds
+        self.counts[phase] += measurement.count
+        if measurement.peak_bytes is not None:
+            self.peak_bytes[phase] = max(self.peak_bytes.get(phase, 0),
+                                         measurement.peak_bytes)
+
+    def report(self):
+        lines = ['%-8s %6s %12s %10s %12s' % ('phase', 'runs', 'time (s)',
+                                              'count', 'peak bytes')]
+        for phase in self.phases:
+            if self.runs[phase]:
+                peak = self.peak_bytes.get(phase)
+                lines.append('%-8s %6d %12.6f %10d %12s' %
+                             (phase,
+                              self.runs[phase],
+                              self.seconds[phase],
+                              self.counts[phase],
+                              ('-' if peak is None else peak)))
+        return '\n'.join(lines)
@@ -4,16 +4,6 @@ from ply import lex
 from ply.lex import TOKEN
 
 
-class MatchString(type('')):
-
-    def __new__(cls, value, groupdict):
-        return super(MatchString, cls).__new__(cls, value)
-
-    def __init__(self, value, groupdict):
-        super(MatchString, self).__init__()
-        self.__dict__.update(groupdict)
-
-
 class Lexer(object):
 
     def __init__(self, error_logger):
@@ -146,10 +136,14 @@ class Lexer(object):
         r')(?P<t_NUMBER_tag>[a-zA-Z][a-zA-Z0-9]*)?'  # Tag
         )
     def t_NUMBER(self, t):
-        groupdict = dict((k.split('_')[2], v) for (k, v) in
-                         t.lexer.lexmatch.groupdict('').items()
-                         if k.startswith('t_NUMBER_'))
-        t.value = MatchString(t.value, groupdict)
+        # Numbers can be very numerous (e.g. in large array literals), so
+        # rather than building a dict of all the match groups, store just
+        # the numeric text, the tag (or None), and whether the number is an
+        # integer as attributes of the token
+        m = t.lexer.lexmatch
+        t.number, t.tag = m.group('t_NUMBER_value', 't_NUMBER_tag')
+        t.integer = ((m.start('t_NUMBER_frac') < 0) and
+                     (m.start('t_NUMBER_exp') < 0))
         return t
         
     def t_IDENTIFIER(self, t):
@@ -0,0 +1,379 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+
+
+#
+# Opcode numbers are part of the compiled format and are shared by the JEL
+# and MWEL compilers, so that a single executor can use one dispatch table
+# for both.  Each op's number is its index in the table that defines it.
+#
+# New entries must only ever be appended to these tables.  If an existing
+# entry must be removed or renumbered, VERSION must be incremented, so that
+# code compiled against the old numbering is rejected by check_version.
+#
+
+VERSION = 1
+
+
+op_names = (
+    # JEL
+    'APPLY_TAG',
+    'BINARY_OP',
+    'BUILD_ARRAY',
+    'BUILD_OBJECT',
+    'CALL_FUNCTION',
+    'COMPARE_OP',
+    'LOAD_ATTR',
+    'LOAD_CONST',
+    'LOAD_NAME',
+    'LOAD_SUBSCR',
+    'LOGICAL_AND',
+    'LOGICAL_OR',
+    'UNARY_OP',
+
+    # MWEL
+    'BUILD_RANGE_ARRAY',
+    'CALL_COMPOUND',
+    'CALL_SIMPLE',
+    'CONCAT_ARRAYS',
+    'DUP_TOP',
+    'DUP_TOP_TWO',
+    'INIT_LOCAL',
+    'LOAD_ATTR_REF',
+    'LOAD_CLOSURE',
+    'LOAD_GLOBAL',
+    'LOAD_LOCAL',
+    'LOAD_NONLOCAL',
+    'MAKE_FUNCTION',
+    'RETURN_VALUE',
+    'ROT_THREE',
+    'ROT_TWO',
+    'STORE_ATTR',
+    'STORE_CLOSURE',
+    'STORE_GLOBAL',
+    'STORE_LOCAL',
+    'STORE_NONLOCAL',
+    'STORE_SUBSCR',
+
+    # Specialized operators
+    'BINARY_ADD',
+    'BINARY_DIV',
+    'BINARY_MOD',
+    'BINARY_MUL',
+    'BINARY_POW',
+    'BINARY_SUB',
+    'COMPARE_EQ',
+    'COMPARE_GE',
+    'COMPARE_GT',
+    'COMPARE_IN',
+    'COMPARE_LE',
+    'COMPARE_LT',
+    'COMPARE_NE',
+    'COMPARE_NOT_IN',
+    'UNARY_NEG',
+    'UNARY_NOT',
+    'UNARY_POS',
+
+    # Peephole optimizer
+    'DUP_STORE_CLOSURE',
+    'DUP_STORE_GLOBAL',
+    'DUP_STORE_LOCAL',
+    'DUP_STORE_NONLOCAL',
+    'RETURN_CONST',
+
+    # Linker
+    'DUP_STORE_GLOBAL_SLOT',
+    'LOAD_GLOBAL_SLOT',
+    'STORE_GLOBAL_SLOT',
+
+    # Inline control flow
+    'IF_ELSE',
+    'WHILE_LOOP',
+    )
+
+binary_op_names = ('+', '-', '*', '/', '%', '**')
+
+unary_op_names = ('not', '+', '-')
+
+comparison_op_names = ('<', '<=', '>', '>=', '!=', '==', 'in', 'not in')
+
+
+def gen_codes(names, *selected):
+    """
+    Returns `names` along with a dict mapping each name in `selected`
+    (or every name, if none are selected) to its index in `names`
+    """
+    codes = dict((name, code) for code, name in enumerate(names))
+    if selected:
+        codes = dict((name, codes[name]) for name in selected)
+    return names, codes
+
+
+class Code(tuple):
+
+    """
+    An op list, stamped with the version of the opcode numbering it was
+    compiled against
+    """
+
+    def __new__(cls, ops=(), version=VERSION):
+        self = super(Code, cls).__new__(cls, ops)
+        self.version = version
+        return self
+
+
+def check_version(code):
+    version = getattr(code, 'version', None)
+    if version != VERSION:
+        raise ValueError('Code uses opcode version %r (expected %r)' %
+                         (version, VERSION))
+
+
+def _first_arg(args):
+    return args[0]
+
+
+def _num_keys(args):
+    return len(args[0])
+
+
+#
+# Stack effect of each op, as a (pops, pushes) pair.  A callable entry
+# computes the count from the op's arguments.  Nested op lists (e.g. the
+# operands of LOGICAL_AND or the body of MAKE_FUNCTION) are evaluated on
+# their own stacks, so they don't contribute to the effect of the op that
+# contains them.
+#
+
+stack_effects = {
+    'APPLY_TAG': (1, 1),
+    'BINARY_OP': (2, 1),
+    'BUILD_ARRAY': (_first_arg, 1),
+    'BUILD_OBJECT': (_num_keys, 1),
+    'CALL_FUNCTION': (1, 1),
+    'COMPARE_OP': (0, 1),
+    'LOAD_ATTR': (1, 1),
+    'LOAD_CONST': (0, 1),
+    'LOAD_NAME': (0, 1),
+    'LOAD_SUBSCR': (2, 1),
+    'LOGICAL_AND': (0, 1),
+    'LOGICAL_OR': (0, 1),
+    'UNARY_OP': (1, 1),
+
+    'BUILD_RANGE_ARRAY': (3, 1),
+    'CALL_COMPOUND': (0, 0),
+    'CALL_SIMPLE': (1, 0),
+    'CONCAT_ARRAYS': (_first_arg, 1),
+    'DUP_TOP': (1, 2),
+    'DUP_TOP_TWO': (2, 4),
+    'INIT_LOCAL': (1, 0),
+    'LOAD_ATTR_REF': (1, 1),
+    'LOAD_CLOSURE': (0, 1),
+    'LOAD_GLOBAL': (0, 1),
+    'LOAD_LOCAL': (0, 1),
+    'LOAD_NONLOCAL': (0, 1),
+    'MAKE_FUNCTION': (0, 1),
+    'RETURN_VALUE': (1, 0),
+    'ROT_THREE': (3, 3),
+    'ROT_TWO': (2, 2),
+    'STORE_ATTR': (2, 0),
+    'STORE_CLOSURE': (1, 0),
+    'STORE_GLOBAL': (1, 0),
+    'STORE_LOCAL': (1, 0),
+    'STORE_NONLOCAL': (1, 0),
+    'STORE_SUBSCR': (3, 0),
+
+    'DUP_STORE_CLOSURE': (1, 1),
+    'DUP_STORE_GLOBAL': (1, 1),
+    'DUP_STORE_LOCAL': (1, 1),
+    'DUP_STORE_NONLOCAL': (1, 1),
+    'RETURN_CONST': (0, 0),
+
+    'DUP_STORE_GLOBAL_SLOT': (1, 1),
+    'LOAD_GLOBAL_SLOT': (0, 1),
+    'STORE_GLOBAL_SLOT': (1, 0),
+
+    'IF_ELSE': (0, 0),
+    'WHILE_LOOP': (0, 0),
+    }
+
+for _name in op_names:
+    if _name.startswith(('BINARY_', 'COMPARE_')):
+        stack_effects.setdefault(_name, (2, 1))
+    elif _name.startswith('UNARY_'):
+        stack_effects.setdefault(_name, (1, 1))
+del _name
+
+return_ops = frozenset(('RETURN_CONST', 'RETURN_VALUE'))
+
+
+def stack_effect(op_name, args):
+    return tuple((n(args) if callable(n) else n)
+                 for n in stack_effects[op_name])
+
+
+#
+# Nested op lists.  Each function returns a copy of an op's arguments with
+# every nested op list replaced by func(ops, is_expr, num_args), where
+# is_expr is True for op lists that evaluate to a single value and False
+# for statement lists, and num_args is the number of values (function
+# arguments or compound call local names) on the stack when the op list
+# starts executing.
+#
+
+def _map_arg_list(arg_list, func):
+    if isinstance(arg_list, collections.OrderedDict):
+        return collections.OrderedDict((k, func(v, True, 0)) for k, v in
+                                       arg_list.items())
+    return tuple(func(arg, True, 0) for arg in arg_list)
+
+
+def _map_logical_op(args, func):
+    return (tuple(func(o, True, 0) for o in args[0]),)
+
+
+def _map_compare_op(args, func):
+    return (args[0], tuple(func(o, True, 0) for o in args[1]))
+
+
+def _map_call(args, func):
+    return (_map_arg_list(args[0], func),)
+
+
+def _map_call_compound(args, func):
+    return (args[0],
+            tuple((_map_arg_list(arg_list, func),
+                   num_locals,
+                   func(body, False, num_locals))
+                  for arg_list, num_locals, body in args[1]))
+
+
+def _map_make_function(args, func):
+    return (args[0], func(args[1], False, args[0]), args[2])
+
+
+def _map_if_else(args, func):
+    # An else clause has no condition
+    return (tuple(((None if cond is None else func(cond, True, 0)),
+                   func(body, False, 0))
+                  for cond, body in args[0]),)
+
+
+def _map_while_loop(args, func):
+    return (func(args[0], True, 0), func(args[1], False, 0))
+
+
+nested_code = {
+    'CALL_COMPOUND': _map_call_compound,
+    'CALL_FUNCTION': _map_call,
+    'CALL_SIMPLE': _map_call,
+    'COMPARE_OP': _map_compare_op,
+    'IF_ELSE': _map_if_else,
+    'LOGICAL_AND': _map_logical_op,
+    'LOGICAL_OR': _map_logical_op,
+    'MAKE_FUNCTION': _map_make_function,
+    'WHILE_LOOP': _map_while_loop,
+    }
+
+
+def map_nested_code(op, func):
+    """
+    Returns `op` with each of its nested op lists replaced by
+    func(ops, is_expr, num_args)
+    """
+    mapper = nested_code.get(op_names[op[0]])
+    if mapper is None:
+        return op
+    return op[:3] + (mapper(op[3], func),)
+
+
+_name_load_codes = frozenset(op_names.index(name) for name in
+                             ('LOAD_NAME', 'LOAD_GLOBAL', 'LOAD_GLOBAL_SLOT'))
+
+
+def free_names(ops):
+    """
+    Returns the set of global names read (via LOAD_NAME, LOAD_GLOBAL, or
+    LOAD_GLOBAL_SLOT) by `ops` or any op list nested within it
+    """
+    names = set()
+
+    def visit(nested_ops, is_expr=True, num_args=0):
+        for op in nested_ops:
+            if op[0] in _name_load_codes:
+                names.add(op[3][0])
+            map_nested_code(op, visit)
+        return nested_ops
+
+    visit(ops)
+    return frozenset(names)
+
+
+class StackError(ValueError):
+
+    def __init__(self, msg, lineno=None, lexpos=None):
+        super(StackError, self).__init__(msg)
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+def verify_stack(ops, is_expr=True, num_args=0):
+    """
+    Verifies that `ops` and every op list nested within it use the stack
+    consistently, and returns the maximum stack depth reached by `ops`.
+
+    Execution starts with `num_args` values on the stack.  An expression
+    op list must leave exactly one value on the stack, and a statement list
+    must leave none.  A return must leave the stack empty.  The maximum
+    depth is also stored in the max_stack_depth attribute of every Code
+    object encountered.
+    """
+    # Nested op lists are verified from a work list, rather than
+    # recursively, so that deeply nested code doesn't exhaust the stack
+    pending = []
+
+    def defer(nested_ops, nested_is_expr, nested_num_args):
+        pending.append((nested_ops, nested_is_expr, nested_num_args))
+        return nested_ops
+
+    max_depth = _verify_op_list(ops, is_expr, num_args, defer)
+    while pending:
+        nested_ops, nested_is_expr, nested_num_args = pending.pop()
+        _verify_op_list(nested_ops, nested_is_expr, nested_num_args, defer)
+    return max_depth
+
+
+def _verify_op_list(ops, is_expr, num_args, defer):
+    depth = max_depth = num_args
+    lineno = lexpos = None
+
+    for op in ops:
+        op_name = op_names[op[0]]
+        lineno, lexpos = op[1], op[2]
+        map_nested_code(op, defer)
+
+        pops, pushes = stack_effect(op_name, op[3])
+        if pops > depth:
+            raise StackError('%s needs %d stack items, but only %d available'
+                             % (op_name, pops, depth),
+                             lineno,
+                             lexpos)
+        depth += pushes - pops
+        max_depth = max(max_depth, depth)
+
+        if op_name in return_ops and depth != 0:
+            raise StackError('%s leaves %d items on the stack' %
+                             (op_name, depth),
+                             lineno,
+                             lexpos)
+
+    expected_depth = (1 if is_expr else 0)
+    if depth != expected_depth:
+        raise StackError('Op list leaves %d items on the stack (expected %d)'
+                         % (depth, expected_depth),
+                         lineno,
+                         lexpos)
+
+    if isinstance(ops, Code):
+        ops.max_stack_depth = max_depth
+    return max_depth
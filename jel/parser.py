@@ -3,17 +3,42 @@ import collections
 import decimal
 import inspect
 import os
+import weakref
 
 from ply import yacc
 
 from . import ast
+from .arrays import PackedArray
 
 
 class Parser(object):
 
-    def __init__(self, tokens, error_logger):
+    # Node types that may be shared when share_subtrees is true.  The
+    # parser never modifies nodes of these types after creating them.
+    # Nodes are shared only within a single parsed text, and errors in any
+    # occurrence of a shared node are reported at its first occurrence.
+    shareable_types = frozenset((
+        ast.ArrayLiteralExpr,
+        ast.BinaryOpExpr,
+        ast.BooleanLiteralExpr,
+        ast.IdentifierExpr,
+        ast.NullLiteralExpr,
+        ast.NumberArrayLiteralExpr,
+        ast.NumberLiteralExpr,
+        ast.ObjectLiteralExpr,
+        ast.StringLiteralExpr,
+        ast.UnaryOpExpr,
+        ))
+
+    def __init__(self, tokens, error_logger, decimal_numbers=False,
+                 packed_arrays=False, share_subtrees=False):
         self.tokens = tokens
         self.error_logger = error_logger
+        self.decimal_numbers = decimal_numbers
+        self.packed_arrays = packed_arrays
+        self.share_subtrees = share_subtrees
+        self._shared = weakref.WeakValueDictionary()
+        self._shared_text = None
 
     def build(self, debug=False, **kwargs):
         # Name the parsing table module 'yacctab' and store it in the
@@ -32,6 +57,58 @@ class Parser(object):
             **kwargs
             )
 
+    def share(self, p, node):
+        """
+        If share_subtrees is true, returns a node equal to `node` that was
+        previously parsed from the same text (the input of p.lexer), if
+        there is one, so that structurally identical literals,
+        identifiers, and arithmetic expressions are represented by a
+        single node (hash-consing).  Otherwise, returns `node`.
+
+        Only nodes of shareable types whose children are all shared are
+        themselves shared.  A shared node keeps the lineno and lexpos of
+        its first occurrence, so compiled code reports errors in any
+        occurrence at that location.
+        """
+        if (not self.share_subtrees) or (type(node) not in
+                                         self.shareable_types):
+            return node
+
+        if p.lexer.lexdata is not self._shared_text:
+            # Nodes from other texts have unrelated locations
+            self._shared.clear()
+            self._shared_text = p.lexer.lexdata
+
+        key = [type(node)]
+        for field in node._fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.AST):
+                if not value._shared:
+                    return node
+                value = id(value)
+            elif isinstance(value, tuple):
+                if not all(isinstance(v, ast.AST) and v._shared
+                           for v in value):
+                    return node
+                value = tuple(id(v) for v in value)
+            elif isinstance(value, collections.OrderedDict):
+                if not all(v._shared for v in value.values()):
+                    return node
+                value = tuple((k, id(v)) for k, v in value.items())
+            elif isinstance(value, decimal.Decimal):
+                # Equal decimals can have different exponents
+                value = (type(value), value.as_tuple())
+            else:
+                value = (type(value), value)
+            key.append(value)
+        key = tuple(key)
+
+        shared = self._shared.get(key)
+        if shared is None:
+            node._shared = True
+            shared = self._shared[key] = node
+        return shared
+
     def p_expr(self, p):
         '''
         expr : or_expr
@@ -90,10 +167,10 @@ class Parser(object):
 
     def unary_op(self, p):
         if len(p) == 3:
-            p[0] = ast.UnaryOpExpr(p.lineno(1),
-                                   p.lexpos(1),
-                                   op = p[1],
-                                   operand = p[2])
+            p[0] = self.share(p, ast.UnaryOpExpr(p.lineno(1),
+                                                 p.lexpos(1),
+                                                 op = p[1],
+                                                 operand = p[2]))
         else:
             self.same(p)
 
@@ -145,10 +222,10 @@ class Parser(object):
 
     def binary_op(self, p):
         if len(p) == 4:
-            p[0] = ast.BinaryOpExpr(p.lineno(2),
-                                    p.lexpos(2),
-                                    op = p[2],
-                                    operands = (p[1], p[3]))
+            p[0] = self.share(p, ast.BinaryOpExpr(p.lineno(2),
+                                                  p.lexpos(2),
+                                                  op = p[2],
+                                                  operands = (p[1], p[3])))
         else:
             self.same(p)
 
@@ -199,12 +276,19 @@ class Parser(object):
 
     def p_expr_list(self, p):
         '''
-        expr_list : expr COMMA expr_list
-                  | expr
+        expr_list : expr_list_items
+                  | expr_list_items COMMA
                   | empty
         '''
         self.item_list(p)
 
+    def p_expr_list_items(self, p):
+        '''
+        expr_list_items : expr_list_items COMMA expr
+                        | expr
+        '''
+        self.item_list_items(p)
+
     def p_subscript_expr(self, p):
         '''
         subscript_expr : postfix_expr LBRACKET expr RBRACKET
@@ -253,24 +337,38 @@ class Parser(object):
         '''
         object_literal_expr : LBRACE object_item_list RBRACE
         '''
-        p[0] = ast.ObjectLiteralExpr(p.lineno(1),
-                                     p.lexpos(1),
-                                     items = collections.OrderedDict(p[2]))
+        p[0] = self.share(p, ast.ObjectLiteralExpr(
+            p.lineno(1),
+            p.lexpos(1),
+            items = collections.OrderedDict(p[2]),
+            ))
 
     def p_object_item_list(self, p):
         '''
-        object_item_list : object_item COMMA object_item_list
-                         | object_item
+        object_item_list : object_item_list_items
+                         | object_item_list_items COMMA
                          | empty
         '''
         self.item_list(p)
 
+    def p_object_item_list_items(self, p):
+        '''
+        object_item_list_items : object_item_list_items COMMA object_item
+                               | object_item
+        '''
+        self.item_list_items(p)
+
     def item_list(self, p):
+        # Item lists are left recursive, and their items are appended to a
+        # list, so that long lists are parsed in linear time
+        p[0] = (() if p[1] is None else tuple(p[1]))
+
+    def item_list_items(self, p):
         if len(p) == 4:
-            p[0] = (p[1],) + p[3]
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
-            assert len(p) == 2
-            p[0] = (() if p[1] is None else (p[1],))
+            p[0] = [p[1]]
 
     def p_object_item(self, p):
         '''
@@ -289,16 +387,55 @@ class Parser(object):
         '''
         array_literal_expr : LBRACKET array_item_list RBRACKET
         '''
-        p[0] = ast.ArrayLiteralExpr(p.lineno(1), p.lexpos(1), items=p[2])
+        if self.packed_arrays:
+            values = self.number_array_values(p[2])
+            if values is not None:
+                p[0] = self.share(p, ast.NumberArrayLiteralExpr(
+                    p.lineno(1),
+                    p.lexpos(1),
+                    values = values,
+                    ))
+                return
+        p[0] = self.share(p, ast.ArrayLiteralExpr(p.lineno(1),
+                                                  p.lexpos(1),
+                                                  items = p[2]))
+
+    @staticmethod
+    def number_array_values(items):
+        # Returns a PackedArray of the values of `items`, or None if they
+        # aren't all (optionally signed) untagged number literals
+        if not items:
+            return None
+        values = []
+        for item in items:
+            sign = 1.0
+            if (type(item) is ast.UnaryOpExpr) and (item.op in ('+', '-')):
+                if item.op == '-':
+                    sign = -1.0
+                item = item.operand
+            if (type(item) is not ast.NumberLiteralExpr) or item.tag:
+                return None
+            try:
+                values.append(sign * float(item.value))
+            except OverflowError:
+                return None
+        return PackedArray(values)
 
     def p_array_item_list(self, p):
         '''
-        array_item_list : array_item COMMA array_item_list
-                        | array_item
+        array_item_list : array_item_list_items
+                        | array_item_list_items COMMA
                         | empty
         '''
         self.item_list(p)
 
+    def p_array_item_list_items(self, p):
+        '''
+        array_item_list_items : array_item_list_items COMMA array_item
+                              | array_item
+        '''
+        self.item_list_items(p)
+
     def p_array_item(self, p):
         '''
         array_item : expr
@@ -313,37 +450,50 @@ class Parser(object):
         value = p[1]
         if len(p) == 3:
             value += p[2].value
-        p[0] = ast.StringLiteralExpr(p.lineno(1), p.lexpos(1), value=value)
+        p[0] = self.share(p, ast.StringLiteralExpr(p.lineno(1),
+                                                   p.lexpos(1),
+                                                   value = value))
 
     def p_number_literal_expr(self, p):
         '''
         number_literal_expr : NUMBER
         '''
-        p[0] = ast.NumberLiteralExpr(p.lineno(1),
-                                     p.lexpos(1),
-                                     value = decimal.Decimal(p[1].value),
-                                     tag = (p[1].tag or None))
+        # Integers are kept exact, and other numbers are converted directly
+        # to float.  Decimal values are produced only if requested.
+        token = p.slice[1]
+        if self.decimal_numbers:
+            value = decimal.Decimal(token.number)
+        elif token.integer:
+            value = int(token.number)
+        else:
+            value = float(token.number)
+        p[0] = self.share(p, ast.NumberLiteralExpr(p.lineno(1),
+                                                   p.lexpos(1),
+                                                   value = value,
+                                                   tag = token.tag))
 
     def p_boolean_literal_expr(self, p):
         '''
         boolean_literal_expr : TRUE
                              | FALSE
         '''
-        p[0] = ast.BooleanLiteralExpr(p.lineno(1),
-                                      p.lexpos(1),
-                                      value = (p[1] == 'true'))
+        p[0] = self.share(p, ast.BooleanLiteralExpr(p.lineno(1),
+                                                    p.lexpos(1),
+                                                    value = (p[1] == 'true')))
 
     def p_null_literal_expr(self, p):
         '''
         null_literal_expr : NULL
         '''
-        p[0] = ast.NullLiteralExpr(p.lineno(1), p.lexpos(1))
+        p[0] = self.share(p, ast.NullLiteralExpr(p.lineno(1), p.lexpos(1)))
 
     def p_identifier_expr(self, p):
         '''
         identifier_expr : IDENTIFIER
         '''
-        p[0] = ast.IdentifierExpr(p.lineno(1), p.lexpos(1), value=p[1])
+        p[0] = self.share(p, ast.IdentifierExpr(p.lineno(1),
+                                                p.lexpos(1),
+                                                value = p[1]))
 
     def p_empty(self, p):
         '''
@@ -0,0 +1,248 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import sys
+
+from . import opcodes
+from .arrays import ArrayValue
+from .opcodes import Code
+
+
+def intern_string(s):
+    try:
+        return sys.intern(s)
+    except (AttributeError, TypeError):
+        # Python 2 can't intern unicode strings.  Pooling still ensures
+        # that equal names within a code object share one string.
+        return s
+
+
+#
+# Ops whose first argument is an identifier, attribute name, tag, or
+# compound call name, and is therefore stored in the name pool
+#
+
+name_ops = frozenset((
+    'APPLY_TAG',
+    'CALL_COMPOUND',
+    'DUP_STORE_CLOSURE',
+    'DUP_STORE_GLOBAL',
+    'DUP_STORE_GLOBAL_SLOT',
+    'DUP_STORE_LOCAL',
+    'DUP_STORE_NONLOCAL',
+    'INIT_LOCAL',
+    'LOAD_ATTR',
+    'LOAD_ATTR_REF',
+    'LOAD_CLOSURE',
+    'LOAD_GLOBAL',
+    'LOAD_GLOBAL_SLOT',
+    'LOAD_LOCAL',
+    'LOAD_NAME',
+    'LOAD_NONLOCAL',
+    'STORE_ATTR',
+    'STORE_CLOSURE',
+    'STORE_GLOBAL',
+    'STORE_GLOBAL_SLOT',
+    'STORE_LOCAL',
+    'STORE_NONLOCAL',
+    ))
+
+#
+# Ops whose first argument is a constant value (or, for BUILD_OBJECT, a
+# tuple of keys) and is therefore stored in the constant pool
+#
+
+const_ops = frozenset((
+    'BUILD_OBJECT',
+    'LOAD_CONST',
+    'RETURN_CONST',
+    ))
+
+
+def _const_key(value):
+    # Equal values of different types (e.g. True and 1.0) and zeros of
+    # different sign must occupy separate pool entries.  Array values
+    # (e.g. lazy ranges) are keyed by identity, since comparing or hashing
+    # them would materialize their items.
+    if isinstance(value, tuple):
+        return (tuple, tuple(_const_key(v) for v in value))
+    if isinstance(value, ArrayValue):
+        return (id, id(value))
+    if isinstance(value, float):
+        return (float, repr(value))
+    try:
+        hash(value)
+    except TypeError:
+        return (id, id(value))
+    return (type(value), value)
+
+
+class _Packer(object):
+
+    def __init__(self):
+        self.consts = []
+        self.names = []
+        self._const_indices = {}
+        self._name_indices = {}
+        self._packed = []
+
+    def const_index(self, value):
+        if isinstance(value, tuple) and all(isinstance(v, type(''))
+                                            for v in value):
+            value = tuple(intern_string(v) for v in value)
+        key = _const_key(value)
+        index = self._const_indices.get(key)
+        if index is None:
+            index = self._const_indices[key] = len(self.consts)
+            self.consts.append(value)
+        return index
+
+    def name_index(self, name):
+        index = self._name_indices.get(name)
+        if index is None:
+            index = self._name_indices[name] = len(self.names)
+            self.names.append(intern_string(name))
+        return index
+
+    def pack(self, ops, is_expr=None, num_args=None):
+        packed_ops = []
+        for op in ops:
+            op = opcodes.map_nested_code(op, self.pack)
+            op_name = opcodes.op_names[op[0]]
+            args = op[3]
+            if op_name in const_ops:
+                args = (self.const_index(args[0]),) + args[1:]
+            elif op_name in name_ops:
+                args = (self.name_index(args[0]),) + args[1:]
+            packed_ops.append(op[:3] + (_intern_nested_names(op_name, args),))
+
+        packed = Code(packed_ops, getattr(ops, 'version', opcodes.VERSION))
+        if hasattr(ops, 'max_stack_depth'):
+            packed.max_stack_depth = ops.max_stack_depth
+        self._packed.append(packed)
+        return packed
+
+    def finish(self):
+        consts = tuple(self.consts)
+        names = tuple(self.names)
+        for code in self._packed:
+            code.consts = consts
+            code.names = names
+
+
+def _intern_nested_names(op_name, args):
+    # Named call arguments and closure names stay inline, but are interned
+    if op_name in ('CALL_FUNCTION', 'CALL_SIMPLE'):
+        return (_intern_arg_list(args[0]),)
+    if op_name == 'CALL_COMPOUND':
+        return (args[0],
+                tuple((_intern_arg_list(arg_list), num_locals, body)
+                      for arg_list, num_locals, body in args[1]))
+    if op_name == 'MAKE_FUNCTION':
+        return (args[0],
+                args[1],
+                tuple((intern_string(name), depth) for name, depth in args[2]))
+    return args
+
+
+def _intern_arg_list(arg_list):
+    if isinstance(arg_list, collections.OrderedDict):
+        return collections.OrderedDict((intern_string(k), v) for k, v in
+                                       arg_list.items())
+    return arg_list
+
+
+def pack(code):
+    """
+    Returns a copy of `code` in which every constant and name argument is
+    replaced by an index into the consts or names attribute of the result.
+
+    Equal constants and names share a single pool entry, and all op lists
+    nested within the result share the same pools.
+    """
+    packer = _Packer()
+    packed = packer.pack(code)
+    packer.finish()
+    return packed
+
+
+def unpack(code):
+    """
+    Inverse of pack.  Equal constants and names in the result are shared
+    objects.
+    """
+    consts, names = code.consts, code.names
+
+    def unpack_ops(ops, is_expr=None, num_args=None):
+        unpacked_ops = []
+        for op in ops:
+            op = opcodes.map_nested_code(op, unpack_ops)
+            op_name = opcodes.op_names[op[0]]
+            args = op[3]
+            if op_name in const_ops:
+                args = (consts[args[0]],) + args[1:]
+            elif op_name in name_ops:
+                args = (names[args[0]],) + args[1:]
+            unpacked_ops.append(op[:3] + (args,))
+
+        unpacked = Code(unpacked_ops, ops.version)
+        if hasattr(ops, 'max_stack_depth'):
+            unpacked.max_stack_depth = ops.max_stack_depth
+        return unpacked
+
+    return unpack_ops(code)
+
+
+PoolStats = collections.namedtuple('PoolStats', ('num_ops',
+                                                 'num_const_refs',
+                                                 'num_consts',
+                                                 'num_name_refs',
+                                                 'num_names'))
+
+
+def pool_stats(code):
+    """Returns a PoolStats describing the packed code object `code`"""
+    counts = collections.Counter()
+
+    def count_ops(ops, is_expr=None, num_args=None):
+        for op in ops:
+            op_name = opcodes.op_names[op[0]]
+            counts['ops'] += 1
+            if op_name in const_ops:
+                counts['consts'] += 1
+            elif op_name in name_ops:
+                counts['names'] += 1
+            opcodes.map_nested_code(op, count_ops)
+        return ops
+
+    count_ops(code)
+    return PoolStats(counts['ops'],
+                     counts['consts'],
+                     len(code.consts),
+                     counts['names'],
+                     len(code.names))
+
+
+def main(paths):
+    print('%-30s %8s %8s %8s %8s %8s' % ('file',
+                                         'ops',
+                                         'c_refs',
+                                         'consts',
+                                         'n_refs',
+                                         'names'))
+    for path in paths:
+        if path.endswith('.mwel'):
+            from mwel import parse
+            from mwel.compiler import Compiler
+        else:
+            from . import parse
+            from .compiler import Compiler
+
+        with open(path) as fp:
+            root = parse(fp.read())
+        if root:
+            stats = pool_stats(pack(Compiler().compile(root)))
+            print('%-30s %8d %8d %8d %8d %8d' % ((path,) + stats))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
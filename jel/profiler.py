@@ -0,0 +1,144 @@
+from __future__ import division, print_function, unicode_literals
+import timeit
+
+from .executor import ExecutionError
+
+
+class Profiler(object):
+
+    """
+    Execution counts and times, per opcode and per source location
+    (lineno, lexpos), collected by a profiling executor.
+
+    Times are exclusive: the time an op spends executing nested op lists
+    (e.g. the operands of LOGICAL_AND, or the body of a function it calls)
+    is charged to the ops in those lists, not to the op itself.
+    """
+
+    def __init__(self, timer=timeit.default_timer):
+        self.timer = timer
+        self.op_stats = {}
+        self.location_stats = {}
+
+    def clear(self):
+        self.op_stats.clear()
+        self.location_stats.clear()
+
+    @property
+    def total_time(self):
+        return sum(s[1] for s in self.op_stats.values())
+
+    def report(self, op_names, source=None, limit=20):
+        """
+        Returns a report of the most expensive opcodes and source
+        locations, sorted by total time.  `op_names` maps opcodes to names
+        (e.g. Compiler.op_names).  If `source` is given, locations are
+        shown as line and column numbers.
+        """
+        total = self.total_time or 1.0
+
+        def location_name(location):
+            lineno, lexpos = location
+            if isinstance(lexpos, tuple):
+                # Ops for chained operators are located at each operator,
+                # and are reported at the first
+                lineno, lexpos = lineno[0], lexpos[0]
+            if (source is None) or (lineno is None) or (lexpos is None):
+                return 'line %s, lexpos %s' % (lineno, lexpos)
+            colno = lexpos - source.rfind('\n', 0, lexpos)
+            return 'line %d, column %d' % (lineno, colno)
+
+        lines = []
+        for title, stats, name in (
+                ('Opcode', self.op_stats, (lambda code: op_names[code])),
+                ('Location', self.location_stats, location_name),
+                ):
+            lines.append('%-28s %10s %12s %7s' % (title, 'count', 'time (s)',
+                                                  'time %'))
+            ranked = sorted(stats.items(), key=(lambda item: -item[1][1]))
+            for key, (count, time) in ranked[:limit]:
+                lines.append('%-28s %10d %12.6f %6.1f%%' %
+                             (name(key), count, time, 100.0 * time / total))
+            lines.append('')
+        return '\n'.join(lines)
+
+
+class ProfilingMixin(object):
+
+    """
+    Mixin for Executor classes that records the count and time of every op
+    executed in the mixer's profiler (a Profiler passed as the `profiler`
+    keyword argument, or a new one).
+
+    Profiling replaces Executor.execute, so it only sees op lists run by
+    execute.  Executors that never use the mixin pay nothing for it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        profiler = kwargs.pop('profiler', None)
+        super(ProfilingMixin, self).__init__(*args, **kwargs)
+        self.profiler = (Profiler() if profiler is None else profiler)
+        self._nested_times = []
+
+    def execute(self, ops, args=()):
+        profiler = self.profiler
+        timer = profiler.timer
+        op_stats = profiler.op_stats
+        location_stats = profiler.location_stats
+        nested_times = self._nested_times
+
+        stack = list(args)
+        dispatch = self._dispatch
+        nested_times.append(0.0)
+        start = timer()
+
+        try:
+            for code, lineno, lexpos, args in ops:
+                nested_time = nested_times[-1]
+                op_start = timer()
+                try:
+                    dispatch[code](stack, *args)
+                except self.control_exceptions:
+                    raise
+                except Exception as e:
+                    wrapped = ExecutionError.wrap(e, lineno, lexpos)
+                    if wrapped is e:
+                        raise
+                    raise wrapped
+                finally:
+                    time = ((timer() - op_start) -
+                            (nested_times[-1] - nested_time))
+                    for stats, key in ((op_stats, code),
+                                       (location_stats, (lineno, lexpos))):
+                        entry = stats.get(key)
+                        if entry is None:
+                            stats[key] = [1, time]
+                        else:
+                            entry[0] += 1
+                            entry[1] += time
+        finally:
+            nested_times.pop()
+            if nested_times:
+                nested_times[-1] += timer() - start
+
+        return (stack.pop() if stack else None)
+
+    def profile_report(self, source=None, limit=20):
+        return self.profiler.report(self.compiler_class.op_names,
+                                    source,
+                                    limit)
+
+
+_profiling_classes = {}
+
+
+def profiling_executor_class(executor_class):
+    """Returns a subclass of `executor_class` that uses ProfilingMixin"""
+    cls = _profiling_classes.get(executor_class)
+    if cls is None:
+        cls = _profiling_classes[executor_class] = type(
+            str('Profiling' + executor_class.__name__),
+            (ProfilingMixin, executor_class),
+            {},
+            )
+    return cls
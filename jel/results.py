@@ -0,0 +1,174 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import itertools
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+from .opcodes import free_names
+
+
+def _same_value(a, b):
+    if a is b:
+        return True
+    try:
+        return (type(a) is type(b)) and bool(a == b)
+    except (TypeError, ValueError):
+        # E.g. NumPy arrays, whose comparisons are elementwise
+        return False
+
+
+class Variables(MutableMapping):
+
+    """
+    A names mapping that records when each name last changed.
+
+    Every assignment or deletion that changes a name's value gives the
+    name a new version number.  Assigning a value equal to (and of the same
+    type as) the current one leaves the version unchanged.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._values = {}
+        self._versions = {}
+        self._clock = itertools.count(1)
+        self.version = 0
+        self.update(*args, **kwargs)
+
+    def name_version(self, name):
+        """Returns the version of `name` (0, if it has never been bound)"""
+        return self._versions.get(name, 0)
+
+    def _touch(self, name):
+        self.version = self._versions[name] = next(self._clock)
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __setitem__(self, name, value):
+        values = self._values
+        if (name not in values) or (not _same_value(values[name], value)):
+            values[name] = value
+            self._touch(name)
+
+    def __delitem__(self, name):
+        del self._values[name]
+        self._touch(name)
+
+    def __contains__(self, name):
+        return name in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return 'Variables(%r)' % self._values
+
+
+class _Entry(object):
+
+    __slots__ = ('code', 'result', 'dependencies', 'checked_version')
+
+    def __init__(self, code, result, dependencies, checked_version):
+        self.code = code
+        self.result = result
+        self.dependencies = dependencies
+        self.checked_version = checked_version
+
+
+class ResultCache(object):
+
+    """
+    Memoizes the results of compiled expressions evaluated by `executor`,
+    whose names must be a Variables instance.
+
+    A cached result is reused until one of the names the expression reads
+    (as found by opcodes.free_names) changes.  Expressions are assumed to
+    depend only on those names, so functions they call must not read
+    other mutable state.  Evaluations that raise an error are not cached.
+
+    The cache holds results for at most `max_entries` code objects, and
+    evicts the least recently used first.  Code objects are keyed by
+    identity, so each cached one is kept alive until it is evicted,
+    discarded, or cleared.
+
+    Only names bound in the Variables instance are tracked.  Code linked
+    by mwel.linker.Linker reads globals from its table of global slots
+    instead, so writes to those slots are not seen, and a cached result of
+    linked code may be stale.  Such code must not be evaluated through a
+    ResultCache.
+    """
+
+    def __init__(self, executor, max_entries=1000):
+        if not isinstance(executor.names, Variables):
+            raise TypeError('Executor names must be a Variables instance')
+        self.executor = executor
+        self.variables = executor.names
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._dependencies = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def evaluate(self, code):
+        """Returns the value of `code`, reusing its cached result if valid"""
+        variables = self.variables
+        entries = self._entries
+        entry = entries.get(id(code))
+
+        if (entry is not None) and (entry.code is code):
+            if entry.checked_version != variables.version:
+                name_version = variables.name_version
+                if not all(name_version(name) == version for name, version in
+                           entry.dependencies):
+                    entry = None
+            if entry is not None:
+                entry.checked_version = variables.version
+                entries.pop(id(code))
+                entries[id(code)] = entry
+                self.hits += 1
+                return entry.result
+
+        self.misses += 1
+        names = self.free_names(code)
+        version = variables.version
+        dependencies = tuple((name, variables.name_version(name)) for name in
+                             names)
+        result = self.executor.execute(code)
+        entries.pop(id(code), None)
+        entries[id(code)] = _Entry(code,
+                                   result,
+                                   dependencies,
+                                   version)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def free_names(self, code):
+        dependencies = self._dependencies
+        entry = dependencies.pop(id(code), None)
+        if (entry is None) or (entry[0] is not code):
+            entry = (code, free_names(code))
+        dependencies[id(code)] = entry
+        while len(dependencies) > self.max_entries:
+            dependencies.popitem(last=False)
+        return entry[1]
+
+    def discard(self, code):
+        """Removes the cached result of `code`, if any"""
+        entry = self._entries.get(id(code))
+        if (entry is not None) and (entry.code is code):
+            del self._entries[id(code)]
+
+    def clear(self):
+        """Removes all cached results, and resets the counters"""
+        self._entries.clear()
+        self._dependencies.clear()
+        self.hits = self.misses = self.evictions = 0
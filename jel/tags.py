@@ -0,0 +1,59 @@
+from __future__ import division, print_function, unicode_literals
+import math
+
+
+class TagTable(object):
+
+    """
+    Maps number literal tags (e.g. the 'ms' in '100ms') to functions that
+    convert a tagged value to its canonical, untagged form.
+
+    A compiler given a TagTable folds literals with known tags to constants
+    at compile time.  The table can also be passed to Executor as its tags
+    mapping, to handle APPLY_TAG at run time.  Conversion results are
+    cached, so each distinct tagged literal is converted only once.
+    """
+
+    def __init__(self, conversions=None):
+        self._conversions = {}
+        self._cache = {}
+        if conversions:
+            for tag, conversion in conversions.items():
+                self.register(tag, conversion)
+
+    def register(self, tag, conversion):
+        self._conversions[tag] = conversion
+        for key in tuple(self._cache):
+            if key[0] == tag:
+                del self._cache[key]
+
+    def __contains__(self, tag):
+        return tag in self._conversions
+
+    def __getitem__(self, tag):
+        return self._conversions[tag]
+
+    def convert(self, value, tag):
+        key = (tag, value)
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = self._conversions[tag](value)
+            return result
+
+
+def scale(factor):
+    def conversion(value):
+        return value * factor
+    return conversion
+
+
+# Times are in microseconds, and angles in degrees
+standard_tags = TagTable({
+    'us': scale(1.0),
+    'ms': scale(1e3),
+    's': scale(1e6),
+    'min': scale(60e6),
+    'deg': scale(1.0),
+    'rad': scale(180.0 / math.pi),
+    })
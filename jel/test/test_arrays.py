@@ -0,0 +1,59 @@
+from __future__ import division, print_function, unicode_literals
+import pickle
+import sys
+import unittest
+
+from ..arrays import ConcatArray, PackedArray, concat_arrays
+
+
+class TestPackedArray(unittest.TestCase):
+
+    def test_items(self):
+        a = PackedArray((1.0, 2.0, 3.5))
+        self.assertEqual(3, len(a))
+        self.assertEqual(1.0, a[0])
+        self.assertEqual(3.5, a[-1])
+        self.assertIsInstance(a[1:], PackedArray)
+        self.assertEqual((2.0, 3.5), a[1:])
+        self.assertIn(2.0, a)
+        self.assertNotIn(4.0, a)
+        self.assertEqual((1.0, 2.0, 3.5), a.materialize())
+        with self.assertRaises(IndexError):
+            a[3]
+
+    def test_equality(self):
+        a = PackedArray((1.0, 2.0))
+        self.assertEqual(a, PackedArray((1.0, 2.0)))
+        self.assertEqual(a, (1.0, 2.0))
+        self.assertEqual((1.0, 2.0), a)
+        self.assertNotEqual(a, (1.0, 2.0, 3.0))
+        self.assertNotEqual(a, [1.0, 2.0])
+        self.assertEqual(hash((1.0, 2.0)), hash(a))
+        self.assertEqual(a, pickle.loads(pickle.dumps(a)))
+
+    def test_size(self):
+        values = tuple(float(i) for i in range(10000))
+        packed = PackedArray(values)
+        unpacked_size = (sys.getsizeof(values) +
+                         sum(sys.getsizeof(v) for v in values))
+        self.assertLess(sys.getsizeof(packed), unpacked_size / 3)
+
+
+class TestConcatArrays(unittest.TestCase):
+
+    def test_concat(self):
+        a = concat_arrays(((1.0,), PackedArray((2.0, 3.0)), (4.0,), (5.0,)))
+        self.assertIsInstance(a, ConcatArray)
+        self.assertEqual(3, len(a.parts))
+        self.assertEqual((4.0, 5.0), a.parts[-1])
+        self.assertEqual((1.0, 2.0, 3.0, 4.0, 5.0), a)
+        self.assertEqual(3.0, a[2])
+        self.assertIn(3.0, a)
+        self.assertEqual((1.0, 2.0), concat_arrays(((1.0,), (), (2.0,))))
+        self.assertEqual((), concat_arrays(()))
+
+    def test_add(self):
+        a = PackedArray((1.0, 2.0))
+        self.assertEqual((1.0, 2.0, 3.0), a + (3.0,))
+        self.assertEqual((3.0, 1.0, 2.0), (3.0,) + a)
+        self.assertEqual(4, len(a + a))
@@ -1,4 +1,5 @@
 from __future__ import division, print_function, unicode_literals
+import collections
 import unittest
 
 from .. import ast
@@ -78,3 +79,65 @@ class TestAST(unittest.TestCase):
         self.assertFalse(o1 != o1)
         self.assertFalse(o1 != o2)
         self.assertTrue(o1 != n1)
+
+    def test_equality_of_child_collections(self):
+        def node(foo, bar):
+            return Node(foo=foo, bar=bar)
+
+        self.assertEqual(node((1, OtherNode()), {'a': 2}),
+                         node((1, OtherNode()), {'a': 2}))
+        self.assertNotEqual(node((1, OtherNode()), 0), node([1, OtherNode()], 0))
+        self.assertNotEqual(node((1,), 0), node((1, 2), 0))
+        self.assertNotEqual(node({'a': 1}, 0), node({'b': 1}, 0))
+        self.assertNotEqual(node({'a': node(1, 2)}, 0),
+                            node({'a': node(1, 3)}, 0))
+
+        items = [('a', 1), ('b', 2)]
+        self.assertEqual(node(collections.OrderedDict(items), 0),
+                         node(collections.OrderedDict(items), 0))
+        self.assertNotEqual(node(collections.OrderedDict(items), 0),
+                            node(collections.OrderedDict(items[::-1]), 0))
+
+    def test_deep_equality(self):
+        # Deeper than Python's recursion limit
+        def chain(leaf):
+            n = leaf
+            for i in range(5000):
+                n = Node(foo=i, bar=(n,))
+            return n
+
+        self.assertEqual(chain(1), chain(1))
+        self.assertNotEqual(chain(1), chain(2))
+        self.assertEqual(chain(1).structural_hash(),
+                         chain(1).structural_hash())
+
+    def test_structural_hash(self):
+        n1 = Node(foo=1, bar=(OtherNode(), {'a': 2, 'b': 3}))
+        n2 = Node(foo=1.0, bar=(OtherNode(), {'b': 3, 'a': 2}))
+        self.assertEqual(n1, n2)
+        self.assertEqual(n1.structural_hash(), n2.structural_hash())
+
+        self.assertNotEqual(n1.structural_hash(),
+                            Node(foo=1, bar=(OtherNode(),)).structural_hash())
+        self.assertNotEqual(n1.structural_hash(),
+                            DerivedNode(foo=n1.foo,
+                                        bar=n1.bar).structural_hash())
+        self.assertNotEqual(Node(foo=(1, 2), bar=()).structural_hash(),
+                            Node(foo=(1,), bar=(2,)).structural_hash())
+
+    def test_child_fields(self):
+        # Only child fields are compared structurally.  Others are compared
+        # with ==.
+        n1 = ast.NumberLiteralExpr(value=1, tag='ms')
+        n2 = ast.NumberLiteralExpr(value=1.0, tag='ms')
+        self.assertEqual(n1, n2)
+        self.assertEqual(n1.structural_hash(), n2.structural_hash())
+        self.assertNotEqual(n1, ast.NumberLiteralExpr(value=1, tag=None))
+
+        def binop(op, operand):
+            return ast.BinaryOpExpr(op=op, operands=(operand, n1))
+
+        self.assertEqual(binop('+', n1), binop('+', n2))
+        self.assertNotEqual(binop('+', n1), binop('-', n1))
+        self.assertNotEqual(binop('+', n1).structural_hash(),
+                            binop('-', n1).structural_hash())
@@ -0,0 +1,111 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from .. import batch
+from ..batch import BatchExecutor, evaluate_batch
+from ..compiler import Compiler
+from ..executor import ExecutionError
+from ..lexer import Lexer
+from ..parser import Parser
+from ..tags import standard_tags
+from .test_executor import ExecutorTestMixin
+
+
+class TestBatchExecutor(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+
+    columns = {
+        'eye_h': [-3.0, -1.0, 0.0, 1.0, 3.0],
+        'eye_v': [0.0, 2.0, 0.0, -2.0, 0.0],
+        }
+
+    def assertBatchEvaluatesTo(self, expected, s, names=None, tags=None):
+        for specialized_ops in (False, True):
+            code = self.compile(s, specialized_ops=specialized_ops)
+            result = evaluate_batch(code, self.columns, names, tags)
+            self.assertEqual(expected, list(result))
+
+    def assertVectorizable(self, expected, s, **compiler_options):
+        executor = BatchExecutor(self.columns)
+        code = self.compile(s, **compiler_options)
+        self.assertEqual(expected and (batch.numpy is not None),
+                         executor._is_vectorizable(code))
+
+    def test_arithmetic(self):
+        self.assertBatchEvaluatesTo([-6.0, 2.0, 0.0, 6.0, 6.0],
+                                    'eye_h * (1 - eye_v) * width',
+                                    names={'width': 2.0})
+        self.assertBatchEvaluatesTo([3.0, 1.0, 0.0, -1.0, -3.0], '-eye_h')
+        self.assertBatchEvaluatesTo([-3e6, -1e6, 0.0, 1e6, 3e6], 'eye_h * 1s',
+                                    tags=standard_tags)
+        self.assertBatchEvaluatesTo([2.0] * 5, '1 + 1')
+
+    def test_comparisons(self):
+        self.assertBatchEvaluatesTo([False, True, True, True, False],
+                                    'eye_h > -width and eye_h < width',
+                                    names={'width': 2.0})
+        self.assertBatchEvaluatesTo([False, True, True, True, False],
+                                    '-2 < eye_h <= 1 != eye_v')
+        self.assertBatchEvaluatesTo([True, True, False, True, True],
+                                    'not (eye_h == 0) or eye_v > 0')
+
+    def test_fallback(self):
+        names = {'abs': abs, 'limits': {'h': 1.5}}
+        self.assertBatchEvaluatesTo([False, True, True, True, False],
+                                    'abs(eye_h) < limits.h',
+                                    names=names)
+        self.assertBatchEvaluatesTo([False, True, False, True, False],
+                                    'eye_h in [-1, 1]')
+        self.assertVectorizable(False, 'eye_h in [-1, 1]',
+                                specialized_ops=True)
+        self.assertVectorizable(False, 'abs(eye_h)')
+        self.assertVectorizable(True, 'not eye_h or eye_v < 1',
+                                specialized_ops=True)
+
+        # Unsupported operands of an otherwise vectorizable op are
+        # evaluated row by row
+        self.assertBatchEvaluatesTo([False, True, False, False, False],
+                                    'eye_v > 0 and abs(eye_h) <= limits.h',
+                                    names=names)
+
+        # Operands evaluated row by row are evaluated only for the rows
+        # whose results are still undecided
+        columns = {'i': [0.0, 1.0, 5.0]}
+        calls = []
+        def check(i):
+            calls.append(i)
+            return i > 0
+        names = {'n': 2.0, 'arr': (1.0, 2.0), 'check': check}
+        for s, expected in (('i < n and arr[i] > 0', [True, True, False]),
+                            ('i >= n or arr[i] > 1', [False, True, True]),
+                            ('0 <= i < n < arr[i] + 1', [False, True, False]),
+                            ('i > 2 and check(i)', [False, False, True])):
+            for specialized_ops in (False, True):
+                code = self.compile(s, specialized_ops=specialized_ops)
+                self.assertEqual(expected,
+                                 list(evaluate_batch(code, columns, names)))
+        self.assertEqual([5.0, 5.0], calls)
+
+        with self.assertRaises(ExecutionError) as cm:
+            evaluate_batch(self.compile('eye_h.foo'), self.columns)
+        self.assertEqual((1, 5), (cm.exception.lineno, cm.exception.lexpos))
+
+    def test_columns(self):
+        with self.assertRaises(ValueError):
+            BatchExecutor({'a': [1.0], 'b': [1.0, 2.0]})
+        self.assertEqual([], list(evaluate_batch(self.compile('a + 1'),
+                                                 {'a': []})))
+
+
+    @unittest.skipIf(batch.numpy is None, 'NumPy is not installed')
+    def test_arrays(self):
+        numpy = batch.numpy
+        code = self.compile('x / y > 1 or not y')
+        result = evaluate_batch(code, {'x': numpy.array([1.0, 3.0, 1.0]),
+                                       'y': numpy.array([2.0, 2.0, 0.0])})
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(numpy.bool_, result.dtype.type)
+        self.assertEqual([False, True, True], result.tolist())
@@ -0,0 +1,101 @@
+from __future__ import division, print_function, unicode_literals
+import threading
+import unittest
+
+from mwel.compiler import Compiler as MWELCompiler
+from mwel.lexer import Lexer as MWELLexer
+from mwel.parser import Parser as MWELParser
+
+from ..cache import CacheStats, CompiledCache, ParseError, code_size
+from ..executor import Executor
+
+
+class TestCompiledCache(unittest.TestCase):
+
+    def test_hits(self):
+        cache = CompiledCache()
+        code = cache.get('a + 1')
+        self.assertEqual(2.0, Executor({'a': 1.0}).execute(code))
+        self.assertIs(code, cache.get('a + 1'))
+        self.assertIsNot(code, cache.get('a + 1', specialized_ops=True))
+        self.assertIsNot(code, cache.get('a+1'))
+
+        stats = cache.stats()
+        self.assertEqual((1, 3, 0, 3), stats[:4])
+        self.assertEqual(stats.bytes, sum(e[1] for e in
+                                          cache._entries.values()))
+
+    def test_entry_eviction(self):
+        cache = CompiledCache(max_entries=2)
+        a = cache.get('a')
+        cache.get('b')
+        self.assertIs(a, cache.get('a'))
+        cache.get('c')  # Evicts b
+        self.assertIs(a, cache.get('a'))
+        cache.get('b')  # Evicts c
+        self.assertEqual(CacheStats(2, 4, 2, 2, cache.stats().bytes),
+                         cache.stats())
+
+    def test_size_eviction(self):
+        unbounded = CompiledCache()
+        for s in ('[1, 2, 3]', '[4, 5, 6]', '[7, 8, 9]'):
+            unbounded.get(s)
+        max_bytes = unbounded.stats().bytes - 1
+
+        cache = CompiledCache(max_bytes=max_bytes)
+        for s in ('[1, 2, 3]', '[4, 5, 6]', '[7, 8, 9]'):
+            cache.get(s)
+        stats = cache.stats()
+        self.assertEqual((1, 2), (stats.evictions, stats.entries))
+        self.assertLessEqual(stats.bytes, max_bytes)
+
+        # Code that can never fit isn't cached
+        cache = CompiledCache(max_bytes=10)
+        cache.get('1')
+        self.assertEqual(0, len(cache))
+
+    def test_parse_errors(self):
+        cache = CompiledCache()
+        with self.assertRaises(ParseError) as cm:
+            cache.get('(1 +\n+ ))')
+        self.assertEqual(2, cm.exception.lineno)
+        self.assertEqual(0, len(cache))
+        self.assertEqual(2.0, Executor().execute(cache.get('1 + 1')))
+
+    def test_mwel(self):
+        cache = CompiledCache(lexer_class=MWELLexer,
+                              parser_class=MWELParser,
+                              compiler_class=MWELCompiler)
+        code = cache.get('x = 1\n')
+        self.assertIs(code, cache.get('x = 1\n'))
+
+    def test_threads(self):
+        cache = CompiledCache(max_entries=20)
+        sources = ['x + %d' % i for i in range(40)]
+        errors = []
+
+        def work():
+            try:
+                executor = Executor({'x': 1.0})
+                for i in range(200):
+                    s = sources[i % len(sources)]
+                    code = cache.get(s)
+                    assert executor.execute(code) == 1.0 + (i % len(sources))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual([], errors)
+        stats = cache.stats()
+        self.assertEqual(800, stats.hits + stats.misses)
+        self.assertEqual(20, stats.entries)
+
+    def test_code_size(self):
+        cache = CompiledCache()
+        self.assertLess(code_size(cache.get('1')),
+                        code_size(cache.get('f(1, [2, 3], a and b)')))
@@ -0,0 +1,87 @@
+from __future__ import division, print_function, unicode_literals
+import gc
+import linecache
+import unittest
+
+from ..codegen import CodeGenerator, PythonExecutor
+from ..executor import ExecutionError
+from .test_executor import TestExecutor
+
+
+class TestPythonExecutor(TestExecutor):
+
+    executor_class = PythonExecutor
+
+    def test_cache(self):
+        code = self.compile('a + 1')
+        executor = PythonExecutor({'a': 1.0})
+        self.assertEqual(2.0, executor.execute(code))
+        function = code.python_functions[(PythonExecutor, 0, False)]
+
+        executor = PythonExecutor({'a': 2.0})
+        self.assertEqual(3.0, executor.execute(code))
+        self.assertIs(function, executor.code_generator.function(code))
+
+    def test_args(self):
+        code = self.compile('a')
+        # The initial stack value is left beneath the expression's value
+        self.assertEqual(1.0, PythonExecutor({'a': 1.0}).execute(code,
+                                                                (2.0,)))
+        self.assertEqual(2.0, PythonExecutor().execute((), (2.0,)))
+        self.assertIsNone(PythonExecutor().execute(()))
+
+    def test_source_lines(self):
+        code = self.compile('(\nx +\n[1][5])')
+        function = CodeGenerator().function(code)
+        lines = linecache.getlines(function.source_filename)
+        self.assertTrue(lines[0].startswith('def _code(_x'))
+        self.assertIn('_get_item(', ''.join(lines))
+
+        with self.assertRaises(ExecutionError) as cm:
+            function(PythonExecutor({'x': 1.0}))
+        self.assertEqual('IndexError: tuple index out of range',
+                         cm.exception.args[0])
+        self.assertEqual((3, 9), (cm.exception.lineno, cm.exception.lexpos))
+
+        # Source is registered only while its function is alive
+        function = CodeGenerator().function(tuple(self.compile('x + 1')))
+        filename = function.source_filename
+        self.assertIn(filename, linecache.cache)
+        del function
+        gc.collect()
+        self.assertNotIn(filename, linecache.cache)
+
+    def test_long_chains(self):
+        # Each operand doesn't add a level of indentation, which Python
+        # limits
+        executor = PythonExecutor({'x': 1.0})
+        self.assertIs(True, executor.execute(self.compile(
+            ' and '.join(['x'] * 120)
+            )))
+        self.assertIs(False, executor.execute(self.compile(
+            ' or '.join(['(x < 1)'] * 120)
+            )))
+        self.assertIs(True, executor.execute(self.compile(
+            ' <= '.join(['x'] * 150)
+            )))
+        self.assertIs(False, executor.execute(self.compile(
+            ' < '.join(['x'] * 150)
+            )))
+
+    def test_deep_nesting(self):
+        # Python limits the number of nested blocks, so deeply nested
+        # operands run as separate functions
+        s = 'x'
+        for i in range(40):
+            s = '(x %s %s)' % (('and', 'or')[i % 2], s)
+        executor = PythonExecutor({'x': 1.0})
+        self.assertIs(True, executor.execute(self.compile(s)))
+
+        s = 'x < y'
+        for i in range(40):
+            s = '(x and\n%s)' % s
+        with self.assertRaises(ExecutionError) as cm:
+            executor.execute(self.compile(s))
+        self.assertEqual("Undefined name: 'y'", cm.exception.args[0])
+        self.assertEqual((41, s.index('y')),
+                         (cm.exception.lineno, cm.exception.lexpos))
@@ -3,9 +3,12 @@ import collections
 from contextlib import contextmanager
 import unittest
 
+from .. import ast
+from ..arrays import PackedArray
 from ..compiler import Compiler
 from ..lexer import Lexer
 from ..parser import Parser
+from ..tags import TagTable, scale
 
 
 class CompilerTestMixin(object):
@@ -21,14 +24,19 @@ class CompilerTestMixin(object):
         self.compiler = self.compiler_class()
         self.ops = []
 
-        def compile_wrapper(s):
+        def parse(s):
             lexer.lineno = 1  # Reset lineno
-            return self.assertOpList(
-                self.compiler.compile(parser.parse(s, lexer=lexer))
-                )
+            return parser.parse(s, lexer=lexer)
+
+        def compile_wrapper(s):
+            return self.assertOpList(self.compile_root(parse(s)))
 
+        self.parse = parse
         self.compile = compile_wrapper
 
+    def compile_root(self, root):
+        return self.compiler.compile(root)
+
     def assertOpList(self, ops):
         self.assertIsInstance(ops, tuple)
 
@@ -108,6 +116,13 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
             self.assertOp('LOAD_NAME', 1, 7, 'c')
             self.assertOp('BUILD_ARRAY', 1, 0, 3)
 
+    def test_number_array_literal_expr(self):
+        values = PackedArray((1.0, -2.0, 3.5))
+        root = ast.NumberArrayLiteralExpr(1, 0, values=values)
+        with self.assertOpList(self.compile_root(root)):
+            args = self.assertOp('LOAD_CONST', 1, 0)
+            self.assertIs(values, args[0])
+
     def test_object_literal_expr(self):
         with self.compile('{}'):
             self.assertOp('BUILD_OBJECT', 1, 0, ())
@@ -248,3 +263,100 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
 
     def test_or_expr(self):
         self._test_logical_op('or', 'LOGICAL_OR')
+
+    def test_specialized_ops(self):
+        self.compiler = Compiler(specialized_ops=True)
+
+        with self.compile('-a + b ** c'):
+            self.assertOp('LOAD_NAME', 1, 1, 'a')
+            self.assertOp('UNARY_NEG', 1, 0)
+            self.assertOp('LOAD_NAME', 1, 5, 'b')
+            self.assertOp('LOAD_NAME', 1, 10, 'c')
+            self.assertOp('BINARY_POW', 1, 7)
+            self.assertOp('BINARY_ADD', 1, 3)
+
+        def test_binop(op, op_name):
+            with self.compile('a %s b' % op):
+                self.assertOp('LOAD_NAME', 1, 0, 'a')
+                self.assertOp('LOAD_NAME', 1, len(op)+3, 'b')
+                self.assertOp(op_name, 1, 2)
+
+        for op, op_name in (('-', 'BINARY_SUB'),
+                            ('*', 'BINARY_MUL'),
+                            ('/', 'BINARY_DIV'),
+                            ('%', 'BINARY_MOD'),
+                            ('<', 'COMPARE_LT'),
+                            ('<=', 'COMPARE_LE'),
+                            ('>', 'COMPARE_GT'),
+                            ('>=', 'COMPARE_GE'),
+                            ('!=', 'COMPARE_NE'),
+                            ('==', 'COMPARE_EQ'),
+                            ('in', 'COMPARE_IN'),
+                            ('not in', 'COMPARE_NOT_IN')):
+            test_binop(op, op_name)
+
+        with self.compile('not +x'):
+            self.assertOp('LOAD_NAME', 1, 5, 'x')
+            self.assertOp('UNARY_POS', 1, 4)
+            self.assertOp('UNARY_NOT', 1, 0)
+
+        # Chained comparisons still use COMPARE_OP
+        with self.compile('a < b < c'):
+            args = self.assertOp('COMPARE_OP', (1, 1), (2, 6))
+            op_codes = self.compiler.comparison_op_codes
+            self.assertEqual((op_codes['<'], op_codes['<']), args[0])
+            self.assertEqual(3, len(args[1]))
+            self.ops[-1].extend(args[1][0] + args[1][1] + args[1][2])
+            self.assertOp('LOAD_NAME', 1, 0, 'a')
+            self.assertOp('LOAD_NAME', 1, 4, 'b')
+            self.assertOp('LOAD_NAME', 1, 8, 'c')
+
+    def test_tags(self):
+        tags = TagTable({'ms': scale(1e3)})
+        self.compiler = Compiler(tags=tags)
+
+        with self.compile('[2ms, 2ms, 3x]'):
+            self.assertOp('LOAD_CONST', 1, 1, 2000.0)
+            self.assertOp('LOAD_CONST', 1, 6, 2000.0)
+            self.assertOp('LOAD_CONST', 1, 11, 3.0)
+            self.assertOp('APPLY_TAG', 1, 11, 'x')
+            self.assertOp('BUILD_ARRAY', 1, 0, 3)
+
+    def test_deep_nesting(self):
+        # Deeper than Python's recursion limit
+        depth = 5000
+
+        root = ast.IdentifierExpr(1, 0, value='a')
+        for i in range(depth):
+            root = ast.BinaryOpExpr(
+                1, 0,
+                op = '+',
+                operands = (root, ast.NumberLiteralExpr(1, 0, value=1,
+                                                        tag=None)),
+                )
+        code = self.compiler.compile(root)
+        self.assertEqual(2 * depth + 1, len(code))
+        self.assertEqual(2, code.max_stack_depth)
+
+        root = ast.IdentifierExpr(1, 0, value='a')
+        for i in range(depth):
+            root = ast.AndExpr(1, 0, operands=(ast.IdentifierExpr(1, 0,
+                                                                  value='b'),
+                                               root))
+        code = self.compiler.compile(root)
+        for i in range(depth):
+            self.assertEqual(1, len(code))
+            code = code[0][3][0][1]
+        self.assertEqual(((self.compiler.op_codes['LOAD_NAME'],
+                           1, 0, ('a',)),),
+                         code)
+
+    def test_reuse_after_error(self):
+        root = ast.UnaryOpExpr(1, 0, op='~', operand=ast.IdentifierExpr(
+            1, 1, value='a'))
+        with self.assertRaises(KeyError):
+            self.compiler.compile(root)
+        with self.compile('a + 1'):
+            self.assertOp('LOAD_NAME', 1, 0, 'a')
+            self.assertOp('LOAD_CONST', 1, 4, 1.0)
+            self.assertOp('BINARY_OP', 1, 2, self.compiler.binary_op_codes['+'])
@@ -0,0 +1,132 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import unittest
+
+from ..compiler import Compiler
+from ..executor import ExecutionError, Executor, HostObject
+from ..lexer import Lexer
+from ..parser import Parser
+from ..tags import standard_tags
+
+
+class Position(object):
+
+    def __init__(self, h):
+        self.h = h
+        self._h = h
+
+
+HostObject.register(Position)
+
+
+class ExecutorTestMixin(object):
+
+    def setUp(self):
+        def error_logger(*info):
+            self.fail('unexpected error in input: ' + repr(info))
+
+        l = self.lexer_class(error_logger)
+        p = self.parser_class(l.tokens, error_logger)
+        lexer = l.build()
+        parser = p.build()
+
+        def compile_wrapper(s, **compiler_options):
+            lexer.lineno = 1  # Reset lineno
+            compiler = self.compiler_class(**compiler_options)
+            return compiler.compile(parser.parse(s, lexer=lexer))
+
+        self.compile = compile_wrapper
+
+    def assertEvaluatesTo(self, expected, s, names=None, tags=None):
+        for specialized_ops in (False, True):
+            ops = self.compile(s, specialized_ops=specialized_ops)
+            executor = self.executor_class(names, tags)
+            self.assertEqual(expected, executor.execute(ops))
+
+
+class TestExecutor(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+    executor_class = Executor
+
+    def test_literals(self):
+        self.assertEvaluatesTo(None, 'null')
+        self.assertEvaluatesTo(True, 'true')
+        self.assertEvaluatesTo(2.5, '2.5')
+        self.assertEvaluatesTo('foo', '"foo"')
+        self.assertEvaluatesTo((1.0, 'a', ()), '[1, "a", []]')
+        self.assertEvaluatesTo(collections.OrderedDict((('a', 1.0),
+                                                        ('b', 2.0))),
+                               '{a: 1, "b": 2}')
+
+    def test_tags(self):
+        self.assertEvaluatesTo(0.25, '250ms', tags={'ms': (lambda v: v/1000)})
+        self.assertEvaluatesTo(250000.0, '250ms', tags=standard_tags)
+        with self.assertRaises(ExecutionError) as cm:
+            self.assertEvaluatesTo(None, '(\n1 + 250ms)')
+        self.assertEqual("Unknown tag: 'ms'", cm.exception.args[0])
+        self.assertEqual((2, 6), (cm.exception.lineno, cm.exception.lexpos))
+
+    def test_names(self):
+        self.assertEvaluatesTo(3.0, 'x', {'x': 3.0})
+        with self.assertRaises(ExecutionError) as cm:
+            self.assertEvaluatesTo(None, 'x + y', {'x': 3.0})
+        self.assertEqual("Undefined name: 'y'", cm.exception.args[0])
+        self.assertEqual((1, 4), (cm.exception.lineno, cm.exception.lexpos))
+
+    def test_arithmetic(self):
+        names = {'a': 7.0, 'b': 2.0}
+        self.assertEvaluatesTo(9.0, 'a + b', names)
+        self.assertEvaluatesTo(5.0, 'a - b', names)
+        self.assertEvaluatesTo(14.0, 'a * b', names)
+        self.assertEvaluatesTo(3.5, 'a / b', names)
+        self.assertEvaluatesTo(1.0, 'a % b', names)
+        self.assertEvaluatesTo(49.0, 'a ** b', names)
+        self.assertEvaluatesTo(-5.0, '-a + +b', names)
+        self.assertEvaluatesTo(False, 'not a', names)
+
+        with self.assertRaises(ExecutionError) as cm:
+            self.assertEvaluatesTo(None, 'a / 0', names)
+        self.assertEqual((1, 2), (cm.exception.lineno, cm.exception.lexpos))
+
+    def test_comparisons(self):
+        names = {'a': 1.0, 'b': 2.0, 'c': (1.0, 2.0)}
+        self.assertEvaluatesTo(True, 'a < b', names)
+        self.assertEvaluatesTo(False, 'a >= b', names)
+        self.assertEvaluatesTo(True, 'a != b', names)
+        self.assertEvaluatesTo(True, 'b in c', names)
+        self.assertEvaluatesTo(False, 'b not in c', names)
+        self.assertEvaluatesTo(True, 'a < b <= 2 == b', names)
+        self.assertEvaluatesTo(False, 'a < b < a', names)
+
+    def test_logical_ops(self):
+        def fail():
+            self.fail('operand should not be evaluated')
+
+        names = {'t': True, 'f': False, 'fail': fail}
+        self.assertEvaluatesTo(True, 't and t and t', names)
+        self.assertEvaluatesTo(False, 't and f and fail()', names)
+        self.assertEvaluatesTo(True, 'f or t or fail()', names)
+        self.assertEvaluatesTo(False, 'f or f', names)
+
+    def test_postfix_exprs(self):
+        names = {
+            'obj': {'items': ('a', 'b', 'c')},
+            'add': (lambda x, y: x + y),
+            }
+        self.assertEvaluatesTo('b', 'obj.items[1]', names)
+        self.assertEvaluatesTo(3.0, 'add(1, 2)', names)
+        self.assertEvaluatesTo(2.0, '{x: 2}.x')
+
+    def test_attributes(self):
+        names = {'p': Position(1.0), 's': 'foo'}
+        self.assertEvaluatesTo(2.0, 'p.h + 1', names)
+        for s, msg in (('s.count', "TypeError: 'str' object does not "
+                                   "support attribute access"),
+                       ('p._h', "AttributeError: 'Position' object has no "
+                                "attribute '_h'")):
+            with self.assertRaises(ExecutionError) as cm:
+                self.assertEvaluatesTo(None, s, names)
+            self.assertEqual(msg, cm.exception.args[0])
@@ -0,0 +1,108 @@
+from __future__ import division, print_function, unicode_literals
+import gc
+import unittest
+import weakref
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from ..executor import ExecutionError, Executor, HostObject
+from ..inline_cache import CacheStats, caching_executor_class
+from .test_executor import TestExecutor
+
+
+class Point(object):
+
+    def __init__(self, x):
+        self.x = x
+
+
+HostObject.register(Point)
+
+
+class TestCachingExecutor(TestExecutor):
+
+    executor_class = caching_executor_class(Executor)
+
+    def test_class(self):
+        self.assertIs(self.executor_class, caching_executor_class(Executor))
+        self.assertTrue(issubclass(self.executor_class, Executor))
+
+    def test_load_attr(self):
+        code = self.compile('p.x')
+        names = {'p': Point(1.0)}
+        executor = self.executor_class(names)
+        self.assertEqual({}, executor.cache_stats())
+
+        for i in range(3):
+            self.assertEqual(1.0, executor.execute(code))
+        self.assertEqual({'LOAD_ATTR': CacheStats(2, 1, 0)},
+                         executor.cache_stats())
+
+        # A different type of target replaces the cached getter
+        names['p'] = {'x': 2.0}
+        self.assertEqual(2.0, executor.execute(code))
+        names['p'] = Point(3.0)
+        self.assertEqual(3.0, executor.execute(code))
+        self.assertEqual({'LOAD_ATTR': CacheStats(2, 3, 0)},
+                         executor.cache_stats())
+        self.assertEqual(1, len(executor.inline_caches))
+
+        executor.clear_caches()
+        self.assertEqual({}, executor.cache_stats())
+
+    def test_lifetime(self):
+        # Caches live as long as their op list, and don't keep the executor
+        # alive
+        executor = self.executor_class({'p': Point(1.0)})
+        code = self.compile('p.x')
+        executor.execute(code)
+        self.assertEqual(1, len(executor.inline_caches))
+        del code
+        gc.collect()
+        self.assertEqual({}, executor.cache_stats())
+
+        code = self.compile('p.x')
+        executor.execute(code)
+        executor_ref = weakref.ref(executor)
+        del executor
+        gc.collect()
+        self.assertIsNone(executor_ref())
+
+        # The next executor to run the op list drops the dead one's caches
+        self.executor_class({'p': Point(2.0)}).execute(code)
+        self.assertEqual(1, len(code.inline_cache_steps))
+
+    def test_invalidation(self):
+        class Record(object):
+            def __init__(self, **fields):
+                self.fields = fields
+            def __getitem__(self, key):
+                return self.fields[key]
+            def __iter__(self):
+                return iter(self.fields)
+            def __len__(self):
+                return len(self.fields)
+
+        HostObject.register(Record)
+        code = self.compile('r.fields')
+        names = {'r': Record(fields=1.0)}
+        executor = self.executor_class(names)
+        self.assertEqual({'fields': 1.0}, executor.execute(code))
+
+        # Once Record is a Mapping, attributes are its items
+        Mapping.register(Record)
+        self.assertEqual(1.0, executor.execute(code))
+        self.assertEqual({'LOAD_ATTR': CacheStats(0, 1, 1)},
+                         executor.cache_stats())
+
+    def test_error_location(self):
+        code = self.compile('(\n1 +\np.y)')
+        with self.assertRaises(ExecutionError) as cm:
+            self.executor_class({'p': Point(1.0)}).execute(code)
+        self.assertEqual("AttributeError: 'Point' object has no attribute "
+                         "'y'",
+                         cm.exception.args[0])
+        self.assertEqual(3, cm.exception.lineno)
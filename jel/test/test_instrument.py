@@ -0,0 +1,44 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+import jel
+import mwel
+from mwel.compiler import Compiler as MWELCompiler
+
+from .. import instrument
+from ..compiler import Compiler
+from ..instrument import PipelineStats
+
+
+class TestInstrument(unittest.TestCase):
+
+    def test_phases(self):
+        measurements = []
+        text = 'a + f(1, [2, 3])'
+        root = jel.parse(text, instrument=measurements.append)
+        self.assertEqual(jel.parse(text), root)
+        code = Compiler(instrument=measurements.append).compile(root)
+        self.assertEqual(Compiler().compile(root), code)
+
+        self.assertEqual(['lex', 'parse', 'compile'],
+                         [m.phase for m in measurements])
+        self.assertEqual([12, 8, 8], [m.count for m in measurements])
+        for m in measurements:
+            self.assertGreaterEqual(m.seconds, 0.0)
+
+    def test_counts(self):
+        root = mwel.parse('function f(x):\n    return x\nend\n')
+        self.assertEqual(5, instrument.count_nodes(root))
+        code = MWELCompiler().compile(root)
+        # MAKE_FUNCTION and STORE_GLOBAL, plus three ops in the body
+        self.assertEqual(5, instrument.count_ops(code))
+
+    def test_stats(self):
+        stats = PipelineStats()
+        for i in range(2):
+            root = mwel.parse('x = 1\n', instrument=stats)
+            MWELCompiler(instrument=stats).compile(root)
+        self.assertEqual({'lex': 2, 'parse': 2, 'compile': 2}, stats.runs)
+        self.assertEqual(8, stats.counts['lex'])
+        self.assertEqual(4, stats.counts['compile'])
+        self.assertEqual(4, len(stats.report().splitlines()))
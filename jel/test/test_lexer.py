@@ -3,7 +3,7 @@ import collections
 from contextlib import contextmanager
 import unittest
 
-from ..lexer import Lexer, MatchString
+from ..lexer import Lexer
 
 
 class LexerTestMixin(object):
@@ -63,11 +63,12 @@ class LexerTestMixin(object):
 
     def assertNumber(self, value, int='', frac='', exp='', tag=''):
         t = self.assertToken('NUMBER', value)
-        self.assertIsInstance(t.value, MatchString)
-        self.assertEqual(int, t.value.int)
-        self.assertEqual(frac, t.value.frac)
-        self.assertEqual(exp, t.value.exp)
-        self.assertEqual(tag, t.value.tag)
+        number = value[:len(value) - len(tag)]
+        self.assertEqual(number, t.number)
+        self.assertTrue(number.startswith(int + ('.' + frac if frac else '')))
+        self.assertTrue(number.endswith(exp))
+        self.assertEqual(not (frac or exp), t.integer)
+        self.assertEqual((tag or None), t.tag)
 
 
 class TestLexer(LexerTestMixin, unittest.TestCase):
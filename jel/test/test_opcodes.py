@@ -0,0 +1,168 @@
+from __future__ import division, print_function, unicode_literals
+import pickle
+import unittest
+
+import jel
+import mwel
+from mwel.compiler import Compiler as MWELCompiler
+
+from .. import ast, opcodes
+from ..compiler import Compiler
+
+
+class TestOpcodes(unittest.TestCase):
+
+    def test_unique_names(self):
+        for names in (opcodes.op_names,
+                      opcodes.binary_op_names,
+                      opcodes.unary_op_names,
+                      opcodes.comparison_op_names):
+            self.assertEqual(len(names), len(set(names)))
+
+    def test_stable_numbering(self):
+        # These numbers are part of the compiled format and must not change
+        # without incrementing opcodes.VERSION
+        self.assertEqual(1, opcodes.VERSION)
+        for name, code in (('APPLY_TAG', 0),
+                           ('LOAD_CONST', 7),
+                           ('LOAD_NAME', 8),
+                           ('UNARY_OP', 12),
+                           ('BUILD_RANGE_ARRAY', 13),
+                           ('STORE_SUBSCR', 34),
+                           ('BINARY_ADD', 35),
+                           ('UNARY_POS', 51),
+                           ('RETURN_CONST', 56),
+                           ('LOAD_GLOBAL_SLOT', 58),
+                           ('WHILE_LOOP', 61)):
+            self.assertEqual(code, opcodes.op_names.index(name))
+
+    def test_shared_codes(self):
+        jel_codes = Compiler.op_codes
+        mwel_codes = MWELCompiler.op_codes
+
+        self.assertIn('LOAD_NAME', jel_codes)
+        self.assertNotIn('LOAD_NAME', mwel_codes)
+        self.assertNotIn('LOAD_GLOBAL', jel_codes)
+
+        for name, code in jel_codes.items():
+            self.assertEqual(opcodes.op_names[code], name)
+            if name != 'LOAD_NAME':
+                self.assertEqual(code, mwel_codes[name])
+        for name, code in mwel_codes.items():
+            self.assertEqual(opcodes.op_names[code], name)
+
+        self.assertEqual(Compiler.binary_op_codes,
+                         MWELCompiler.binary_op_codes)
+        self.assertEqual(Compiler.unary_op_codes,
+                         MWELCompiler.unary_op_codes)
+        self.assertEqual(Compiler.comparison_op_codes,
+                         MWELCompiler.comparison_op_codes)
+
+    def test_version_stamp(self):
+        code = Compiler().compile(ast.NullLiteralExpr(1, 0))
+        self.assertIsInstance(code, opcodes.Code)
+        self.assertEqual(opcodes.VERSION, code.version)
+        self.assertEqual(((Compiler.op_codes['LOAD_CONST'], 1, 0, (None,)),),
+                         code)
+        opcodes.check_version(code)
+
+        code = pickle.loads(pickle.dumps(code, 2))
+        self.assertIsInstance(code, opcodes.Code)
+        opcodes.check_version(code)
+
+        with self.assertRaises(ValueError):
+            opcodes.check_version(opcodes.Code(code, opcodes.VERSION - 1))
+        with self.assertRaises(ValueError):
+            opcodes.check_version(tuple(code))
+
+    def test_stack_effects(self):
+        for name in opcodes.op_names:
+            self.assertIn(name, opcodes.stack_effects)
+        self.assertEqual((3, 1), opcodes.stack_effect('BUILD_ARRAY', (3,)))
+        self.assertEqual((2, 1), opcodes.stack_effect('BUILD_OBJECT',
+                                                      (('a', 'b'),)))
+        self.assertEqual((2, 1), opcodes.stack_effect('BINARY_ADD', ()))
+        self.assertEqual((1, 1), opcodes.stack_effect('UNARY_NOT', ()))
+
+    def test_verify_stack(self):
+        op_codes = Compiler.op_codes
+
+        def op(name, *args):
+            return (op_codes[name], 1, 0, args)
+
+        const = op('LOAD_CONST', 1.0)
+        binary_op = op('BINARY_OP', Compiler.binary_op_codes['+'])
+
+        self.assertEqual(1, opcodes.verify_stack((const,)))
+        self.assertEqual(3, opcodes.verify_stack((const, const, const,
+                                                  op('BUILD_ARRAY', 3))))
+        self.assertEqual(2, opcodes.verify_stack((const, const, binary_op)))
+
+        nested = opcodes.Code((const, const, binary_op))
+        code = opcodes.Code((op('LOGICAL_AND', ((const,), nested)),))
+        self.assertEqual(1, opcodes.verify_stack(code))
+        self.assertEqual(1, code.max_stack_depth)
+        self.assertEqual(2, nested.max_stack_depth)
+
+        with self.assertRaises(opcodes.StackError) as cm:
+            opcodes.verify_stack((const, binary_op))
+        self.assertEqual('BINARY_OP needs 2 stack items, but only 1 available',
+                         cm.exception.args[0])
+
+        with self.assertRaises(opcodes.StackError) as cm:
+            opcodes.verify_stack((op('LOGICAL_OR', ((const, const),)),))
+        self.assertEqual('Op list leaves 2 items on the stack (expected 1)',
+                         cm.exception.args[0])
+
+        with self.assertRaises(opcodes.StackError):
+            opcodes.verify_stack((const,), is_expr=False)
+
+    def test_compiled_stack_depth(self):
+        compiler = Compiler()
+        root = ast.BinaryOpExpr(
+            1, 1,
+            op = '+',
+            operands = (ast.IdentifierExpr(1, 0, value='a'),
+                        ast.BinaryOpExpr(1, 3,
+                                         op = '*',
+                                         operands = (
+                                             ast.IdentifierExpr(1, 2,
+                                                                value='b'),
+                                             ast.IdentifierExpr(1, 4,
+                                                                value='c'),
+                                             ))),
+            )
+        self.assertEqual(3, compiler.compile(root).max_stack_depth)
+
+        root = ast.CallExpr(1, 1,
+                            target = ast.IdentifierExpr(1, 0, value='f'),
+                            args = (root,))
+        code = compiler.compile(root)
+        self.assertEqual(1, code.max_stack_depth)
+        self.assertEqual(3, code[1][3][0][0].max_stack_depth)
+
+    def test_free_names(self):
+        def free_names(package, compiler_class, s):
+            def error_logger(*info):
+                self.fail('unexpected error in input: ' + repr(info))
+
+            l = package.Lexer(error_logger)
+            p = package.Parser(l.tokens, error_logger)
+            root = p.build().parse(s, lexer=l.build())
+            return opcodes.free_names(compiler_class().compile(root))
+
+        self.assertEqual(frozenset(), free_names(jel, Compiler, '1 + 2'))
+        self.assertEqual(frozenset(('a', 'b', 'c', 'f', 'x')),
+                         free_names(jel, Compiler,
+                                    'a < b.x < f(c and not x)[a]'))
+        self.assertEqual(frozenset(('a', 'f', 'g', 'v')),
+                         free_names(mwel, MWELCompiler, """
+local x = a
+y = x
+if (f(x)):
+    local function h(z):
+        return z + v
+    end
+    g(h)
+end
+"""))
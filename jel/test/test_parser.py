@@ -5,6 +5,7 @@ import decimal
 import unittest
 
 from .. import ast
+from ..arrays import PackedArray
 from ..lexer import Lexer
 from ..parser import Parser
 
@@ -38,8 +39,7 @@ class ParserTestMixin(object):
         self.foobar = ast.StringLiteralExpr(value='foobar')
 
         def make_number(value, tag=None):
-            return ast.NumberLiteralExpr(value = decimal.Decimal(value),
-                                         tag = tag)
+            return ast.NumberLiteralExpr(value=int(value), tag=tag)
         self.one = make_number('1')
         self.two = make_number('2')
         self.three = make_number('3')
@@ -102,19 +102,100 @@ class TestParser(ParserTestMixin, unittest.TestCase):
         with self.parse('123') as p:
             self.assertIsInstance(p, ast.NumberLiteralExpr)
             self.assertLocation(p, 1, 0)
-            self.assertIsInstance(p.value, decimal.Decimal)
-            self.assertEqual('123', str(p.value))
-            self.assertEqual(123, int(p.value))
+            self.assertIsInstance(p.value, type(123))
+            self.assertEqual(123, p.value)
             self.assertIsNone(p.tag)
-            
+
+        with self.parse('12345678901234567890123') as p:
+            self.assertEqual(12345678901234567890123, p.value)
+
         with self.parse('1.230E-45ms') as p:
             self.assertIsInstance(p, ast.NumberLiteralExpr)
             self.assertLocation(p, 1, 0)
-            self.assertIsInstance(p.value, decimal.Decimal)
-            self.assertEqual('1.230E-45', str(p.value))
-            self.assertEqual(1.23e-45, float(p.value))
+            self.assertIsInstance(p.value, float)
+            self.assertEqual(1.23e-45, p.value)
             self.assertEqual('ms', p.tag)
 
+        with self.parse('2e3') as p:
+            self.assertIsInstance(p.value, float)
+            self.assertEqual(2000.0, p.value)
+
+    def test_packed_arrays(self):
+        l = self.lexer_class(self.fail)
+        p = self.parser_class(l.tokens, self.fail, packed_arrays=True)
+        lexer = l.build()
+        parser = p.build()
+
+        p = parser.parse('[1, -2.5, +3e2, 4]', lexer=lexer)
+        self.assertIsInstance(p, ast.NumberArrayLiteralExpr)
+        self.assertLocation(p, 1, 0)
+        self.assertIsInstance(p.values, PackedArray)
+        self.assertEqual((1.0, -2.5, 300.0, 4.0), p.values)
+
+        for s in ('[]', '[1, 2ms]', '[1, a]', '[1, "2"]', '[1, [2]]',
+                  '[1, not 2]'):
+            p = parser.parse(s, lexer=lexer)
+            self.assertIsInstance(p, ast.ArrayLiteralExpr)
+
+        p = parser.parse('[1, 1' + '0' * 400 + ']', lexer=lexer)
+        self.assertIsInstance(p, ast.ArrayLiteralExpr)
+
+    def test_share_subtrees(self):
+        l = self.lexer_class(self.fail)
+        p = self.parser_class(l.tokens, self.fail, share_subtrees=True)
+        lexer = l.build()
+        parser = p.build()
+
+        p = parser.parse('[w / 2, (w / 2), {a: 1}, {a: 1}, w / 2.0, w < 2, '
+                         'w < 2, f(w), f(w), 1ms, 1s]',
+                         lexer=lexer)
+        items = p.items
+        self.assertIs(items[0], items[1])
+        self.assertIs(items[2], items[3])
+        self.assertIs(items[0].operands[0], items[4].operands[0])
+
+        # Int and float literals are never shared
+        self.assertIsNot(items[0], items[4])
+        self.assertIsInstance(items[0].operands[1].value, int)
+        self.assertIsInstance(items[4].operands[1].value, float)
+
+        # Comparisons and calls are never shared, but their operands are
+        self.assertIsNot(items[5], items[6])
+        self.assertEqual(items[5], items[6])
+        self.assertIs(items[5].operands[0], items[0].operands[0])
+        self.assertIsNot(items[7], items[8])
+        self.assertIs(items[7].args[0], items[0].operands[0])
+
+        self.assertIsNot(items[9], items[10])
+
+        # A shared node keeps the location of its first occurrence
+        self.assertLocation(items[1], 1, 3)
+
+        # Nodes aren't shared across parses of different texts, since
+        # their locations would be wrong
+        p = parser.parse('1 +       foo', lexer=lexer)
+        q = parser.parse('foo', lexer=lexer)
+        self.assertIsNot(p.operands[1], q)
+        self.assertLocation(p.operands[1], 1, 10)
+        self.assertLocation(q, 1, 0)
+        self.assertIsNot(items[0], parser.parse('w / 2', lexer=lexer))
+
+    def test_decimal_numbers(self):
+        l = self.lexer_class(self.fail)
+        p = self.parser_class(l.tokens, self.fail, decimal_numbers=True)
+        lexer = l.build()
+        parser = p.build()
+
+        p = parser.parse('123', lexer=lexer)
+        self.assertIsInstance(p.value, decimal.Decimal)
+        self.assertEqual('123', str(p.value))
+        self.assertIsNone(p.tag)
+
+        p = parser.parse('1.230E-45ms', lexer=lexer)
+        self.assertIsInstance(p.value, decimal.Decimal)
+        self.assertEqual('1.230E-45', str(p.value))
+        self.assertEqual('ms', p.tag)
+
     def test_string_literal_expr(self):
         with self.parse('"foo bar\\nblah"') as p:
             self.assertIsInstance(p, ast.StringLiteralExpr)
@@ -147,6 +228,7 @@ class TestParser(ParserTestMixin, unittest.TestCase):
         test_array('[true, false,]', true_lit, false_lit)
         test_array('[true, false, null]', true_lit, false_lit, null_lit)
         test_array('[true, false, null,]', true_lit, false_lit, null_lit)
+        test_array('[%s]' % ', '.join(['null'] * 20000), *([null_lit] * 20000))
 
         with self.parse('[,]'):
             self.assertError(token=',')
@@ -0,0 +1,105 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from mwel.compiler import Compiler as MWELCompiler
+from mwel.lexer import Lexer as MWELLexer
+from mwel.linker import Linker
+from mwel.parser import Parser as MWELParser
+from mwel.peephole import Optimizer
+
+from .. import pool
+from ..compiler import Compiler
+from ..lexer import Lexer
+from ..parser import Parser
+
+
+class TestPool(unittest.TestCase):
+
+    def compile(self, s, language='jel'):
+        def error_logger(*info):
+            self.fail('unexpected error in input: ' + repr(info))
+
+        if language == 'jel':
+            classes = (Lexer, Parser, Compiler)
+        else:
+            classes = (MWELLexer, MWELParser, MWELCompiler)
+
+        l = classes[0](error_logger)
+        p = classes[1](l.tokens, error_logger)
+        return classes[2]().compile(p.build().parse(s, lexer=l.build()))
+
+    def test_pack(self):
+        code = self.compile('f(a.value, {value: 1, x: true}, a.value > 1, -0)')
+        packed = pool.pack(code)
+
+        self.assertEqual((1.0, True, ('value', 'x'), 0.0), packed.consts)
+        self.assertEqual(('f', 'a', 'value'), packed.names)
+
+        # Nested op lists share the pools of the outermost code object
+        args = packed[1][3][0]
+        for arg in args:
+            self.assertIs(packed.consts, arg.consts)
+            self.assertIs(packed.names, arg.names)
+
+        load_attr = args[0][1]
+        self.assertEqual((2,), load_attr[3])
+        self.assertEqual(code.max_stack_depth, packed.max_stack_depth)
+        self.assertEqual(code.version, packed.version)
+
+        self.assertEqual(pool.PoolStats(num_ops = 13,
+                                        num_const_refs = 5,
+                                        num_consts = 4,
+                                        num_name_refs = 5,
+                                        num_names = 3),
+                         pool.pool_stats(packed))
+
+    def test_unpack(self):
+        code = self.compile('''
+            local x = [1, "a"]
+            function foo(a, b):
+                return a.value + b.value + x
+            end
+            if (foo(1, x) > -0.0):
+                y = {value: 3, 'x': 4}
+            else:
+                y = foo(b=1, a=2)
+            end
+            ''', 'mwel')
+        unpacked = pool.unpack(pool.pack(code))
+        self.assertEqual(code, unpacked)
+        self.assertEqual(code.max_stack_depth, unpacked.max_stack_depth)
+
+        # Equal names are shared
+        func = unpacked[4][3][1]
+        self.assertEqual('value', func[3][3][0])
+        self.assertIs(func[3][3][0], func[5][3][0])
+
+    def test_array_values(self):
+        # Lazy arrays are pooled by identity, without materializing them
+        code = Optimizer().optimize(self.compile(
+            'x = [0:1e12]\ny = [0:1e12]\nz = [[1:1e12], 2]\n',
+            'mwel',
+            ))
+        packed = pool.pack(code)
+        self.assertEqual(3, len(packed.consts))
+        self.assertIs(code[0][3][0], packed.consts[0])
+        self.assertEqual(10**12 + 1, len(packed.consts[1]))
+
+    def test_linked_code(self):
+        code = self.compile('x = 1\ny = x + x\nx.a = y\n', 'mwel')
+        linked = Linker().link([code]).modules[0]
+        packed = pool.pack(linked)
+
+        # Global slot ops keep their slot index after the name index
+        self.assertEqual(('x', 'y', 'a'), packed.names)
+        self.assertEqual((1, 1), packed[5][3])
+        self.assertEqual(pool.PoolStats(num_ops = 9,
+                                        num_const_refs = 1,
+                                        num_consts = 1,
+                                        num_name_refs = 7,
+                                        num_names = 3),
+                         pool.pool_stats(packed))
+
+        unpacked = pool.unpack(packed)
+        self.assertEqual(linked, unpacked)
+        self.assertIs(unpacked[1][3][0], unpacked[2][3][0])
@@ -0,0 +1,96 @@
+from __future__ import division, print_function, unicode_literals
+import itertools
+import unittest
+
+from mwel.compiler import Compiler as MWELCompiler
+from mwel.executor import Executor as MWELExecutor
+from mwel.lexer import Lexer as MWELLexer
+from mwel.parser import Parser as MWELParser
+
+from ..compiler import Compiler
+from ..executor import ExecutionError, Executor
+from ..lexer import Lexer
+from ..parser import Parser
+from ..profiler import Profiler, profiling_executor_class
+from .test_executor import ExecutorTestMixin
+
+
+class TestProfiler(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+
+    def test_counts(self):
+        executor_class = profiling_executor_class(Executor)
+        self.assertIs(executor_class, profiling_executor_class(Executor))
+        self.assertTrue(issubclass(executor_class, Executor))
+
+        code = self.compile('a + 1 < 3 and a > 0')
+        executor = executor_class({'a': 1.0})
+        for i in range(3):
+            self.assertEqual(True, executor.execute(code))
+
+        op_stats = dict((Compiler.op_names[c], s[0]) for c, s in
+                        executor.profiler.op_stats.items())
+        self.assertEqual({'LOGICAL_AND': 3,
+                          'COMPARE_OP': 6,
+                          'LOAD_NAME': 6,
+                          'LOAD_CONST': 9,
+                          'BINARY_OP': 3},
+                         op_stats)
+        # The binary op at lexpos 2
+        self.assertEqual(3, executor.profiler.location_stats[(1, 2)][0])
+
+        report = executor.profile_report(source='a + 1 < 3 and a > 0')
+        self.assertIn('LOAD_CONST', report)
+        self.assertIn('line 1, column 3', report)
+
+    def test_exclusive_times(self):
+        # Each call to the timer advances one second
+        ticks = itertools.count()
+        profiler = Profiler(timer=(lambda: next(ticks)))
+        code = self.compile('x or y')
+        executor = profiling_executor_class(Executor)({'x': 0.0, 'y': 1.0},
+                                                      profiler=profiler)
+        self.assertEqual(True, executor.execute(code))
+
+        logical_or = profiler.op_stats[Compiler.op_codes['LOGICAL_OR']]
+        load_name = profiler.op_stats[Compiler.op_codes['LOAD_NAME']]
+        self.assertEqual([2, 2], load_name)
+        # The LOGICAL_OR op spans 9 ticks, 6 of which are spent in its
+        # operands' op lists (including their bookkeeping)
+        self.assertEqual([1, 3], logical_or)
+
+    def test_errors(self):
+        executor = profiling_executor_class(Executor)()
+        with self.assertRaises(ExecutionError) as cm:
+            executor.execute(self.compile('1 + x'))
+        self.assertEqual((1, 4), (cm.exception.lineno, cm.exception.lexpos))
+        self.assertEqual(1, executor.profiler.location_stats[(1, 4)][0])
+
+    def test_mwel(self):
+        self.lexer_class = MWELLexer
+        self.parser_class = MWELParser
+        self.compiler_class = MWELCompiler
+        self.setUp()
+
+        code = self.compile('''
+function f(x):
+    return x * 2
+end
+total = 0
+i = 0
+while (i < 10):
+    total = total + f(i)
+    i = i + 1
+end
+''')
+        executor = profiling_executor_class(MWELExecutor)()
+        executor.run(code)
+        self.assertEqual(90.0, executor.names['total'])
+
+        # Ops in the function body and the while clause are aggregated
+        location_stats = executor.profiler.location_stats
+        self.assertEqual(10, location_stats[(3, 29)][0])  # x * 2
+        self.assertEqual(10, location_stats[(8, 90)][0])  # f(i)
@@ -0,0 +1,118 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from ..codegen import PythonExecutor
+from ..compiler import Compiler
+from ..executor import ExecutionError, Executor
+from ..lexer import Lexer
+from ..parser import Parser
+from ..results import ResultCache, Variables
+from .test_executor import ExecutorTestMixin
+
+
+class TestVariables(unittest.TestCase):
+
+    def test_versions(self):
+        v = Variables(a=1.0)
+        self.assertEqual(1.0, v['a'])
+        self.assertEqual(0, v.name_version('b'))
+        a_version = v.name_version('a')
+        self.assertEqual(a_version, v.version)
+
+        v['b'] = 2.0
+        self.assertEqual(a_version, v.name_version('a'))
+        self.assertGreater(v.name_version('b'), a_version)
+        self.assertEqual(v.name_version('b'), v.version)
+
+        # Assigning an equal value isn't a change
+        version = v.version
+        v['a'] = 1.0
+        self.assertEqual(a_version, v.name_version('a'))
+        self.assertEqual(version, v.version)
+        v['a'] = 1
+        self.assertGreater(v.name_version('a'), version)
+
+        version = v.version
+        del v['b']
+        self.assertNotIn('b', v)
+        self.assertGreater(v.name_version('b'), version)
+        self.assertEqual(['a'], list(v))
+
+
+class TestResultCache(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+
+    def test_invalidation(self):
+        for executor_class in (Executor, PythonExecutor):
+            variables = Variables(a=1.0, b=2.0, c=3.0)
+            cache = ResultCache(executor_class(variables))
+            ab = self.compile('a + b')
+            bc = self.compile('b * c')
+
+            self.assertEqual(3.0, cache.evaluate(ab))
+            self.assertEqual(6.0, cache.evaluate(bc))
+            self.assertEqual(3.0, cache.evaluate(ab))
+            self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+            variables['c'] = 4.0
+            self.assertEqual(3.0, cache.evaluate(ab))
+            self.assertEqual(8.0, cache.evaluate(bc))
+            self.assertEqual((2, 3), (cache.hits, cache.misses))
+
+            variables['b'] = 2.0
+            variables['d'] = 0.0
+            self.assertEqual(3.0, cache.evaluate(ab))
+            self.assertEqual(8.0, cache.evaluate(bc))
+            self.assertEqual((4, 3), (cache.hits, cache.misses))
+
+            variables['b'] = 0.0
+            self.assertEqual(1.0, cache.evaluate(ab))
+            self.assertEqual(0.0, cache.evaluate(bc))
+            self.assertEqual((4, 5), (cache.hits, cache.misses))
+
+            cache.discard(ab)
+            self.assertEqual(1.0, cache.evaluate(ab))
+            self.assertEqual((4, 6), (cache.hits, cache.misses))
+
+            cache.clear()
+            self.assertEqual((0, 0), (cache.hits, cache.misses))
+
+    def test_max_entries(self):
+        cache = ResultCache(Executor(Variables(a=1.0)), max_entries=2)
+        codes = [self.compile('a + %d' % i) for i in range(3)]
+
+        cache.evaluate(codes[0])
+        cache.evaluate(codes[1])
+        cache.evaluate(codes[0])
+        cache.evaluate(codes[2])
+        self.assertEqual((1, 3, 1), (cache.hits, cache.misses,
+                                     cache.evictions))
+        self.assertEqual(2, len(cache._entries))
+        self.assertEqual(2, len(cache._dependencies))
+
+        # The least recently used result was evicted
+        self.assertEqual(1.0, cache.evaluate(codes[0]))
+        self.assertEqual(2.0, cache.evaluate(codes[1]))
+        self.assertEqual((2, 4, 2), (cache.hits, cache.misses,
+                                     cache.evictions))
+
+    def test_errors(self):
+        variables = Variables(a=1.0)
+        cache = ResultCache(Executor(variables))
+        code = self.compile('a / b')
+        for i in range(2):
+            with self.assertRaises(ExecutionError):
+                cache.evaluate(code)
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+        variables['b'] = 2.0
+        self.assertEqual(0.5, cache.evaluate(code))
+        self.assertEqual(0.5, cache.evaluate(code))
+        self.assertEqual((1, 3), (cache.hits, cache.misses))
+
+    def test_names_type(self):
+        with self.assertRaises(TypeError):
+            ResultCache(Executor({'a': 1.0}))
@@ -0,0 +1,34 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from ..tags import TagTable, scale, standard_tags
+
+
+class TestTagTable(unittest.TestCase):
+
+    def test_convert(self):
+        calls = []
+        def double(value):
+            calls.append(value)
+            return 2 * value
+
+        tags = TagTable({'x': double})
+        self.assertIn('x', tags)
+        self.assertNotIn('y', tags)
+        self.assertIs(double, tags['x'])
+
+        self.assertEqual(4.0, tags.convert(2.0, 'x'))
+        self.assertEqual(4.0, tags.convert(2.0, 'x'))
+        self.assertEqual(6.0, tags.convert(3.0, 'x'))
+        self.assertEqual([2.0, 3.0], calls)
+
+        # Re-registering a tag discards its cached conversions
+        tags.register('x', scale(10))
+        self.assertEqual(20.0, tags.convert(2.0, 'x'))
+
+    def test_standard_tags(self):
+        self.assertEqual(160000.0, standard_tags.convert(160.0, 'ms'))
+        self.assertEqual(2000000.0, standard_tags.convert(2.0, 's'))
+        self.assertEqual(5.0, standard_tags.convert(5.0, 'us'))
+        self.assertAlmostEqual(180.0, standard_tags.convert(3.141592653589793,
+                                                            'rad'))
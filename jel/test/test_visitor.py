@@ -0,0 +1,165 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from .. import ast
+from ..lexer import Lexer
+from ..parser import Parser
+from ..visitor import NodeTransformer, NodeVisitor, iter_child_nodes, walk
+
+
+class VisitorTestMixin(object):
+
+    def setUp(self):
+        def error_logger(*info):
+            self.fail('unexpected error in input: ' + repr(info))
+
+        l = Lexer(error_logger)
+        p = Parser(l.tokens, error_logger)
+        lexer = l.build()
+        parser = p.build()
+
+        def parse(s):
+            lexer.lineno = 1  # Reset lineno
+            return parser.parse(s, lexer=lexer)
+
+        self.parse = parse
+
+
+class TestWalk(VisitorTestMixin, unittest.TestCase):
+
+    def names(self, nodes):
+        return [(type(n).__name__[:-4] if not isinstance(n,
+                                                         ast.IdentifierExpr)
+                 else n.value)
+                for n in nodes]
+
+    def test_iter_child_nodes(self):
+        root = self.parse('f(a, b)')
+        self.assertEqual(['f', 'a', 'b'],
+                         self.names(iter_child_nodes(root)))
+
+        root = self.parse('{"x": a, "y": [b, 1]}')
+        self.assertEqual(['a', 'ArrayLiteral'],
+                         self.names(iter_child_nodes(root)))
+
+        # Fields that aren't child fields are ignored
+        root = ast.NumberLiteralExpr(value=ast.IdentifierExpr(value='a'),
+                                     tag=None)
+        self.assertEqual([], list(iter_child_nodes(root)))
+
+    def test_walk(self):
+        root = self.parse('a + f(b, -c) * d.e')
+        self.assertEqual(['BinaryOp', 'a', 'BinaryOp', 'Call', 'f', 'b',
+                          'UnaryOp', 'c', 'Attribute', 'd'],
+                         self.names(walk(root)))
+        self.assertEqual(['a', 'f', 'b', 'c', 'UnaryOp', 'Call', 'd',
+                          'Attribute', 'BinaryOp', 'BinaryOp'],
+                         self.names(walk(root, postorder=True)))
+
+    def test_deep_tree(self):
+        # Deeper than Python's recursion limit
+        depth = 5000
+        root = ast.IdentifierExpr(value='a')
+        for i in range(depth):
+            root = ast.UnaryOpExpr(op='-', operand=root)
+
+        self.assertEqual(depth + 1, len(list(walk(root))))
+        self.assertEqual(depth + 1, len(list(walk(root, postorder=True))))
+
+
+class TestNodeVisitor(VisitorTestMixin, unittest.TestCase):
+
+    def test_visit(self):
+        events = []
+
+        class Visitor(NodeVisitor):
+            def visit_IdentifierExpr(self, node):
+                events.append(node.value)
+            def visit_CallExpr(self, node):
+                events.append('call')
+            def leave_CallExpr(self, node):
+                events.append('end call')
+            def visit_AttributeExpr(self, node):
+                # Skip children
+                return False
+            def leave_AttributeExpr(self, node):
+                events.append('never called')
+
+        Visitor().visit(self.parse('f(a, g(b)) + c.d + e'))
+        self.assertEqual(['call', 'f', 'a', 'call', 'g', 'b', 'end call',
+                          'end call', 'e'],
+                         events)
+
+
+class TestNodeTransformer(VisitorTestMixin, unittest.TestCase):
+
+    def test_no_changes(self):
+        root = self.parse('f(a, [1, 2], {"x": b})')
+        self.assertIs(root, NodeTransformer().transform(root))
+
+    def test_transform(self):
+        class Renamer(NodeTransformer):
+            def transform_IdentifierExpr(self, node):
+                if node.value == 'a':
+                    return ast.IdentifierExpr(node.lineno,
+                                              node.lexpos,
+                                              value = 'z')
+                return node
+
+        root = self.parse('f(a, b, {"x": a}) + c')
+        orig_root = self.parse('f(a, b, {"x": a}) + c')
+        result = Renamer().transform(root)
+
+        self.assertEqual(self.parse('f(z, b, {"x": z}) + c'), result)
+        self.assertEqual(orig_root, root)
+
+        # Unchanged subtrees are shared
+        self.assertIsNot(root, result)
+        self.assertIs(root.operands[1], result.operands[1])
+        self.assertIs(root.operands[0].target, result.operands[0].target)
+        self.assertEqual(root.operands[0].lineno, result.operands[0].lineno)
+
+    def test_remove(self):
+        class Remover(NodeTransformer):
+            def transform_NullLiteralExpr(self, node):
+                return None
+
+        result = Remover().transform(
+            self.parse('[1, null, {"x": null, "y": 2}]'))
+        self.assertEqual(self.parse('[1, {"y": 2}]'), result)
+
+        result = Remover().transform(self.parse('-null'))
+        self.assertIsNone(result.operand)
+
+    def test_bottom_up(self):
+        class Folder(NodeTransformer):
+            def transform_BinaryOpExpr(self, node):
+                left, right = node.operands
+                if (isinstance(left, ast.NumberLiteralExpr) and
+                    isinstance(right, ast.NumberLiteralExpr) and
+                    node.op == '+'):
+                    return ast.NumberLiteralExpr(node.lineno,
+                                                 node.lexpos,
+                                                 value = (left.value +
+                                                          right.value),
+                                                 tag = None)
+                return node
+
+        result = Folder().transform(self.parse('1 + 2 + 3 + a'))
+        self.assertEqual(self.parse('6 + a'), result)
+
+    def test_deep_tree(self):
+        # Deeper than Python's recursion limit
+        depth = 5000
+        root = ast.IdentifierExpr(value='a')
+        for i in range(depth):
+            root = ast.UnaryOpExpr(op='-', operand=root)
+
+        class Renamer(NodeTransformer):
+            def transform_IdentifierExpr(self, node):
+                return ast.IdentifierExpr(value='b')
+
+        result = Renamer().transform(root)
+        for i in range(depth):
+            result = result.operand
+        self.assertEqual('b', result.value)
@@ -0,0 +1,184 @@
+from __future__ import division, print_function, unicode_literals
+import copy
+
+from .ast import AST, _field_plan
+
+
+#
+# Generic traversal of JEL and MWEL syntax trees.  Only the fields listed in
+# each class's _child_fields are searched for child nodes, and nothing here
+# recurses, so trees of any depth can be walked and transformed.
+#
+
+
+def iter_child_nodes(node):
+    """Yields the direct children of `node`, in field order"""
+    for field in _field_plan(type(node))[1]:
+        value = getattr(node, field)
+        if isinstance(value, AST):
+            yield value
+        elif isinstance(value, (tuple, list)):
+            for item in value:
+                if isinstance(item, AST):
+                    yield item
+        elif isinstance(value, dict):
+            for item in value.values():
+                if isinstance(item, AST):
+                    yield item
+
+
+def walk(root, postorder=False):
+    """
+    Yields `root` and all its descendants, depth first and in field order.
+    Each node is yielded before its children, or after them if `postorder`
+    is true.
+    """
+    if not postorder:
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            yield node
+            pending.extend(reversed(tuple(iter_child_nodes(node))))
+    else:
+        pending = [(root, False)]
+        while pending:
+            node, expanded = pending.pop()
+            if expanded:
+                yield node
+            else:
+                pending.append((node, True))
+                pending.extend((child, False) for child in
+                               reversed(tuple(iter_child_nodes(node))))
+
+
+class _HandlerCache(object):
+
+    # Looks up and caches the handler methods, named prefix + class name,
+    # for each node class
+
+    _handlers = None
+
+    def _handler(self, prefix, cls):
+        handlers = self._handlers
+        if handlers is None:
+            handlers = self._handlers = {}
+        key = (prefix, cls)
+        try:
+            return handlers[key]
+        except KeyError:
+            handler = handlers[key] = getattr(self,
+                                              prefix + cls.__name__,
+                                              None)
+            return handler
+
+
+class NodeVisitor(_HandlerCache):
+
+    """
+    Base class for read-only passes over a syntax tree.
+
+    visit() walks the tree depth first, calling visit_<ClassName>(node)
+    (if defined) on each node before its children and
+    leave_<ClassName>(node) (if defined) after them.  If a visit_ method
+    returns False, the node's children (and its leave_ method) are
+    skipped.
+    """
+
+    def visit(self, root):
+        handler = self._handler
+        pending = [(root, False)]
+        while pending:
+            node, leaving = pending.pop()
+            cls = type(node)
+            if leaving:
+                handler('leave_', cls)(node)
+                continue
+
+            enter = handler('visit_', cls)
+            if (enter is not None) and (enter(node) is False):
+                continue
+            if handler('leave_', cls) is not None:
+                pending.append((node, True))
+            pending.extend((child, False) for child in
+                           reversed(tuple(iter_child_nodes(node))))
+
+
+class NodeTransformer(_HandlerCache):
+
+    """
+    Base class for passes that rewrite a syntax tree.
+
+    transform() rebuilds the tree bottom up.  Each node's children are
+    transformed first; if any of them changed, the node is copied with the
+    new children.  Then transform_<ClassName>(node) (if defined) is called,
+    and its return value replaces the node.  Returning None removes the
+    node from a sequence or mapping of nodes, or sets a single-node field
+    to None.
+
+    The input tree is never modified.  A node shared by several parents is
+    transformed once.
+    """
+
+    def transform(self, root):
+        results = {}
+        pending = [(root, False)]
+        while pending:
+            node, ready = pending.pop()
+            if ready:
+                results[id(node)] = self._transform_node(node, results)
+            elif id(node) not in results:
+                pending.append((node, True))
+                pending.extend((child, False) for child in
+                               reversed(tuple(iter_child_nodes(node))))
+        return results[id(root)]
+
+    def _transform_node(self, node, results):
+        changes = []
+        for field in _field_plan(type(node))[1]:
+            value = getattr(node, field)
+            new_value = self._replace_children(value, results)
+            if new_value is not value:
+                changes.append((field, new_value))
+
+        if changes:
+            node = copy.copy(node)
+            for field, new_value in changes:
+                setattr(node, field, new_value)
+
+        transform = self._handler('transform_', type(node))
+        if transform is None:
+            return node
+        return transform(node)
+
+    @staticmethod
+    def _replace_children(value, results):
+        if isinstance(value, AST):
+            return results[id(value)]
+
+        if isinstance(value, (tuple, list)):
+            items = []
+            changed = False
+            for item in value:
+                if isinstance(item, AST):
+                    new_item = results[id(item)]
+                    changed = changed or (new_item is not item)
+                    if new_item is None:
+                        continue
+                    item = new_item
+                items.append(item)
+            return (type(value)(items) if changed else value)
+
+        if isinstance(value, dict):
+            items = []
+            changed = False
+            for key, item in value.items():
+                if isinstance(item, AST):
+                    new_item = results[id(item)]
+                    changed = changed or (new_item is not item)
+                    if new_item is None:
+                        continue
+                    item = new_item
+                items.append((key, item))
+            return (type(value)(items) if changed else value)
+
+        return value
@@ -0,0 +1,96 @@
+
+# yacctab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ADDITIVEOP AND COLON COMMA COMPARISONOP DOT FALSE IDENTIFIER IN LBRACE LBRACKET LPAREN MULTIPLICATIVEOP NEWLINE NOT NULL NUMBER OR POWER RBRACE RBRACKET RPAREN STRING TRUE\n        expr : or_expr\n        \n        or_expr : or_expr OR and_expr\n        \n        or_expr : and_expr\n        \n        and_expr : and_expr AND not_expr\n        \n        and_expr : not_expr\n        \n        not_expr : NOT not_expr\n                 | comparison_expr\n        \n        comparison_expr : comparison_expr COMPARISONOP additive_expr\n        \n        comparison_expr : comparison_expr IN additive_expr\n        \n        comparison_expr : comparison_expr NOT IN additive_expr\n        \n        comparison_expr : additive_expr\n        \n        additive_expr : additive_expr ADDITIVEOP multiplicative_expr\n                      | multiplicative_expr\n        \n        multiplicative_expr : multiplicative_expr MULTIPLICATIVEOP unary_expr\n                            | unary_expr\n        \n        unary_expr : ADDITIVEOP unary_expr\n                   | exponentiation_expr\n        \n        exponentiation_expr : postfix_expr POWER unary_expr\n                            | postfix_expr\n        \n        postfix_expr : call_expr\n                     | subscript_expr\n                     | attribute_expr\n                     | primary_expr\n        \n        call_expr : postfix_expr LPAREN call_arg_list RPAREN\n        \n        call_arg_list : expr_list\n        \n        expr_list : expr_list_items\n                  | expr_list_items COMMA\n                  | empty\n        \n        expr_list_items : expr_list_items COMMA expr\n                        | expr\n        \n        subscript_expr : postfix_expr LBRACKET expr RBRACKET\n        \n        attribute_expr : postfix_expr DOT identifier_expr\n        \n        primary_expr : parenthetic_expr\n                     | literal_expr\n                     | identifier_expr\n        \n        parenthetic_expr : LPAREN expr RPAREN\n        \n        literal_expr : object_literal_expr\n                     | array_literal_expr\n                     | string_literal_expr\n                     | number_literal_expr\n                     | boolean_literal_expr\n                     | null_literal_expr\n        \n        object_literal_expr : LBRACE object_item_list RBRACE\n        \n        object_item_list : object_item_list_items\n                         | object_item_list_items COMMA\n                         | empty\n        \n        object_item_list_items : object_item_list_items COMMA object_item\n                               | object_item\n        \n        object_item : object_key COLON expr\n        \n        object_key : string_literal_expr\n                   | identifier_expr\n        \n        array_literal_expr : LBRACKET array_item_list RBRACKET\n        \n        array_item_list : array_item_list_items\n                        | array_item_list_items COMMA\n                        | empty\n        \n        array_item_list_items : array_item_list_items COMMA array_item\n                              | array_item\n        \n        array_item : expr\n        \n        string_literal_expr : STRING string_literal_expr\n                            | STRING\n        \n        number_literal_expr : NUMBER\n        \n        boolean_literal_expr : TRUE\n                             | FALSE\n        \n        null_literal_expr : NULL\n        \n        identifier_expr : IDENTIFIER\n        \n        empty :\n        '
+    
+_lr_action_items = {'NOT':([0,5,6,7,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,42,45,46,61,64,65,67,68,69,76,77,78,79,80,82,83,84,85,86,],[5,5,40,-11,-13,-15,-17,-19,-20,-21,-22,-23,5,5,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,5,5,-16,5,5,-59,-8,-9,-12,-14,-18,-32,-36,-52,5,-43,5,-10,-24,5,-31,]),'ADDITIVEOP':([0,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,38,39,41,42,43,44,45,46,61,64,65,66,67,68,69,76,77,78,79,80,82,83,84,85,86,],[8,8,41,8,-13,-15,-17,-19,-20,-21,-22,-23,8,8,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,8,8,8,8,8,-16,8,8,8,8,-59,41,41,8,-12,-14,-18,-32,-36,-52,8,-43,8,41,-24,8,-31,]),'LPAREN':([0,5,8,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,38,39,41,43,44,45,46,61,66,76,77,78,79,80,82,84,85,86,],[17,17,17,45,-20,-21,-22,-23,17,17,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,17,17,17,17,17,17,17,17,17,-59,17,-32,-36,-52,17,-43,17,-24,17,-31,]),'IDENTIFIER':([0,5,8,17,18,29,35,36,38,39,41,43,44,45,46,47,66,79,81,82,85,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'LBRACE':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'LBRACKET':([0,5,8,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,38,39,41,43,44,45,46,61,66,76,77,78,79,80,82,84,85,86,],[18,18,18,46,-20,-21,-22,-23,18,18,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,18,18,18,18,18,18,18,18,18,-59,18,-32,-36,-52,18,-43,18,-24,18,-31,]),'STRING':([0,5,8,17,18,29,30,35,36,38,39,41,43,44,45,46,66,79,81,82,85,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'NUMBER':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'TRUE':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'FALSE':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'NULL':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'$end':([1,2,3,4,6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,42,61,62,63,64,65,67,68,69,76,77,78,80,83,84,86,],[0,-1,-3,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-6,-16,-59,-2,-4,-8,-9,-12,-14,-18,-32,-36,-52,-43,-10,-24,-31,]),'RPAREN':([2,3,4,6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,42,45,48,61,62,63,64,65,67,68,69,70,71,72,73,74,76,77,78,80,83,84,85,86,90,],[-1,-3,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-6,-16,-66,77,-59,-2,-4,-8,-9,-12,-14,-18,84,-25,-26,-28,-30,-32,-36,-52,-43,-10,-24,-27,-31,-29,]),'COMMA':([2,3,4,6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,42,50,52,53,55,57,61,62,63,64,65,67,68,69,72,74,76,77,78,80,83,84,86,87,88,89,90,],[-1,-3,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-6,-16,79,-57,-58,81,-48,-59,-2,-4,-8,-9,-12,-14,-18,85,-30,-32,-36,-52,-43,-10,-24,-31,-56,-47,-49,-29,]),'RBRACKET':([2,3,4,6,7,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,42,49,50,51,52,53,61,62,63,64,65,67,68,69,75,76,77,78,79,80,83,84,86,87,],[-1,-3,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-66,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-6,-16,78,-53,-55,-57,-58,-59,-2,-4,-8,-9,-12,-14,-18,86,-32,-36,-52,-54,-43,-10,-24,-31,-56,]),'RBRACE':([2,3,4,6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,37,42,54,55,56,57,61,62,63,64,65,67,68,69,76,77,78,80,81,83,84,86,88,89,],[-1,-3,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-66,-60,-61,-62,-63,-64,-6,-16,80,-44,-46,-48,-59,-2,-4,-8,-9,-12,-14,-18,-32,-36,-52,-43,-45,-10,-24,-31,-47,-49,]),'OR':([2,3,4,6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,42,61,62,63,64,65,67,68,69,76,77,78,80,83,84,86,],[35,-3,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-6,-16,-59,-2,-4,-8,-9,-12,-14,-18,-32,-36,-52,-43,-10,-24,-31,]),'AND':([3,4,6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,37,42,61,62,63,64,65,67,68,69,76,77,78,80,83,84,86,],[36,-5,-7,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-6,-16,-59,36,-4,-8,-9,-12,-14,-18,-32,-36,-52,-43,-10,-24,-31,]),'COMPARISONOP':([6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,42,61,64,65,67,68,69,76,77,78,80,83,84,86,],[38,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-16,-59,-8,-9,-12,-14,-18,-32,-36,-52,-43,-10,-24,-31,]),'IN':([6,7,9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,40,42,61,64,65,67,68,69,76,77,78,80,83,84,86,],[39,-11,-13,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,66,-16,-59,-8,-9,-12,-14,-18,-32,-36,-52,-43,-10,-24,-31,]),'MULTIPLICATIVEOP':([9,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,42,61,67,68,69,76,77,78,80,84,86,],[43,-15,-17,-19,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-16,-59,43,-14,-18,-32,-36,-52,-43,-24,-31,]),'POWER':([12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,61,76,77,78,80,84,86,],[44,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-59,-32,-36,-52,-43,-24,-31,]),'DOT':([12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,61,76,77,78,80,84,86,],[47,-20,-21,-22,-23,-35,-33,-34,-37,-38,-39,-40,-41,-42,-65,-60,-61,-62,-63,-64,-59,-32,-36,-52,-43,-24,-31,]),'COLON':([28,30,58,59,60,61,],[-65,-60,82,-50,-51,-59,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expr':([0,17,18,45,46,79,82,85,],[1,48,53,74,75,53,89,90,]),'or_expr':([0,17,18,45,46,79,82,85,],[2,2,2,2,2,2,2,2,]),'and_expr':([0,17,18,35,45,46,79,82,85,],[3,3,3,62,3,3,3,3,3,]),'not_expr':([0,5,17,18,35,36,45,46,79,82,85,],[4,37,4,4,4,63,4,4,4,4,4,]),'comparison_expr':([0,5,17,18,35,36,45,46,79,82,85,],[6,6,6,6,6,6,6,6,6,6,6,]),'additive_expr':([0,5,17,18,35,36,38,39,45,46,66,79,82,85,],[7,7,7,7,7,7,64,65,7,7,83,7,7,7,]),'multiplicative_expr':([0,5,17,18,35,36,38,39,41,45,46,66,79,82,85,],[9,9,9,9,9,9,9,9,67,9,9,9,9,9,9,]),'unary_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[10,10,42,10,10,10,10,10,10,10,68,69,10,10,10,10,10,10,]),'exponentiation_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'postfix_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'call_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'subscript_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'attribute_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'primary_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'identifier_expr':([0,5,8,17,18,29,35,36,38,39,41,43,44,45,46,47,66,79,81,82,85,],[19,19,19,19,19,60,19,19,19,19,19,19,19,19,19,76,19,19,60,19,19,]),'parenthetic_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'literal_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'object_literal_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'array_literal_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'string_literal_expr':([0,5,8,17,18,29,30,35,36,38,39,41,43,44,45,46,66,79,81,82,85,],[24,24,24,24,24,59,61,24,24,24,24,24,24,24,24,24,24,24,59,24,24,]),'number_literal_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'boolean_literal_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'null_literal_expr':([0,5,8,17,18,35,36,38,39,41,43,44,45,46,66,79,82,85,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'array_item_list':([18,],[49,]),'array_item_list_items':([18,],[50,]),'empty':([18,29,45,],[51,56,73,]),'array_item':([18,79,],[52,87,]),'object_item_list':([29,],[54,]),'object_item_list_items':([29,],[55,]),'object_item':([29,81,],[57,88,]),'object_key':([29,81,],[58,58,]),'call_arg_list':([45,],[70,]),'expr_list':([45,],[71,]),'expr_list_items':([45,],[72,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expr","S'",1,None,None,None),
+  ('expr -> or_expr','expr',1,'p_expr','parser.py',114),
+  ('or_expr -> or_expr OR and_expr','or_expr',3,'p_or_expr','parser.py',124),
+  ('or_expr -> and_expr','or_expr',1,'p_or_expr_passthrough','parser.py',145),
+  ('and_expr -> and_expr AND not_expr','and_expr',3,'p_and_expr','parser.py',151),
+  ('and_expr -> not_expr','and_expr',1,'p_and_expr_passthrough','parser.py',157),
+  ('not_expr -> NOT not_expr','not_expr',2,'p_not_expr','parser.py',163),
+  ('not_expr -> comparison_expr','not_expr',1,'p_not_expr','parser.py',164),
+  ('comparison_expr -> comparison_expr COMPARISONOP additive_expr','comparison_expr',3,'p_comparison_expr','parser.py',179),
+  ('comparison_expr -> comparison_expr IN additive_expr','comparison_expr',3,'p_comparison_expr_in','parser.py',198),
+  ('comparison_expr -> comparison_expr NOT IN additive_expr','comparison_expr',4,'p_comparison_expr_not_in','parser.py',204),
+  ('comparison_expr -> additive_expr','comparison_expr',1,'p_comparison_expr_passthrough','parser.py',212),
+  ('additive_expr -> additive_expr ADDITIVEOP multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',218),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','parser.py',219),
+  ('multiplicative_expr -> multiplicative_expr MULTIPLICATIVEOP unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',234),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','parser.py',235),
+  ('unary_expr -> ADDITIVEOP unary_expr','unary_expr',2,'p_unary_expr','parser.py',241),
+  ('unary_expr -> exponentiation_expr','unary_expr',1,'p_unary_expr','parser.py',242),
+  ('exponentiation_expr -> postfix_expr POWER unary_expr','exponentiation_expr',3,'p_exponentiation_expr','parser.py',248),
+  ('exponentiation_expr -> postfix_expr','exponentiation_expr',1,'p_exponentiation_expr','parser.py',249),
+  ('postfix_expr -> call_expr','postfix_expr',1,'p_postfix_expr','parser.py',255),
+  ('postfix_expr -> subscript_expr','postfix_expr',1,'p_postfix_expr','parser.py',256),
+  ('postfix_expr -> attribute_expr','postfix_expr',1,'p_postfix_expr','parser.py',257),
+  ('postfix_expr -> primary_expr','postfix_expr',1,'p_postfix_expr','parser.py',258),
+  ('call_expr -> postfix_expr LPAREN call_arg_list RPAREN','call_expr',4,'p_call_expr','parser.py',264),
+  ('call_arg_list -> expr_list','call_arg_list',1,'p_call_arg_list','parser.py',273),
+  ('expr_list -> expr_list_items','expr_list',1,'p_expr_list','parser.py',279),
+  ('expr_list -> expr_list_items COMMA','expr_list',2,'p_expr_list','parser.py',280),
+  ('expr_list -> empty','expr_list',1,'p_expr_list','parser.py',281),
+  ('expr_list_items -> expr_list_items COMMA expr','expr_list_items',3,'p_expr_list_items','parser.py',287),
+  ('expr_list_items -> expr','expr_list_items',1,'p_expr_list_items','parser.py',288),
+  ('subscript_expr -> postfix_expr LBRACKET expr RBRACKET','subscript_expr',4,'p_subscript_expr','parser.py',294),
+  ('attribute_expr -> postfix_expr DOT identifier_expr','attribute_expr',3,'p_attribute_expr','parser.py',303),
+  ('primary_expr -> parenthetic_expr','primary_expr',1,'p_primary_expr','parser.py',312),
+  ('primary_expr -> literal_expr','primary_expr',1,'p_primary_expr','parser.py',313),
+  ('primary_expr -> identifier_expr','primary_expr',1,'p_primary_expr','parser.py',314),
+  ('parenthetic_expr -> LPAREN expr RPAREN','parenthetic_expr',3,'p_parenthetic_expr','parser.py',320),
+  ('literal_expr -> object_literal_expr','literal_expr',1,'p_literal_expr','parser.py',327),
+  ('literal_expr -> array_literal_expr','literal_expr',1,'p_literal_expr','parser.py',328),
+  ('literal_expr -> string_literal_expr','literal_expr',1,'p_literal_expr','parser.py',329),
+  ('literal_expr -> number_literal_expr','literal_expr',1,'p_literal_expr','parser.py',330),
+  ('literal_expr -> boolean_literal_expr','literal_expr',1,'p_literal_expr','parser.py',331),
+  ('literal_expr -> null_literal_expr','literal_expr',1,'p_literal_expr','parser.py',332),
+  ('object_literal_expr -> LBRACE object_item_list RBRACE','object_literal_expr',3,'p_object_literal_expr','parser.py',338),
+  ('object_item_list -> object_item_list_items','object_item_list',1,'p_object_item_list','parser.py',348),
+  ('object_item_list -> object_item_list_items COMMA','object_item_list',2,'p_object_item_list','parser.py',349),
+  ('object_item_list -> empty','object_item_list',1,'p_object_item_list','parser.py',350),
+  ('object_item_list_items -> object_item_list_items COMMA object_item','object_item_list_items',3,'p_object_item_list_items','parser.py',356),
+  ('object_item_list_items -> object_item','object_item_list_items',1,'p_object_item_list_items','parser.py',357),
+  ('object_item -> object_key COLON expr','object_item',3,'p_object_item','parser.py',375),
+  ('object_key -> string_literal_expr','object_key',1,'p_object_key','parser.py',381),
+  ('object_key -> identifier_expr','object_key',1,'p_object_key','parser.py',382),
+  ('array_literal_expr -> LBRACKET array_item_list RBRACKET','array_literal_expr',3,'p_array_literal_expr','parser.py',388),
+  ('array_item_list -> array_item_list_items','array_item_list',1,'p_array_item_list','parser.py',426),
+  ('array_item_list -> array_item_list_items COMMA','array_item_list',2,'p_array_item_list','parser.py',427),
+  ('array_item_list -> empty','array_item_list',1,'p_array_item_list','parser.py',428),
+  ('array_item_list_items -> array_item_list_items COMMA array_item','array_item_list_items',3,'p_array_item_list_items','parser.py',434),
+  ('array_item_list_items -> array_item','array_item_list_items',1,'p_array_item_list_items','parser.py',435),
+  ('array_item -> expr','array_item',1,'p_array_item','parser.py',441),
+  ('string_literal_expr -> STRING string_literal_expr','string_literal_expr',2,'p_string_literal_expr','parser.py',447),
+  ('string_literal_expr -> STRING','string_literal_expr',1,'p_string_literal_expr','parser.py',448),
+  ('number_literal_expr -> NUMBER','number_literal_expr',1,'p_number_literal_expr','parser.py',459),
+  ('boolean_literal_expr -> TRUE','boolean_literal_expr',1,'p_boolean_literal_expr','parser.py',477),
+  ('boolean_literal_expr -> FALSE','boolean_literal_expr',1,'p_boolean_literal_expr','parser.py',478),
+  ('null_literal_expr -> NULL','null_literal_expr',1,'p_null_literal_expr','parser.py',486),
+  ('identifier_expr -> IDENTIFIER','identifier_expr',1,'p_identifier_expr','parser.py',492),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',500),
+]
@@ -6,6 +6,7 @@ from jel.ast import *
 class Module(AST):
 
     _fields = ('statements',)
+    _child_fields = ('statements',)
 
 
 class Stmt(AST):
@@ -15,53 +16,64 @@ class Stmt(AST):
 class ChainedAssignmentStmt(Stmt):
 
     _fields = ('targets', 'value')
+    _child_fields = ('targets', 'value')
 
 
 class AugmentedAssignmentStmt(Stmt):
 
     _fields = ('target', 'op', 'value')
+    _child_fields = ('target', 'value')
 
 
 class LocalStmt(Stmt):
 
     _fields = ('name', 'value')
+    _child_fields = ('value',)
 
 
 class SimpleCallStmt(Stmt):
 
     _fields = ('target', 'args')
+    _child_fields = ('target', 'args')
 
 
 class CompoundCallStmt(Stmt):
 
     _fields = ('function_name', 'clauses')
+    _child_fields = ('clauses',)
 
 
 class CompoundCallStmtClause(AST):
 
     _fields = ('args', 'local_names', 'body')
+    _child_fields = ('args', 'local_names', 'body')
 
 
 class FunctionStmt(Stmt):
 
     _fields = ('name', 'args', 'body', 'local')
+    _child_fields = ('args', 'body')
 
 
 class ReturnStmt(Stmt):
 
     _fields = ('value',)
+    _child_fields = ('value',)
 
 
 class AttributeReferenceExpr(Expr):
 
     _fields = ('target', 'name')
+    _child_fields = ('target',)
 
 
 class FunctionExpr(Expr):
 
     _fields = ('args', 'body')
+    _child_fields = ('args', 'body')
 
 
 class ArrayItemRange(AST):
 
     _fields = ('start', 'stop', 'step')
+    _child_fields = ('start', 'stop', 'step')
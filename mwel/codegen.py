@@ -0,0 +1,267 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+
+from jel.arrays import concat_arrays
+from jel.codegen import CodeGenerator as JELCodeGenerator
+
+from .executor import (AttributeReference, Executor, Return,
+                       check_call_statement_result, set_attr, set_item)
+from .linker import unbound
+from .ranges import build_range_array
+
+
+class CodeGenerator(JELCodeGenerator):
+
+    """
+    Translates MWEL op lists into Python functions.  Local, nonlocal, and
+    closure names are accessed through the executor's current Frame, as in
+    Executor, and compound calls and function definitions produce the same
+    Clause and Function objects.
+    """
+
+    def __init__(self, executor_class=Executor):
+        super(CodeGenerator, self).__init__(executor_class)
+
+    def namespace(self):
+        namespace = super(CodeGenerator, self).namespace()
+        namespace.update({
+            '_AttributeReference': AttributeReference,
+            '_Return': Return,
+            '_build_range_array': build_range_array,
+            '_check_null': check_call_statement_result,
+            '_concat_arrays': concat_arrays,
+            '_set_attr': set_attr,
+            '_set_item': set_item,
+            '_unbound': unbound,
+            })
+        return namespace
+
+    def emit_prologue(self):
+        super(CodeGenerator, self).emit_prologue()
+        emit = self.builder.emit
+        emit('_names = _x.names')
+        emit('_slots = _x.global_slots')
+        emit('_scopes = _x.frame.scopes')
+        emit('_closure = _x.frame.closure')
+
+    def call_expr(self, target, arg_list):
+        if isinstance(arg_list, collections.OrderedDict):
+            keys = tuple(arg_list)
+            values = [self.emit_expr(arg) for arg in arg_list.values()]
+            return '_x.call(%s, _OrderedDict(zip(%s, (%s))))' % (
+                target,
+                self.const(keys),
+                ''.join(v + ', ' for v in values),
+                )
+        return super(CodeGenerator, self).call_expr(target, arg_list)
+
+    def emit_store(self, op, value, dest):
+        self.builder.emit('%s = %s' % (dest, value), op)
+
+    def scope(self, depth=0):
+        return '_scopes[%d]' % (-1 - depth)
+
+    def emit_clause_body(self, op, body):
+        # Runs `body` inline in a new scope, as Executor.run_clause does
+        builder = self.builder
+        if builder.block_depth >= self.max_block_depth:
+            builder.emit('_x.run_clause(%s, ())' % self.const(body), op)
+            return
+        builder.emit('_scopes.append({})', op)
+        self.begin_block('try:', op)
+        num_lines = len(builder.lines)
+        self.emit_ops(body, [])
+        if len(builder.lines) == num_lines:
+            builder.emit('pass')
+        self.end_block()
+        builder.emit('finally:', op)
+        builder.emit('    _scopes.pop()', op)
+
+    def return_statement(self, op, value):
+        if self.native_return:
+            self.builder.emit('return %s' % value, op)
+        else:
+            self.builder.emit('raise _Return(%s)' % value, op)
+
+    #
+    # Op translations
+    #
+
+    def build_range_array(self, op, stack):
+        start, stop, step = self.pop(stack, 3)
+        self.assign(op, stack, '_build_range_array(%s, %s, %s)' %
+                    (start, stop, step))
+
+    def call_compound(self, op, stack, name, clauses):
+        self.builder.emit('_x.call_compound_handler(%s, %s)' %
+                          (self.const(name), self.const(clauses)),
+                          op)
+
+    def call_simple(self, op, stack, arg_list):
+        target = stack.pop()
+        self.builder.emit('_check_null(%s)' % self.call_expr(target,
+                                                             arg_list),
+                          op)
+
+    def concat_arrays(self, op, stack, count):
+        arrays = self.pop(stack, count)
+        self.assign(op, stack, '_concat_arrays((%s))' %
+                    ''.join(a + ', ' for a in arrays))
+
+    def dup_top(self, op, stack):
+        stack.append(stack[-1])
+
+    def dup_top_two(self, op, stack):
+        stack.extend(stack[-2:])
+
+    def if_else(self, op, stack, clauses):
+        # Each clause's condition is evaluated only if the previous ones
+        # were false.  A chain of clauses breaks out of a short-circuit
+        # block after running a body, so it's emitted at constant depth.
+        builder = self.builder
+        chained = (len(clauses) > 1)
+        if chained:
+            self.begin_short_circuit(op)
+        for cond, body in clauses:
+            if cond is None:
+                self.emit_clause_body(op, body)
+                break
+            builder.emit('if %s:' % self.emit_expr(cond), op)
+            builder.indent += 1
+            self.emit_clause_body(op, body)
+            if chained:
+                builder.emit('break', op)
+            builder.indent -= 1
+        if chained:
+            self.end_short_circuit(op)
+
+    def init_local(self, op, stack, name):
+        self.emit_store(op, stack.pop(), '%s[%s]' % (self.scope(),
+                                                    self.const(name)))
+
+    def load_attr_ref(self, op, stack, name):
+        target = stack.pop()
+        self.assign(op, stack, '_AttributeReference(%s, %s)' %
+                    (target, self.const(name)))
+
+    def load_closure(self, op, stack, name):
+        name = self.const(name)
+        self.assign(op, stack, '_closure[%s][%s]' % (name, name))
+
+    def load_global(self, op, stack, name):
+        self.load_name(op, stack, name)
+
+    def load_global_slot(self, op, stack, name, slot):
+        value = '_slots[%d]' % slot
+        self.assign(op, stack, '(%s if %s is not _unbound else '
+                               '_x.unbound_global(%s))' %
+                    (value, value, self.const(name)))
+
+    def load_local(self, op, stack, name):
+        self.assign(op, stack, '%s[%s]' % (self.scope(), self.const(name)))
+
+    def load_nonlocal(self, op, stack, name, depth):
+        self.assign(op, stack, '%s[%s]' % (self.scope(depth),
+                                           self.const(name)))
+
+    def make_function(self, op, stack, num_args, body, closure):
+        self.assign(op, stack, '_x.new_function(%d, %s, %s)' %
+                    (num_args, self.const(body), self.const(closure)))
+
+    def return_const(self, op, stack, value):
+        self.return_statement(op, self.const(value))
+
+    def return_value(self, op, stack):
+        self.return_statement(op, stack.pop())
+
+    def rot_three(self, op, stack):
+        stack[-3:] = (stack[-1], stack[-3], stack[-2])
+
+    def rot_two(self, op, stack):
+        stack[-2:] = (stack[-1], stack[-2])
+
+    def store_attr(self, op, stack, name):
+        target = stack.pop()
+        value = stack.pop()
+        self.builder.emit('_set_attr(%s, %s, %s)' %
+                          (target, self.const(name), value),
+                          op)
+
+    def store_closure(self, op, stack, name):
+        name = self.const(name)
+        self.emit_store(op, stack.pop(), '_closure[%s][%s]' % (name, name))
+
+    def store_global(self, op, stack, name):
+        self.emit_store(op, stack.pop(), '_names[%s]' % self.const(name))
+
+    def store_global_slot(self, op, stack, name, slot):
+        self.emit_store(op, stack.pop(), '_slots[%d]' % slot)
+
+    def store_local(self, op, stack, name):
+        self.emit_store(op, stack.pop(), '%s[%s]' % (self.scope(),
+                                                    self.const(name)))
+
+    def store_nonlocal(self, op, stack, name, depth):
+        self.emit_store(op, stack.pop(), '%s[%s]' % (self.scope(depth),
+                                                    self.const(name)))
+
+    def store_subscr(self, op, stack):
+        value, target, index = self.pop(stack, 3)
+        self.builder.emit('_set_item(%s, %s, %s)' % (target, index, value),
+                          op)
+
+    def while_loop(self, op, stack, cond, body):
+        builder = self.builder
+        self.begin_block('while True:', op)
+        builder.emit('if not %s:' % self.emit_expr(cond), op)
+        builder.emit('    break', op)
+        self.emit_clause_body(op, body)
+        self.end_block()
+
+    def dup_store_closure(self, op, stack, name):
+        self._dup_store(op, stack, self.store_closure, name)
+
+    def dup_store_global(self, op, stack, name):
+        self._dup_store(op, stack, self.store_global, name)
+
+    def dup_store_global_slot(self, op, stack, name, slot):
+        self._dup_store(op, stack, self.store_global_slot, name, slot)
+
+    def dup_store_local(self, op, stack, name):
+        self._dup_store(op, stack, self.store_local, name)
+
+    def dup_store_nonlocal(self, op, stack, name, depth):
+        self._dup_store(op, stack, self.store_nonlocal, name, depth)
+
+    def _dup_store(self, op, stack, store, *args):
+        value = stack[-1]
+        store(op, stack, *args)
+        stack.append(value)
+
+
+class PythonExecutor(Executor):
+
+    """
+    Executor that runs MWEL op lists as Python functions generated by
+    CodeGenerator.  Module and function bodies return directly from the
+    generated function, while clause bodies raise Return, so that return
+    statements can unwind through compound call handlers.
+    """
+
+    code_generator_class = CodeGenerator
+
+    def __init__(self, *args, **kwargs):
+        super(PythonExecutor, self).__init__(*args, **kwargs)
+        self.code_generator = self.code_generator_class(type(self))
+
+    def execute(self, ops, args=()):
+        return self.code_generator.function(ops, len(args))(self, *args)
+
+    def run_body(self, ops, args):
+        function = self.code_generator.function(ops,
+                                                len(args),
+                                                native_return=True)
+        try:
+            return function(self, *args)
+        except Return as r:
+            return r.value
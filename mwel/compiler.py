@@ -1,67 +1,106 @@
 from __future__ import division, print_function, unicode_literals
 import collections
-from contextlib import contextmanager
-from itertools import dropwhile
+from functools import partial
 
-from jel.compiler import Compiler as JELCompiler, gen_codes
+from jel import opcodes
+from jel.compiler import Compiler as JELCompiler
+from jel.opcodes import gen_codes
 
 from . import ast
 
 
 class Compiler(JELCompiler):
 
+    """
+    Compiles MWEL modules.
+
+    If created with inline_control_flow=True, the compiler lowers compound
+    calls handled by one of the standard control-flow handlers (see
+    `control_flow`) to IF_ELSE and WHILE_LOOP ops, which executors run
+    directly, rather than through a compound call handler.  Compound calls
+    are looked up as executors look them up (by full name, then by the
+    name of the first clause), so lowering is appropriate only if the
+    executor's handlers for these names are the standard ones.  Calls that
+    the standard handler would reject (e.g. a condition with more than one
+    argument) are compiled to CALL_COMPOUND, so that they fail at run time
+    as before.
+    """
+
     op_names, op_codes = gen_codes(
+        opcodes.op_names,
         'BUILD_RANGE_ARRAY',
         'CALL_COMPOUND',
         'CALL_SIMPLE',
         'CONCAT_ARRAYS',
+        'DUP_STORE_CLOSURE',
+        'DUP_STORE_GLOBAL',
+        'DUP_STORE_GLOBAL_SLOT',
+        'DUP_STORE_LOCAL',
+        'DUP_STORE_NONLOCAL',
         'DUP_TOP',
         'DUP_TOP_TWO',
+        'IF_ELSE',
         'INIT_LOCAL',
         'LOAD_ATTR_REF',
         'LOAD_CLOSURE',
         'LOAD_GLOBAL',
+        'LOAD_GLOBAL_SLOT',
         'LOAD_LOCAL',
         'LOAD_NONLOCAL',
         'MAKE_FUNCTION',
+        'RETURN_CONST',
         'RETURN_VALUE',
         'ROT_THREE',
         'ROT_TWO',
         'STORE_ATTR',
         'STORE_CLOSURE',
         'STORE_GLOBAL',
+        'STORE_GLOBAL_SLOT',
         'STORE_LOCAL',
         'STORE_NONLOCAL',
         'STORE_SUBSCR',
-        *filter((lambda n: n != 'LOAD_NAME'), JELCompiler.op_names)
+        'WHILE_LOOP',
+        *filter((lambda n: n != 'LOAD_NAME'), JELCompiler.op_codes)
         )
 
-    def __init__(self):
-        super(Compiler, self).__init__()
-        self._scopes = collections.deque()
+    # Maps the names of compound calls that can be lowered to the names of
+    # the methods that return the steps lowering them
+    control_flow = {
+        'if:': '_lower_if',
+        'while:': '_lower_while',
+        }
+
+    def __init__(self, *args, **kwargs):
+        self.inline_control_flow = kwargs.pop('inline_control_flow', False)
+        super(Compiler, self).__init__(*args, **kwargs)
+        self._scopes = []
+        self._bindings = {}
         self._closures = []
 
-    def _new_scope(self):
-        @contextmanager
-        def scope():
-            self._scopes.appendleft(set())
-            yield
-            self._scopes.popleft()
-        return scope()
+    def _reset(self):
+        super(Compiler, self)._reset()
+        del self._scopes[:]
+        self._bindings.clear()
+        del self._closures[:]
+
+    def _begin_scope(self):
+        self._scopes.append([])
+
+    def _end_scope(self):
+        for name in self._scopes.pop():
+            self._bindings[name].pop()
 
     def _new_local(self, lineno, lexpos, name):
-        self._scopes[0].add(name)
+        self._scopes[-1].append(name)
+        self._bindings.setdefault(name, []).append(len(self._scopes) - 1)
         self.init_local(lineno, lexpos, name)
 
-    def _new_closure(self):
-        @contextmanager
-        def closure():
-            level = len(self._scopes) - 1
-            names = collections.OrderedDict()
-            self._closures.append((level, names))
-            yield names
-            self._closures.pop()
-        return closure()
+    def _begin_closure(self):
+        level = len(self._scopes) - 1
+        self._closures.append((level, collections.OrderedDict()))
+
+    def _end_closure(self):
+        self._values.append(tuple(self._closures.pop()[1].items()))
 
     def _load_name(self, lineno, lexpos, name):
         depth = self._name_depth(name)
@@ -86,194 +125,311 @@ class Compiler(JELCompiler):
             self.store_nonlocal(lineno, lexpos, name, depth)
 
     def _in_closure(self, name, depth):
-        if not self._closures:
-            return False
+        # Walk outward from the innermost enclosing function, adding the
+        # name to the closure of each function that crosses its scope.
+        # Every function enclosing one that already captures the name
+        # captures it too, so the walk stops at the first such function,
+        # and the total work is linear in the size of the closure tables.
+        name_level = len(self._scopes) - depth - 1
+        pending = []
+        captured_outside = False
 
-        if name in self._closures[-1]:
-            return True
+        for level, closure_names in reversed(self._closures):
+            if level <= name_level:
+                break
+            if name in closure_names:
+                captured_outside = True
+                break
+            pending.append((level - name_level - 1, closure_names))
 
-        name_level = len(self._scopes) - depth - 1
-        closures = tuple(dropwhile(lambda c: c[0] < 0,
-                                   ((level - name_level - 1, names)
-                                    for level, names in self._closures)))
-        if not closures:
-            return False
+        for index, (relative_depth, closure_names) in enumerate(
+                reversed(pending)):
+            if captured_outside or index > 0:
+                relative_depth = -relative_depth
+            closure_names[name] = relative_depth
 
-        for index, (relative_depth, closure_names) in enumerate(closures):
-            closure_names[name] = relative_depth * (-1 if index > 0 else 1)
-        return True
+        return captured_outside or bool(pending)
 
     def _name_depth(self, name):
-        for depth, local_names in enumerate(self._scopes):
-            if name in local_names:
-                return depth
+        levels = self._bindings.get(name)
+        if levels:
+            return len(self._scopes) - levels[-1] - 1
 
     def module(self, node):
-        with self._new_scope():
-            self.compile_stmt_list(node.statements)
+        return ([self._begin_scope] +
+                self.compile_stmt_list(node.statements) +
+                [self._end_scope])
 
     def chained_assignment_stmt(self, node):
-        self.genops(node.value)
+        steps = [node.value]
         targets, lineno, lexpos = node.targets, node.lineno, node.lexpos
         while targets:
             t, targets = targets[0], targets[1:]
             ln, lineno = lineno[0], lineno[1:]
             lp, lexpos = lexpos[0], lexpos[1:]
             if targets:
-                self.dup_top(ln, lp)
+                steps.append(partial(self.dup_top, ln, lp))
             if isinstance(t, ast.SubscriptExpr):
-                self.genops(t.target)
-                self.genops(t.value)
-                self.store_subscr(ln, lp)
+                steps += [t.target,
+                          t.value,
+                          partial(self.store_subscr, ln, lp)]
             elif isinstance(t, ast.AttributeExpr):
-                self.genops(t.target)
-                self.store_attr(ln, lp, t.name)
+                steps += [t.target,
+                          partial(self.store_attr, ln, lp, t.name)]
             else:
                 assert isinstance(t, ast.IdentifierExpr)
-                self._store_name(ln, lp, t.value)
+                steps.append(partial(self._store_name, ln, lp, t.value))
+        return steps
 
     def augmented_assignment_stmt(self, node):
-        if isinstance(node.target, ast.SubscriptExpr):
-            self.genops(node.target.target)
-            self.genops(node.target.value)
-            self.dup_top_two(node.lineno, node.lexpos)
-            self.load_subscr(node.target.lineno, node.target.lexpos)
-        elif isinstance(node.target, ast.AttributeExpr):
-            self.genops(node.target.target)
-            self.dup_top(node.lineno, node.lexpos)
-            self.load_attr(node.target.lineno,
-                           node.target.lexpos,
-                           node.target.name)
+        target = node.target
+        if isinstance(target, ast.SubscriptExpr):
+            steps = [target.target,
+                     target.value,
+                     partial(self.dup_top_two, node.lineno, node.lexpos),
+                     partial(self.load_subscr, target.lineno, target.lexpos)]
+        elif isinstance(target, ast.AttributeExpr):
+            steps = [target.target,
+                     partial(self.dup_top, node.lineno, node.lexpos),
+                     partial(self.load_attr,
+                             target.lineno,
+                             target.lexpos,
+                             target.name)]
         else:
-            assert isinstance(node.target, ast.IdentifierExpr)
-            self.genops(node.target)
-
-        self.genops(node.value)
-        self.binary_op(node.lineno,
-                       node.lexpos,
-                       self.binary_op_codes[node.op[:-1]])
-
-        if isinstance(node.target, ast.SubscriptExpr):
-            self.rot_three(node.lineno, node.lexpos)
-            self.store_subscr(node.lineno, node.lexpos)
-        elif isinstance(node.target, ast.AttributeExpr):
-            self.rot_two(node.lineno, node.lexpos)
-            self.store_attr(node.lineno, node.lexpos, node.target.name)
+            assert isinstance(target, ast.IdentifierExpr)
+            steps = [target]
+
+        steps += [node.value,
+                  partial(self._binary_op,
+                          node.lineno,
+                          node.lexpos,
+                          node.op[:-1])]
+
+        if isinstance(target, ast.SubscriptExpr):
+            steps += [partial(self.rot_three, node.lineno, node.lexpos),
+                      partial(self.store_subscr, node.lineno, node.lexpos)]
+        elif isinstance(target, ast.AttributeExpr):
+            steps += [partial(self.rot_two, node.lineno, node.lexpos),
+                      partial(self.store_attr,
+                              node.lineno,
+                              node.lexpos,
+                              target.name)]
         else:
-            self._store_name(node.lineno, node.lexpos, node.target.value)
+            steps.append(partial(self._store_name,
+                                 node.lineno,
+                                 node.lexpos,
+                                 target.value))
+        return steps
 
     def local_stmt(self, node):
-        self.genops(node.value)
-        self._new_local(node.lineno, node.lexpos, node.name)
+        return [
+            node.value,
+            partial(self._new_local, node.lineno, node.lexpos, node.name),
+            ]
 
     def simple_call_stmt(self, node):
-        self.genops(node.target)
-        self.call_simple(node.lineno,
-                         node.lexpos,
-                         self.compile_arg_list(node))
+        return ([node.target] +
+                self.compile_arg_list(node) +
+                [partial(self._call, self.call_simple, node)])
 
     def compound_call_stmt(self, node):
-        clauses = []
+        if self.inline_control_flow:
+            name = node.function_name
+            lower = (self.control_flow.get(name) or
+                     self.control_flow.get(name[:name.index(':') + 1]))
+            if lower is not None:
+                steps = getattr(self, lower)(node)
+                if steps is not None:
+                    return steps
+
+        steps = []
         for c in node.clauses:
-            arg_list = self.compile_arg_list(c)
-            with self._new_op_list() as body:
-                with self._new_scope():
-                    self.compile_stmt_list(c.body, c.local_names)
-            clauses.append((arg_list, len(c.local_names), tuple(body)))
-
+            steps += self.compile_arg_list(c)
+            steps += self._clause_body(c)
+        steps.append(partial(self._call_compound, node))
+        return steps
+
+    def _call_compound(self, node):
+        values = self._pop_values(2 * len(node.clauses))
+        clauses = tuple((arg_list, len(c.local_names), body)
+                        for c, arg_list, body in zip(node.clauses,
+                                                     values[::2],
+                                                     values[1::2]))
         self.call_compound(node.lineno,
                            node.lexpos,
                            node.function_name,
-                           tuple(clauses))
+                           clauses)
+
+    def _lower_if(self, node):
+        # A clause without arguments is an else clause, and has no condition
+        steps = []
+        for c in node.clauses:
+            if c.local_names or len(c.args) > 1:
+                return None
+            if c.args:
+                steps += self._nested(self._condition(c))
+            else:
+                steps.append(partial(self._values.append, None))
+            steps += self._clause_body(c)
+        steps.append(partial(self._if_else, node))
+        return steps
+
+    def _if_else(self, node):
+        values = self._pop_values(2 * len(node.clauses))
+        self.if_else(node.lineno,
+                     node.lexpos,
+                     tuple(zip(values[::2], values[1::2])))
+
+    def _lower_while(self, node):
+        if len(node.clauses) != 1:
+            return None
+        c = node.clauses[0]
+        if c.local_names or len(c.args) != 1:
+            return None
+        return (self._nested(self._condition(c)) +
+                self._clause_body(c) +
+                [partial(self._while_loop, node)])
+
+    def _while_loop(self, node):
+        cond, body = self._pop_values(2)
+        self.while_loop(node.lineno, node.lexpos, cond, body)
+
+    @staticmethod
+    def _condition(clause):
+        # The single (positional or named) argument of a clause
+        args = clause.args
+        if isinstance(args, collections.OrderedDict):
+            args = tuple(args.values())
+        return args[0]
+
+    def _clause_body(self, clause):
+        # Steps that compile the body of a compound call clause, leaving its
+        # Code on the value stack
+        return ([self._begin_op_list, self._begin_scope] +
+                self.compile_stmt_list(clause.body, clause.local_names) +
+                [self._end_scope, self._end_op_list])
 
     def compile_arg_list(self, node):
         if isinstance(node.args, collections.OrderedDict):
-            return collections.OrderedDict((k, self.compile(v)) for k, v in
-                                           node.args.items())
+            return self._nested_all(node.args.values()) + [
+                partial(self._push_named_arg_list, tuple(node.args.keys()))
+                ]
         return super(Compiler, self).compile_arg_list(node)
 
+    def _push_named_arg_list(self, names):
+        values = self._pop_values(len(names))
+        self._values.append(collections.OrderedDict(zip(names, values)))
+
     def function_stmt(self, node):
+        steps = []
         if node.local:
-            self.null_literal_expr(node)
-            self._new_local(node.lineno, node.lexpos, node.name)
-
-        with self._new_op_list() as body:
-            with self._new_scope():
-                with self._new_closure() as closure:
-                    self.compile_stmt_list(node.body, node.args)
-
-        self.make_function(node.lineno,
-                           node.lexpos,
-                           len(node.args),
-                           tuple(body),
-                           tuple(closure.items()))
-        self._store_name(node.lineno, node.lexpos, node.name)
+            steps += [partial(self.null_literal_expr, node),
+                      partial(self._new_local,
+                              node.lineno,
+                              node.lexpos,
+                              node.name)]
+        steps += self._function_body(node.body, node.args)
+        steps += [partial(self._make_function, node),
+                  partial(self._store_name,
+                          node.lineno,
+                          node.lexpos,
+                          node.name)]
+        return steps
 
     def function_expr(self, node):
-        with self._new_op_list() as body:
-            with self._new_scope():
-                with self._new_closure() as closure:
-                    self.compile_stmt_list((node.body,), node.args)
-                    self.return_value(node.body.lineno, node.body.lexpos)
-
+        return (self._function_body((node.body,),
+                                    node.args,
+                                    partial(self.return_value,
+                                            node.body.lineno,
+                                            node.body.lexpos)) +
+                [partial(self._make_function, node)])
+
+    def _function_body(self, stmts, args, *final_steps):
+        # Steps that compile a function body, leaving its closure and Code
+        # on the value stack
+        return ([self._begin_op_list,
+                 self._begin_scope,
+                 self._begin_closure] +
+                self.compile_stmt_list(stmts, args) +
+                list(final_steps) +
+                [self._end_closure,
+                 self._end_scope,
+                 self._end_op_list])
+
+    def _make_function(self, node):
+        closure, body = self._pop_values(2)
         self.make_function(node.lineno,
                            node.lexpos,
                            len(node.args),
-                           tuple(body),
-                           tuple(closure.items()))
+                           body,
+                           closure)
 
     def compile_stmt_list(self, stmts, local_names=()):
-        for n in reversed(local_names):
-            self._new_local(n.lineno, n.lexpos, n.value)
-        for s in stmts:
-            self.genops(s)
+        """
+        Returns steps that bind `local_names` (last first, as their values
+        are popped from the stack) and compile `stmts`
+        """
+        steps = [partial(self._new_local, n.lineno, n.lexpos, n.value)
+                 for n in reversed(local_names)]
+        steps += stmts
+        return steps
 
     def return_stmt(self, node):
         if node.value is not None:
-            self.genops(node.value)
+            steps = [node.value]
         else:
-            self.null_literal_expr(node)
-        self.return_value(node.lineno, node.lexpos)
+            steps = [partial(self.null_literal_expr, node)]
+        steps.append(partial(self.return_value, node.lineno, node.lexpos))
+        return steps
 
     def attribute_reference_expr(self, node):
-        self.genops(node.target)
-        self.load_attr_ref(node.lineno, node.lexpos, node.name)
+        return [
+            node.target,
+            partial(self.load_attr_ref, node.lineno, node.lexpos, node.name),
+            ]
 
     def array_literal_expr(self, node):
+        steps = []
         num_arrays = 0
         num_items = 0
+        build_array = partial(self.build_array, node.lineno, node.lexpos)
 
         for item in node.items:
             if not isinstance(item, ast.ArrayItemRange):
-                self.genops(item)
+                steps.append(item)
                 num_items += 1
             else:
                 if num_items > 0:
-                    self.build_array(node.lineno, node.lexpos, num_items)
+                    steps.append(partial(build_array, num_items))
                     num_arrays += 1
                     num_items = 0
 
-                self.genops(item.start)
-                self.genops(item.stop)
+                steps += [item.start, item.stop]
                 if item.step is not None:
-                    self.genops(item.step)
+                    steps.append(item.step)
                 else:
-                    self.null_literal_expr(node)
+                    steps.append(partial(self.null_literal_expr, node))
 
-                self.build_range_array(node.lineno, node.lexpos)
+                steps.append(partial(self.build_range_array,
+                                     node.lineno,
+                                     node.lexpos))
                 num_arrays += 1
 
         if num_arrays == 0 or num_items > 0:
-            self.build_array(node.lineno, node.lexpos, num_items)
+            steps.append(partial(build_array, num_items))
             num_arrays += 1
 
         if num_arrays > 1:
-            self.concat_arrays(node.lineno, node.lexpos, num_arrays)
+            steps.append(partial(self.concat_arrays,
+                                 node.lineno,
+                                 node.lexpos,
+                                 num_arrays))
+        return steps
 
     def identifier_expr(self, node):
         self._load_name(node.lineno, node.lexpos, node.value)
 
 
 if __name__ == '__main__':
-    for op_name in Compiler.op_names:
-        print(op_name, end=',\n')
+    for op_name in sorted(Compiler.op_codes, key=Compiler.op_codes.get):
+        print('%s = %d' % (op_name, Compiler.op_codes[op_name]), end=',\n')
@@ -0,0 +1,342 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import copy
+
+from jel.visitor import NodeTransformer, walk
+
+from . import ast
+
+
+#
+# A subexpression evaluated more than once in a statement list, replaced by
+# the hidden local variable `name`.  `locations` holds the (lineno, lexpos)
+# of each replaced occurrence.
+#
+
+CommonSubexpression = collections.namedtuple('CommonSubexpression',
+                                             ('name', 'expr', 'locations'))
+
+
+class Eliminator(NodeTransformer):
+
+    """
+    Common-subexpression elimination for MWEL modules.
+
+    Within each statement list, an expression built only from names,
+    literals, and operators that's evaluated by two or more statements (or
+    twice in one statement) is computed once, by a local statement inserted
+    before its first use, and every occurrence is replaced by a reference
+    to that local.  The locals have names (e.g. '$cse0') that can't
+    appear in source code.
+
+    Occurrences are reused only while it's certain that they'd produce the
+    same value: a statement that assigns a name ends the reuse of every
+    expression that reads it, and a statement that calls anything (which
+    might assign any global) ends the reuse of all of them.  Operands that
+    might not be evaluated (the right-hand operands of 'and', 'or', and
+    chained comparisons, and the bodies of function expressions) are never
+    considered.  If several candidates overlap, the largest wins.
+
+    Each rewrite is recorded in `eliminated`, and counts are accumulated in
+    `stats`.  Hoisting can change which of several errors is raised first,
+    but never whether an error is raised.
+    """
+
+    pure_types = (
+        ast.AndExpr,
+        ast.ArrayItemRange,
+        ast.ArrayLiteralExpr,
+        ast.BinaryOpExpr,
+        ast.BooleanLiteralExpr,
+        ast.ComparisonExpr,
+        ast.IdentifierExpr,
+        ast.NullLiteralExpr,
+        ast.NumberArrayLiteralExpr,
+        ast.NumberLiteralExpr,
+        ast.OrExpr,
+        ast.StringLiteralExpr,
+        ast.UnaryOpExpr,
+        )
+
+    # Pure expressions that are worth computing only once
+    operator_types = (
+        ast.AndExpr,
+        ast.ArrayLiteralExpr,
+        ast.BinaryOpExpr,
+        ast.ComparisonExpr,
+        ast.OrExpr,
+        ast.UnaryOpExpr,
+        )
+
+    name_format = '$cse%d'
+
+    def __init__(self):
+        self.eliminated = []
+        self.stats = collections.Counter()
+
+    def eliminate(self, module):
+        """
+        Returns a copy of `module` with common subexpressions eliminated.
+        `module` itself isn't modified.
+        """
+        return self.transform(module)
+
+    def report(self, source=None):
+        lines = []
+        for name, expr, locations in self.eliminated:
+            if source is None:
+                where = ', '.join('line %s, lexpos %s' % loc
+                                  for loc in locations)
+            else:
+                where = ', '.join(
+                    'line %d, column %d' %
+                    (lineno, lexpos - source.rfind('\n', 0, lexpos))
+                    for lineno, lexpos in locations
+                    )
+            lines.append('%s: %d occurrences (%s)' %
+                         (name, len(locations), where))
+        return '\n'.join(lines)
+
+    def transform_Module(self, node):
+        return self._rewrite(node, 'statements')
+
+    def transform_FunctionStmt(self, node):
+        return self._rewrite(node, 'body')
+
+    def transform_CompoundCallStmtClause(self, node):
+        return self._rewrite(node, 'body')
+
+    def _rewrite(self, node, field):
+        stmts = getattr(node, field)
+        new_stmts = self._eliminate(stmts)
+        if new_stmts is not stmts:
+            node = copy.copy(node)
+            setattr(node, field, new_stmts)
+        return node
+
+    #
+    # Analysis
+    #
+
+    def _eliminate(self, stmts):
+        occurrences = []
+        groups = []
+        open_groups = {}
+
+        for index, stmt in enumerate(stmts):
+            roots, writes = self._effects(stmt)
+            for occ in self._occurrences(index, stmt, roots,
+                                         len(occurrences)):
+                occurrences.append(occ)
+                expr = occ[2]
+                candidates = open_groups.setdefault(expr.structural_hash(), [])
+                for group in candidates:
+                    if group[0] == expr:
+                        group[2].append(occ)
+                        break
+                else:
+                    group = (expr, occ[4], [occ])
+                    candidates.append(group)
+                    groups.append(group)
+
+            if writes is None:
+                open_groups.clear()
+            elif writes:
+                for key, candidates in list(open_groups.items()):
+                    candidates[:] = [g for g in candidates
+                                     if not (g[1] & writes)]
+                    if not candidates:
+                        del open_groups[key]
+
+        # Choose the largest repeated expressions first, ignoring occurrences
+        # inside an expression that's already been chosen
+        groups = [g for g in groups if len(g[2]) > 1]
+        groups.sort(key=(lambda g: -g[2][0][5]))
+        replaced = set()
+        hoisted = collections.defaultdict(list)
+        replacements = collections.defaultdict(list)
+
+        for expr, names, group_occs in groups:
+            group_occs = [occ for occ in group_occs
+                          if replaced.isdisjoint(occ[3])]
+            if len(group_occs) < 2:
+                continue
+            name = self.name_format % self.stats['expressions']
+            self.stats['expressions'] += 1
+            self.stats['occurrences'] += len(group_occs)
+
+            first = group_occs[0]
+            hoisted[first[0]].append((first[6], ast.LocalStmt(
+                first[2].lineno,
+                first[2].lexpos,
+                name = name,
+                value = first[2],
+                )))
+            for occ in group_occs:
+                replaced.add(occ[6])
+                replacements[occ[0]].append((occ[1], ast.IdentifierExpr(
+                    occ[2].lineno,
+                    occ[2].lexpos,
+                    value = name,
+                    )))
+            self.eliminated.append(CommonSubexpression(
+                name,
+                expr,
+                tuple((occ[2].lineno, occ[2].lexpos) for occ in group_occs),
+                ))
+
+        if not hoisted:
+            return stmts
+
+        new_stmts = []
+        for index, stmt in enumerate(stmts):
+            new_stmts.extend(local for order, local in
+                             sorted(hoisted.get(index, ()),
+                                    key=(lambda h: h[0])))
+            for path, replacement in replacements.get(index, ()):
+                stmt = self._replace(stmt, path, replacement)
+            new_stmts.append(stmt)
+        return type(stmts)(new_stmts)
+
+    def _effects(self, stmt):
+        # Returns the paths of the expressions in `stmt` that may be reused,
+        # and the names it assigns (or None, if it might assign any name)
+        if isinstance(stmt, ast.FunctionStmt):
+            return (), frozenset((stmt.name,))
+        if isinstance(stmt, (ast.ChainedAssignmentStmt,
+                             ast.AugmentedAssignmentStmt,
+                             ast.LocalStmt,
+                             ast.ReturnStmt,
+                             ast.SimpleCallStmt)):
+            if any(isinstance(n, ast.CallExpr) for n in walk(stmt)):
+                return (), None
+        else:
+            return (), None
+
+        if isinstance(stmt, ast.SimpleCallStmt):
+            args = stmt.args
+            if isinstance(args, dict):
+                roots = [(('args', key),) for key in args]
+            else:
+                roots = [(('args', i),) for i in range(len(args))]
+            return roots, None
+
+        roots = ([(('value', None),)] if stmt.value is not None else [])
+        if isinstance(stmt, ast.LocalStmt):
+            writes = (stmt.name,)
+        elif isinstance(stmt, ast.ChainedAssignmentStmt):
+            writes = tuple(self._base_name(t) for t in stmt.targets)
+        elif isinstance(stmt, ast.AugmentedAssignmentStmt):
+            writes = (self._base_name(stmt.target),)
+        else:
+            writes = ()
+        if None in writes:
+            return roots, None
+        return roots, frozenset(writes)
+
+    @staticmethod
+    def _base_name(target):
+        # Storing to a.b[c] modifies the value of a
+        while isinstance(target, (ast.AttributeExpr, ast.SubscriptExpr)):
+            target = target.target
+        if isinstance(target, ast.IdentifierExpr):
+            return target.value
+        return None
+
+    def _occurrences(self, index, stmt, roots, next_id):
+        # Returns, in evaluation order, a tuple (statement index, path,
+        # node, ancestor ids, names, size, id) for each candidate expression
+        # that `stmt` always evaluates
+        info = {}
+        pending = []
+        for path in reversed(roots):
+            node = self._get(stmt, path[0])
+            self._add_info(node, info)
+            pending.append((path, node, ()))
+
+        results = []
+        while pending:
+            path, node, ancestors = pending.pop()
+            node_info = info[id(node)]
+            if (node_info is not None) and isinstance(node,
+                                                      self.operator_types):
+                names, size = node_info
+                if names:
+                    occ_id = next_id + len(results)
+                    results.append((index, path, node, ancestors, names,
+                                    size, occ_id))
+                    ancestors += (occ_id,)
+
+            if isinstance(node, ast.FunctionExpr):
+                continue
+            children = list(self._children(node))
+            if isinstance(node, (ast.AndExpr, ast.OrExpr)):
+                children = children[:1]
+            elif isinstance(node, ast.ComparisonExpr):
+                children = children[:2]
+            for step, child in reversed(children):
+                pending.append((path + (step,), child, ancestors))
+        return results
+
+    def _add_info(self, root, info):
+        # Records, for each node under `root`, the names it reads and its
+        # size if it's pure, or None if it isn't
+        for node in walk(root, postorder=True):
+            if id(node) in info:
+                continue
+            node_info = None
+            if isinstance(node, self.pure_types):
+                children = [info[id(c)] for s, c in self._children(node)]
+                if None not in children:
+                    names = frozenset()
+                    if isinstance(node, ast.IdentifierExpr):
+                        names = frozenset((node.value,))
+                    for child_names, child_size in children:
+                        names |= child_names
+                    node_info = (names,
+                                 1 + sum(size for n, size in children))
+            info[id(node)] = node_info
+
+    @staticmethod
+    def _children(node):
+        # Yields (step, child) for each child of `node`, where step is a
+        # (field, index or key) pair
+        for field in node._child_fields or ():
+            value = getattr(node, field)
+            if isinstance(value, ast.AST):
+                yield (field, None), value
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    yield (field, key), item
+            elif isinstance(value, (tuple, list)):
+                for i, item in enumerate(value):
+                    if isinstance(item, ast.AST):
+                        yield (field, i), item
+
+    @staticmethod
+    def _get(node, step):
+        field, key = step
+        value = getattr(node, field)
+        return (value if key is None else value[key])
+
+    def _replace(self, root, path, replacement):
+        # Returns a copy of `root` in which the node at `path` is replaced
+        # by `replacement`.  Only the nodes along the path are copied.
+        parents = [root]
+        for step in path[:-1]:
+            parents.append(self._get(parents[-1], step))
+
+        node = replacement
+        for parent, (field, key) in zip(reversed(parents), reversed(path)):
+            parent = copy.copy(parent)
+            value = getattr(parent, field)
+            if key is None:
+                value = node
+            elif isinstance(value, dict):
+                value = type(value)((k, (node if k == key else v))
+                                    for k, v in value.items())
+            else:
+                value = value[:key] + (node,) + value[key+1:]
+            setattr(parent, field, value)
+            node = parent
+        return node
@@ -0,0 +1,413 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+
+try:
+    from collections.abc import MutableMapping, MutableSequence
+except ImportError:
+    from collections import MutableMapping, MutableSequence
+
+from jel.arrays import concat_arrays
+from jel.executor import ExecutionError, check_attr_access, get_attr
+from jel.executor import Executor as JELExecutor
+
+from .compiler import Compiler
+from .linker import unbound
+from .ranges import build_range_array
+
+
+class Return(Exception):
+
+    """Raised by a return statement, to unwind to the enclosing function"""
+
+    def __init__(self, value):
+        super(Return, self).__init__()
+        self.value = value
+
+
+class Frame(object):
+
+    """
+    Execution state of a module or function body.  `scopes` holds a dict
+    of local names for each enclosing statement list within the frame,
+    innermost last, and `closure` maps each name captured from an
+    enclosing function to the scope that binds it.
+    """
+
+    __slots__ = ('scopes', 'closure')
+
+    def __init__(self, closure=None):
+        self.scopes = [{}]
+        self.closure = ({} if closure is None else closure)
+
+
+class Function(object):
+
+    """A function created by a function definition statement or expression"""
+
+    def __init__(self, executor, num_args, body, closure):
+        self.executor = executor
+        self.num_args = num_args
+        self.body = body
+        self.closure = closure
+
+    @property
+    def arg_names(self):
+        # The body starts by binding its arguments, last first
+        return tuple(reversed(tuple(op[3][0] for op in
+                                    self.body[:self.num_args])))
+
+    def __call__(self, *args, **kwargs):
+        if kwargs:
+            args += tuple(kwargs.pop(name) for name in
+                          self.arg_names[len(args):] if name in kwargs)
+            if kwargs:
+                raise TypeError('Unexpected argument: %r' %
+                                str(kwargs.popitem()[0]))
+        if len(args) != self.num_args:
+            raise TypeError('Function takes %d arguments (%d given)' %
+                            (self.num_args, len(args)))
+        return self.executor.run_function(self, args)
+
+
+class AttributeReference(object):
+
+    """A reference to a named attribute of a target object (target.&name)"""
+
+    __slots__ = ('target', 'name')
+
+    def __init__(self, target, name):
+        self.target = target
+        self.name = name
+
+    def get(self):
+        return get_attr(self.target, self.name)
+
+    def set(self, value):
+        set_attr(self.target, self.name, value)
+
+    def __eq__(self, other):
+        return ((type(other) is type(self)) and
+                (other.target is self.target) and
+                (other.name == self.name))
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash((id(self.target), self.name))
+
+
+class Clause(object):
+
+    """
+    One clause of a compound call statement, as passed to the compound
+    call's handler.  Arguments are passed unevaluated, so that the handler
+    can evaluate them selectively or repeatedly.
+    """
+
+    def __init__(self, executor, arg_list, num_locals, body):
+        self.executor = executor
+        self.arg_list = arg_list
+        self.num_locals = num_locals
+        self.body = body
+
+    def evaluate_args(self):
+        """
+        Returns the values of the clause's arguments, as a tuple or (for
+        named arguments) an OrderedDict
+        """
+        return self.executor.evaluate_arg_list(self.arg_list)
+
+    def run(self, *local_values):
+        """Executes the body, binding `local_values` to its local names"""
+        if len(local_values) != self.num_locals:
+            raise ExecutionError('Clause has %d local names (%d values given)'
+                                 % (self.num_locals, len(local_values)))
+        self.executor.run_clause(self.body, local_values)
+
+
+def check_call_statement_result(result):
+    if result is not None:
+        raise ExecutionError('Result of call statement must be null')
+
+
+def set_attr(target, name, value):
+    if isinstance(target, MutableMapping):
+        target[name] = value
+    else:
+        check_attr_access(target, name)
+        setattr(target, name, value)
+
+
+def set_item(target, index, value):
+    if (isinstance(index, float) and
+        isinstance(target, MutableSequence)):
+        index = int(index)
+    target[index] = value
+
+
+#
+# Standard compound call handlers
+#
+
+def _condition(clause, name):
+    args = clause.evaluate_args()
+    if len(args) != 1:
+        raise ExecutionError('%s takes exactly one argument' % name)
+    if isinstance(args, collections.OrderedDict):
+        args = tuple(args.values())
+    return args[0]
+
+
+def if_handler(clauses):
+    for clause in clauses:
+        # A final clause without arguments is an else clause
+        if (not clause.arg_list) or _condition(clause, 'if'):
+            clause.run()
+            break
+
+
+def while_handler(clauses):
+    if len(clauses) != 1:
+        raise ExecutionError('while takes exactly one clause')
+    clause = clauses[0]
+    while _condition(clause, 'while'):
+        clause.run()
+
+
+standard_compounds = {
+    'if:': if_handler,
+    'while:': while_handler,
+    }
+
+
+class Executor(JELExecutor):
+
+    """
+    Reference executor for code produced by mwel.compiler.Compiler.
+
+    `names` holds the global names, and `compounds` maps the names of
+    compound calls (e.g. 'if:', or 'when:else:when:' for a chain of
+    clauses) to handler functions.  A handler is called with a tuple of
+    Clause objects.  If a compound call's full name isn't in `compounds`,
+    the handler for its first clause (e.g. 'if:') is used.
+    """
+
+    compiler_class = Compiler
+
+    control_exceptions = (Return,)
+
+    def __init__(self, names=None, tags=None, compounds=None):
+        super(Executor, self).__init__(names, tags)
+        self.compounds = (standard_compounds if compounds is None else
+                          compounds)
+        self.frame = Frame()
+        self.global_slots = []
+
+    def run(self, code):
+        """
+        Executes the module `code` in a new frame, and returns the value of
+        its top-level return statement, if any
+        """
+        frame, self.frame = self.frame, Frame()
+        try:
+            return self.run_body(code, ())
+        finally:
+            self.frame = frame
+
+    def run_program(self, program):
+        """
+        Executes the modules of the linked `program` (a
+        mwel.linker.Program) in order, and returns the value of the last
+        one's top-level return statement, if any.
+
+        The program gets a new table of global slots, in which its
+        external names are bound to their current values in `names`.  The
+        table remains in use (e.g. by functions the program defined) until
+        the next call to run_program.  Globals bound by the program are
+        also copied to `names` when it finishes.
+        """
+        slots = self.global_slots = program.new_globals(self.names)
+        try:
+            result = None
+            for code in program.modules:
+                result = self.run(code)
+            return result
+        finally:
+            for name, slot in program.slots.items():
+                if slots[slot] is not unbound:
+                    self.names[name] = slots[slot]
+
+    def unbound_global(self, name):
+        raise ExecutionError('Undefined name: %r' % str(name))
+
+    def run_function(self, function, args):
+        frame, self.frame = self.frame, Frame(function.closure)
+        try:
+            return self.run_body(function.body, args)
+        finally:
+            self.frame = frame
+
+    def run_body(self, ops, args):
+        # Executes a module or function body in the current frame
+        try:
+            self.execute(ops, args)
+        except Return as r:
+            return r.value
+
+    def run_clause(self, ops, local_values):
+        scopes = self.frame.scopes
+        scopes.append({})
+        try:
+            self.execute(ops, local_values)
+        finally:
+            scopes.pop()
+
+    def evaluate_arg_list(self, arg_list):
+        if isinstance(arg_list, collections.OrderedDict):
+            return collections.OrderedDict((k, self.execute(v)) for k, v in
+                                           arg_list.items())
+        return tuple(self.execute(arg) for arg in arg_list)
+
+    def call(self, target, args):
+        if isinstance(args, collections.OrderedDict):
+            return target(**dict((str(k), v) for k, v in args.items()))
+        return target(*args)
+
+    def call_compound_handler(self, name, clauses):
+        handler = self.compounds.get(name)
+        if handler is None:
+            handler = self.compounds.get(name[:name.index(':') + 1])
+            if handler is None:
+                raise ExecutionError('Unknown compound call: %r' % str(name))
+        handler(tuple(Clause(self, arg_list, num_locals, body)
+                      for arg_list, num_locals, body in clauses))
+
+    def new_function(self, num_args, body, closure):
+        captured = {}
+        scopes = self.frame.scopes
+        for name, depth in closure:
+            if depth >= 0:
+                captured[name] = scopes[-1 - depth]
+            else:
+                captured[name] = self.frame.closure[name]
+        return Function(self, num_args, body, captured)
+
+    #
+    # Op handlers
+    #
+
+    def build_range_array(self, stack):
+        step = stack.pop()
+        stop = stack.pop()
+        stack[-1] = build_range_array(stack[-1], stop, step)
+
+    def call_compound(self, stack, name, clauses):
+        self.call_compound_handler(name, clauses)
+
+    def call_function(self, stack, arg_list):
+        stack[-1] = self.call(stack[-1], self.evaluate_arg_list(arg_list))
+
+    def call_simple(self, stack, arg_list):
+        result = self.call(stack.pop(), self.evaluate_arg_list(arg_list))
+        check_call_statement_result(result)
+
+    def concat_arrays(self, stack, count):
+        start = len(stack) - count
+        arrays = stack[start:]
+        del stack[start:]
+        stack.append(concat_arrays(arrays))
+
+    def dup_top(self, stack):
+        stack.append(stack[-1])
+
+    def dup_top_two(self, stack):
+        stack.extend(stack[-2:])
+
+    def if_else(self, stack, clauses):
+        for cond, body in clauses:
+            if (cond is None) or self.execute(cond):
+                self.run_clause(body, ())
+                break
+
+    def init_local(self, stack, name):
+        self.frame.scopes[-1][name] = stack.pop()
+
+    def load_attr_ref(self, stack, name):
+        stack[-1] = AttributeReference(stack[-1], name)
+
+    def load_closure(self, stack, name):
+        stack.append(self.frame.closure[name][name])
+
+    def load_global(self, stack, name):
+        stack.append(self.lookup_name(name))
+
+    def load_global_slot(self, stack, name, slot):
+        value = self.global_slots[slot]
+        if value is unbound:
+            self.unbound_global(name)
+        stack.append(value)
+
+    def load_local(self, stack, name):
+        stack.append(self.frame.scopes[-1][name])
+
+    def load_nonlocal(self, stack, name, depth):
+        stack.append(self.frame.scopes[-1 - depth][name])
+
+    def make_function(self, stack, num_args, body, closure):
+        stack.append(self.new_function(num_args, body, closure))
+
+    def return_const(self, stack, value):
+        raise Return(value)
+
+    def return_value(self, stack):
+        raise Return(stack.pop())
+
+    def rot_three(self, stack):
+        stack[-3:] = (stack[-1], stack[-3], stack[-2])
+
+    def rot_two(self, stack):
+        stack[-2:] = (stack[-1], stack[-2])
+
+    def store_attr(self, stack, name):
+        target = stack.pop()
+        set_attr(target, name, stack.pop())
+
+    def store_closure(self, stack, name):
+        self.frame.closure[name][name] = stack.pop()
+
+    def store_global(self, stack, name):
+        self.names[name] = stack.pop()
+
+    def store_global_slot(self, stack, name, slot):
+        self.global_slots[slot] = stack.pop()
+
+    def store_local(self, stack, name):
+        self.frame.scopes[-1][name] = stack.pop()
+
+    def store_nonlocal(self, stack, name, depth):
+        self.frame.scopes[-1 - depth][name] = stack.pop()
+
+    def store_subscr(self, stack):
+        index = stack.pop()
+        target = stack.pop()
+        set_item(target, index, stack.pop())
+
+    def while_loop(self, stack, cond, body):
+        while self.execute(cond):
+            self.run_clause(body, ())
+
+    def dup_store_closure(self, stack, name):
+        self.frame.closure[name][name] = stack[-1]
+
+    def dup_store_global(self, stack, name):
+        self.names[name] = stack[-1]
+
+    def dup_store_global_slot(self, stack, name, slot):
+        self.global_slots[slot] = stack[-1]
+
+    def dup_store_local(self, stack, name):
+        self.frame.scopes[-1][name] = stack[-1]
+
+    def dup_store_nonlocal(self, stack, name, depth):
+        self.frame.scopes[-1 - depth][name] = stack[-1]
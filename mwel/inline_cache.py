@@ -0,0 +1,137 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import operator
+import weakref
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+from jel.executor import check_attr_access
+from jel.inline_cache import InlineCacheMixin as JELInlineCacheMixin
+from jel.inline_cache import _abc_cache_token
+from jel.inline_cache import caching_executor_class as _caching_class
+
+from .executor import Function, check_call_statement_result
+
+
+def attr_setter(target, name):
+    """
+    Returns a function that sets attribute `name` of objects like `target`,
+    as mwel.executor.set_attr does
+    """
+    if isinstance(target, MutableMapping):
+        return (lambda target, value: operator.setitem(target, name, value))
+    check_attr_access(target, name)
+    name = str(name)
+    return (lambda target, value: setattr(target, name, value))
+
+
+def _call_positional(target, values):
+    return target(*values)
+
+
+def _run_function(target, values):
+    return target.executor.run_function(target, values)
+
+
+class InlineCacheMixin(JELInlineCacheMixin):
+
+    """
+    InlineCacheMixin for MWEL executors.
+
+    STORE_ATTR caches a setter for the target's type.  CALL_FUNCTION and
+    CALL_SIMPLE cache how to call the last callee: a function defined in
+    MWEL is run directly, with named arguments permuted into their
+    positions once, rather than on every call; other callees are cached by
+    type, with named arguments converted to keywords once.  A cached
+    function call is invalidated if the function's body changes.
+    LOAD_ATTR_REF just builds an AttributeReference, which resolves its
+    target only when used, so it has no cache.
+    """
+
+    cached_ops = JELInlineCacheMixin.cached_ops + ('CALL_FUNCTION',
+                                                   'CALL_SIMPLE',
+                                                   'STORE_ATTR')
+
+    def cached_call_function(self, stack, cache, arg_list):
+        stack[-1] = self._cached_call(cache, stack[-1], arg_list)
+
+    def cached_call_simple(self, stack, cache, arg_list):
+        target = stack.pop()
+        check_call_statement_result(self._cached_call(cache,
+                                                      target,
+                                                      arg_list))
+
+    def cached_store_attr(self, stack, cache, name):
+        target = stack.pop()
+        value = stack.pop()
+        setter = cache.value
+        token = _abc_cache_token()
+        if (type(target) is cache.key) and (token == cache.token):
+            cache.hits += 1
+        else:
+            setter = cache.fill(type(target), token, attr_setter(target,
+                                                                  name))
+        setter(target, value)
+
+    def _cached_call(self, cache, target, arg_list):
+        # Arguments are evaluated before the callee is examined, as in
+        # Executor.call_function
+        named = isinstance(arg_list, collections.OrderedDict)
+        values = tuple(self.execute(arg) for arg in
+                       (arg_list.values() if named else arg_list))
+
+        key, token = cache.key, cache.token
+        if token is None:
+            if key is type(target):
+                cache.hits += 1
+                return cache.value(target, values)
+        elif (key() is target) and (target.body is token):
+            # A function defined in MWEL
+            cache.hits += 1
+            return cache.value(target, values)
+
+        if isinstance(target, Function):
+            # The function is referenced weakly, since it refers to its
+            # executor
+            cache.fill(weakref.ref(target),
+                       target.body,
+                       self._function_call(target, arg_list, named))
+        else:
+            cache.fill(type(target),
+                       None,
+                       self._callable_call(arg_list, named))
+        return cache.value(target, values)
+
+    def _function_call(self, function, arg_list, named):
+        # Returns a function that calls `function` with the values of
+        # `arg_list`, bypassing Function.__call__ if the arguments match
+        if not named:
+            if len(arg_list) == function.num_args:
+                return _run_function
+        else:
+            arg_names = function.arg_names
+            keys = tuple(arg_list)
+            if sorted(keys) == sorted(arg_names):
+                order = tuple(keys.index(name) for name in arg_names)
+                return (lambda target, values: _run_function(
+                    target,
+                    tuple(values[index] for index in order),
+                    ))
+
+        # Let Function.__call__ report the mismatch
+        return self._callable_call(arg_list, named)
+
+    @staticmethod
+    def _callable_call(arg_list, named):
+        if not named:
+            return _call_positional
+        keys = tuple(str(k) for k in arg_list)
+        return (lambda target, values: target(**dict(zip(keys, values))))
+
+
+def caching_executor_class(executor_class):
+    """Returns a subclass of `executor_class` that uses InlineCacheMixin"""
+    return _caching_class(executor_class, InlineCacheMixin)
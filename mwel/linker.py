@@ -0,0 +1,249 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+from functools import partial
+
+from jel import opcodes
+from jel.opcodes import Code
+
+from .compiler import Compiler
+
+
+class _Unbound(object):
+
+    # Value of a global slot that hasn't been bound yet
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return '<unbound>'
+
+
+unbound = _Unbound()
+
+
+class LinkError(ValueError):
+
+    """
+    Raised by Linker.link.  `problems` holds a (msg, module, lineno, lexpos)
+    tuple for each problem found, where `module` is the index of the module
+    in which it was found.
+    """
+
+    def __init__(self, problems):
+        super(LinkError, self).__init__('\n'.join(
+            '%s (module %d, line %s, lexpos %s)' % p for p in problems
+            ))
+        self.problems = problems
+
+
+class Program(object):
+
+    """
+    A set of modules linked by Linker.link.  `modules` holds their linked
+    code, and `slots` maps each global name they use to its index in the
+    table of global slots.  `externals` holds the names that must be
+    provided by the host.
+    """
+
+    def __init__(self, modules, slots, externals):
+        self.modules = modules
+        self.slots = slots
+        self.externals = externals
+
+    def new_globals(self, names):
+        """
+        Returns a new table of global slots, with external names bound to
+        their values in `names`, and all others unbound
+        """
+        return [(names.get(name, unbound) if name in self.externals else
+                 unbound)
+                for name in self.slots]
+
+
+class Linker(object):
+
+    """
+    Links compiled MWEL modules into a Program that shares one table of
+    global slots.
+
+    Every global name read or bound by the modules is assigned a fixed
+    slot, and LOAD_GLOBAL, STORE_GLOBAL, and DUP_STORE_GLOBAL ops are
+    rewritten to their slot-indexed forms, so that a global access is a
+    list index rather than a dict lookup.  Modules share a single global
+    scope.
+
+    Since a global can be bound only once, and only at the top level of a
+    module, link() rejects globals that might be bound more than once when
+    the modules run, bound within a function or a loop, or bound by a
+    module and also provided by the host (as one of `externals`).  A
+    global can be bound in each of the exclusive clauses of an 'if'
+    statement, since only one of them runs.  Compound calls other than
+    'if' and 'while' are assumed to run each of their clauses at most once.
+    link() also rejects globals that are read but neither bound by any
+    module nor external.  Code is never modified in place.
+    """
+
+    def __init__(self, externals=(), compiler_class=Compiler):
+        self.externals = frozenset(externals)
+
+        op_codes = compiler_class.op_codes
+        self._load = op_codes['LOAD_GLOBAL']
+        self._slot_ops = {
+            op_codes['LOAD_GLOBAL']: op_codes['LOAD_GLOBAL_SLOT'],
+            op_codes['STORE_GLOBAL']: op_codes['STORE_GLOBAL_SLOT'],
+            op_codes['DUP_STORE_GLOBAL']: op_codes['DUP_STORE_GLOBAL_SLOT'],
+            }
+        self._stores = frozenset((op_codes['STORE_GLOBAL'],
+                                  op_codes['DUP_STORE_GLOBAL']))
+        self._make_function = op_codes['MAKE_FUNCTION']
+        self._if_else = op_codes['IF_ELSE']
+        self._while_loop = op_codes['WHILE_LOOP']
+        self._call_compound = op_codes['CALL_COMPOUND']
+
+    def link(self, modules):
+        """
+        Returns a Program running the compiled `modules` in order.  Raises
+        LinkError if any global names are unbound or bound incorrectly.
+        """
+        slots = collections.OrderedDict()
+        bindings = collections.OrderedDict()
+        loads = collections.OrderedDict()
+
+        for index, code in enumerate(modules):
+            pending = [code]
+            while pending:
+                for op in pending.pop():
+                    if op[0] in self._slot_ops:
+                        name = op[3][0]
+                        slots.setdefault(name, len(slots))
+                        if op[0] == self._load:
+                            loads.setdefault(name, (index, op[1], op[2]))
+                    opcodes.map_nested_code(op, partial(self._defer,
+                                                        pending))
+            self._merge(bindings, self._bindings(index, code))
+
+        problems = []
+        for name, sites in bindings.items():
+            if name in self.externals:
+                problems.append(('Global name %r is already defined' %
+                                 str(name),) + sites[0][0])
+            for location, in_function, in_loop in sites:
+                if in_function:
+                    problems.append(('Global name %r cannot be bound '
+                                     'within a function' % str(name),) +
+                                    location)
+                elif in_loop:
+                    problems.append(('Global name %r cannot be bound '
+                                     'within a loop' % str(name),) +
+                                    location)
+            for location, in_function, in_loop in sites[1:]:
+                problems.append(('Global name %r is bound more than once' %
+                                 str(name),) + location)
+        for name, location in loads.items():
+            if (name not in bindings) and (name not in self.externals):
+                problems.append(('Undefined name: %r' % str(name),) +
+                                location)
+        if problems:
+            problems.sort(key=(lambda p: p[1:]))
+            raise LinkError(problems)
+
+        linked = []
+        for code in modules:
+            code = self._rewrite(slots, code)
+            opcodes.verify_stack(code, False)
+            linked.append(code)
+
+        return Program(tuple(linked),
+                       slots,
+                       frozenset(n for n in slots if n in self.externals))
+
+    @staticmethod
+    def _defer(pending, ops, is_expr, num_args):
+        pending.append(ops)
+        return ops
+
+    def _bindings(self, module, ops, in_function=False, in_loop=False):
+        # Returns an OrderedDict mapping each global bound by `ops` to a
+        # (location, in_function, in_loop) tuple for each binding that
+        # might run when `ops` runs once.  Of exclusive 'if' clauses, the
+        # one with the most bindings of a name counts.
+        bindings = collections.OrderedDict()
+        for op in ops:
+            code, args = op[0], op[3]
+            if code in self._stores:
+                location = (module, op[1], op[2])
+                bindings.setdefault(args[0], []).append((location,
+                                                         in_function,
+                                                         in_loop))
+                continue
+
+            if code == self._if_else:
+                conditions = [cond for cond, body in args[0] if
+                              cond is not None]
+                clauses = [body for cond, body in args[0]]
+                loop = False
+            elif (code == self._call_compound and
+                  args[0].split(':')[0] in ('if', 'while')):
+                conditions = []
+                for arg_list, num_locals, body in args[1]:
+                    if isinstance(arg_list, collections.OrderedDict):
+                        arg_list = arg_list.values()
+                    conditions.extend(arg_list)
+                clauses = [body for arg_list, num_locals, body in args[1]]
+                loop = (args[0].split(':')[0] == 'while')
+            elif code == self._while_loop:
+                conditions = [args[0]]
+                clauses = [args[1]]
+                loop = True
+            else:
+                nested_in_function = (in_function or
+                                      (code == self._make_function))
+
+                def visit(nested_ops, is_expr, num_args):
+                    self._merge(bindings, self._bindings(module,
+                                                         nested_ops,
+                                                         nested_in_function,
+                                                         in_loop))
+                    return nested_ops
+
+                opcodes.map_nested_code(op, visit)
+                continue
+
+            for cond in conditions:
+                self._merge(bindings, self._bindings(module,
+                                                     cond,
+                                                     in_function,
+                                                     (in_loop or loop)))
+            longest = collections.OrderedDict()
+            for body in clauses:
+                clause_bindings = self._bindings(module,
+                                                 body,
+                                                 in_function,
+                                                 (in_loop or loop))
+                for name, sites in clause_bindings.items():
+                    if len(sites) > len(longest.get(name, ())):
+                        longest[name] = sites
+            self._merge(bindings, longest)
+        return bindings
+
+    @staticmethod
+    def _merge(bindings, more_bindings):
+        # Appends the bindings in `more_bindings`, which run after those in
+        # `bindings`
+        for name, sites in more_bindings.items():
+            bindings.setdefault(name, []).extend(sites)
+
+    def _rewrite(self, slots, ops, is_expr=None, num_args=None):
+        out = []
+        for op in ops:
+            if op[0] in self._slot_ops:
+                name = op[3][0]
+                op = (self._slot_ops[op[0]], op[1], op[2], (name,
+                                                             slots[name]))
+            else:
+                op = opcodes.map_nested_code(op,
+                                             partial(self._rewrite, slots))
+            out.append(op)
+        if isinstance(ops, Code):
+            return Code(out, ops.version)
+        return tuple(out)
@@ -20,12 +20,19 @@ class Parser(JELParser):
 
     def p_stmt_list(self, p):
         '''
-        stmt_list : stmt newline stmt_list
-                  | stmt
+        stmt_list : stmt_list_items
+                  | stmt_list_items newline
                   | empty
         '''
         self.item_list(p)
 
+    def p_stmt_list_items(self, p):
+        '''
+        stmt_list_items : stmt_list_items newline stmt
+                        | stmt
+        '''
+        self.item_list_items(p)
+
     def p_stmt(self, p):
         '''
         stmt : assignment_stmt
@@ -140,16 +147,16 @@ class Parser(JELParser):
         call_stmt_local_names : RARROW call_stmt_local_name_list
                               | empty
         '''
-        p[0] = (p[2] if len(p) > 2 else ())
+        p[0] = (tuple(p[2]) if len(p) > 2 else ())
 
     def p_call_stmt_local_name_list(self, p):
         '''
-        call_stmt_local_name_list : identifier_expr \
+        call_stmt_local_name_list : call_stmt_local_name_list \
                                       COMMA \
-                                      call_stmt_local_name_list
+                                      identifier_expr
                                   | identifier_expr
         '''
-        p[0] = (p[1],) + (p[3] if len(p) == 4 else ())
+        self.item_list_items(p)
 
     def p_call_stmt_body(self, p):
         '''
@@ -231,11 +238,19 @@ class Parser(JELParser):
 
     def p_named_expr_list(self, p):
         '''
-        named_expr_list : named_expr_list_item COMMA named_expr_list
-                        | named_expr_list_item COMMA
-                        | named_expr_list_item
+        named_expr_list : named_expr_list_items
+                        | named_expr_list_items COMMA
+        '''
+        self.item_list(p)
+
+    def p_named_expr_list_items(self, p):
+        '''
+        named_expr_list_items : named_expr_list_items \
+                                  COMMA \
+                                  named_expr_list_item
+                              | named_expr_list_item
         '''
-        p[0] = (p[1],) + (p[3] if len(p) == 4 else ())
+        self.item_list_items(p)
 
     def p_named_expr_list_item(self, p):
         '''
@@ -273,12 +288,21 @@ class Parser(JELParser):
 
     def p_function_arg_list(self, p):
         '''
-        function_arg_list : function_arg_list_item COMMA function_arg_list
-                          | function_arg_list_item
+        function_arg_list : function_arg_list_items
+                          | function_arg_list_items COMMA
                           | empty
         '''
         self.item_list(p)
 
+    def p_function_arg_list_items(self, p):
+        '''
+        function_arg_list_items : function_arg_list_items \
+                                    COMMA \
+                                    function_arg_list_item
+                                | function_arg_list_item
+        '''
+        self.item_list_items(p)
+
     def p_function_arg_list_item(self, p):
         '''
         function_arg_list_item : identifier_expr
@@ -0,0 +1,202 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import sys
+
+from jel import opcodes
+from jel.arrays import ArrayValue, concat_arrays
+from jel.opcodes import Code
+
+from . import parse
+from .compiler import Compiler
+from .ranges import build_range_array
+
+
+class Optimizer(object):
+
+    """
+    Peephole optimizer for op lists produced by Compiler.compile.
+
+    Each op list (including those nested in the arguments of other ops) is
+    rewritten in a single left-to-right pass.  After every op is emitted,
+    the tail of the output is matched against a set of patterns, so
+    rewrites cascade naturally (e.g. a folded unary minus can make an
+    enclosing array literal constant).  Counts of removed ops are
+    accumulated in `stats`, keyed by pattern name.
+
+    Constant range items are folded to lazy RangeArray values, so even very
+    large ranges cost constant space in the compiled code.
+    """
+
+    def __init__(self, compiler_class=Compiler):
+        self.op_codes = compiler_class.op_codes
+        self.unary_op_names = compiler_class.unary_op_names
+        self.specialized_unary_ops = dict(
+            (self.op_codes[name], op) for op, name in
+            compiler_class.specialized_unary_ops.items()
+            )
+        self.stats = collections.Counter()
+
+        self._dup_stores = dict(
+            (self.op_codes['STORE_' + kind], self.op_codes['DUP_STORE_' + kind])
+            for kind in ('CLOSURE', 'GLOBAL', 'LOCAL', 'NONLOCAL')
+            )
+        self._returns = frozenset((self.op_codes['RETURN_CONST'],
+                                   self.op_codes['RETURN_VALUE']))
+
+        self._patterns = {
+            self.op_codes['UNARY_OP']: ('unary_op', self._fold_unary_op),
+            self.op_codes['RETURN_VALUE']: ('return_const',
+                                            self._fuse_return_const),
+            self.op_codes['BUILD_ARRAY']: ('build_array', self._fold_array),
+            self.op_codes['BUILD_RANGE_ARRAY']: ('build_range_array',
+                                                 self._fold_range_array),
+            self.op_codes['CONCAT_ARRAYS']: ('concat_arrays',
+                                             self._fold_concat_arrays),
+            }
+        for code in self._dup_stores:
+            self._patterns[code] = ('dup_store', self._fuse_dup_store)
+        for code in self.specialized_unary_ops:
+            self._patterns[code] = ('unary_op', self._fold_unary_op)
+
+    def optimize(self, ops, is_expr=False):
+        out = self._optimize(ops)
+        if isinstance(out, Code):
+            opcodes.verify_stack(out, is_expr)
+        return out
+
+    def _optimize(self, ops, is_expr=None, num_args=None):
+        out = []
+        for index, op in enumerate(ops):
+            out.append(opcodes.map_nested_code(op, self._optimize))
+            if op[0] in self._patterns:
+                name, rewrite = self._patterns[op[0]]
+                self.stats[name] += rewrite(out)
+            if op[0] in self._returns:
+                self.stats['unreachable'] += self.count_ops(ops[index+1:])
+                break
+        if isinstance(ops, Code):
+            return Code(out, ops.version)
+        return tuple(out)
+
+    def count_ops(self, ops):
+        count = [0]
+        def count_list(ops, is_expr=None, num_args=None):
+            count[0] += len(ops)
+            for op in ops:
+                opcodes.map_nested_code(op, count_list)
+            return ops
+        count_list(ops)
+        return count[0]
+
+    def _trailing_consts(self, out, count):
+        # Returns the values of the `count` LOAD_CONST ops that precede the
+        # last op, or None if they aren't all LOAD_CONST
+        if count > len(out) - 1:
+            return None
+        tail = out[len(out)-1-count:-1]
+        if not all(op[0] == self.op_codes['LOAD_CONST'] for op in tail):
+            return None
+        return tuple(op[3][0] for op in tail)
+
+    def _replace_tail(self, out, count, op):
+        del out[len(out)-count:]
+        out.append(op)
+        return count - 1
+
+    def _load_const(self, op, value):
+        return (self.op_codes['LOAD_CONST'], op[1], op[2], (value,))
+
+    def _fuse_dup_store(self, out):
+        if len(out) < 2 or out[-2][0] != self.op_codes['DUP_TOP']:
+            return 0
+        store = out[-1]
+        return self._replace_tail(out,
+                                  2,
+                                  (self._dup_stores[store[0]],) + store[1:])
+
+    def _fold_unary_op(self, out):
+        op = out[-1]
+        operand = self._trailing_consts(out, 1)
+        if operand is None:
+            return 0
+        operand = operand[0]
+        if op[0] in self.specialized_unary_ops:
+            op_name = self.specialized_unary_ops[op[0]]
+        else:
+            op_name = self.unary_op_names[op[3][0]]
+        if op_name == 'not':
+            value = not operand
+        elif not isinstance(operand, float):
+            return 0
+        elif op_name == '-':
+            value = -operand
+        else:
+            value = operand
+        return self._replace_tail(out, 2, self._load_const(op, value))
+
+    def _fuse_return_const(self, out):
+        op = out[-1]
+        value = self._trailing_consts(out, 1)
+        if value is None:
+            return 0
+        return self._replace_tail(
+            out, 2, (self.op_codes['RETURN_CONST'],) + op[1:3] + (value,))
+
+    def _fold_array(self, out):
+        op = out[-1]
+        items = self._trailing_consts(out, op[3][0])
+        if items is None:
+            return 0
+        return self._replace_tail(out,
+                                  len(items) + 1,
+                                  self._load_const(op, items))
+
+    def _fold_range_array(self, out):
+        op = out[-1]
+        args = self._trailing_consts(out, 3)
+        if args is None:
+            return 0
+        start, stop, step = args
+        if not (all(isinstance(v, float) for v in (start, stop)) and
+                (isinstance(step, float) or step is None) and
+                (step != 0.0)):
+            return 0
+        try:
+            value = build_range_array(start, stop, step)
+        except Exception:
+            # Leave the error to happen at run time
+            return 0
+        return self._replace_tail(out, 4, self._load_const(op, value))
+
+    def _fold_concat_arrays(self, out):
+        op = out[-1]
+        arrays = self._trailing_consts(out, op[3][0])
+        if arrays is None or not all(isinstance(a, (tuple, ArrayValue))
+                                     for a in arrays):
+            return 0
+        return self._replace_tail(out,
+                                  len(arrays) + 1,
+                                  self._load_const(op, concat_arrays(arrays)))
+
+
+def main(paths):
+    print('%-30s %8s %8s %8s' % ('file', 'before', 'after', 'removed'))
+    total = Optimizer()
+    for path in paths:
+        with open(path) as fp:
+            root = parse(fp.read())
+        if not root:
+            continue
+        ops = Compiler().compile(root)
+        optimizer = Optimizer()
+        before = optimizer.count_ops(ops)
+        after = optimizer.count_ops(optimizer.optimize(ops))
+        total.stats.update(optimizer.stats)
+        print('%-30s %8d %8d %8d' % (path, before, after, before - after))
+    print()
+    for name, count in sorted(total.stats.items()):
+        print('%-30s %8d' % (name, count))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,116 @@
+from __future__ import division, print_function, unicode_literals
+import math
+import sys
+
+from jel.arrays import ArrayValue, ConcatArray, concat_arrays
+
+
+class RangeArray(ArrayValue):
+
+    """
+    The array produced by a range item [start:stop:step].  Items are
+    start + i*step, up to and including stop.
+
+    Length, indexing, and membership tests take constant time, and slicing
+    returns another RangeArray.
+    """
+
+    __slots__ = ('start', 'step', '_len')
+
+    def __init__(self, start, stop, step=1.0):
+        if step == 0:
+            raise ValueError('Range step cannot be zero')
+        self.start = start
+        self.step = step
+        self._len = self._count(start, stop, step)
+
+    @staticmethod
+    def _count(start, stop, step):
+        span = (stop - start) / step
+        if not (span >= 0):
+            return 0
+        if span >= sys.maxsize:
+            # Including an infinite span
+            raise OverflowError('Range has too many items')
+        count = int(math.floor(span)) + 1
+        # Correct for rounding, so that the last item computed as
+        # start + i*step is the last one that doesn't pass stop
+        if step > 0:
+            while start + count * step <= stop:
+                count += 1
+            while count > 0 and start + (count - 1) * step > stop:
+                count -= 1
+        else:
+            while start + count * step >= stop:
+                count += 1
+            while count > 0 and start + (count - 1) * step < stop:
+                count -= 1
+        return count
+
+    @classmethod
+    def _from_length(cls, start, step, length):
+        self = cls.__new__(cls)
+        self.start = start
+        self.step = step
+        self._len = length
+        return self
+
+    @property
+    def stop(self):
+        if self._len == 0:
+            return self.start - self.step
+        return self.start + (self._len - 1) * self.step
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step > 0:
+                length = max(0, (stop - start + step - 1) // step)
+            else:
+                length = max(0, (start - stop - step - 1) // -step)
+            return self._from_length(self.start + start * self.step,
+                                     self.step * step,
+                                     length)
+        if index < 0:
+            index += self._len
+        if not (0 <= index < self._len):
+            raise IndexError('Range index out of range')
+        return self.start + index * self.step
+
+    def __iter__(self):
+        start, step = self.start, self.step
+        index = 0
+        while index < self._len:
+            yield start + index * step
+            index += 1
+
+    def __contains__(self, value):
+        try:
+            index = int(round((value - self.start) / self.step))
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return ((0 <= index < self._len) and
+                (self.start + index * self.step == value))
+
+    def __eq__(self, other):
+        if isinstance(other, RangeArray):
+            return ((self._len == other._len) and
+                    ((self._len == 0) or
+                     ((self.start == other.start) and
+                      ((self._len == 1) or (self.step == other.step)))))
+        return super(RangeArray, self).__eq__(other)
+
+    __hash__ = ArrayValue.__hash__
+
+    def __repr__(self):
+        return 'RangeArray(%r, %r, %r)' % (self.start, self.stop, self.step)
+
+
+def build_range_array(start, stop, step=None):
+    """Returns the array for the range item [start:stop:step]"""
+    if step is None:
+        step = 1.0
+    return RangeArray(start, stop, step)
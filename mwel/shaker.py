@@ -0,0 +1,185 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import sys
+
+from jel import opcodes
+from jel.opcodes import Code
+
+from . import parse
+from .compiler import Compiler
+from .executor import Executor
+from .peephole import Optimizer
+from .specialize import Specializer
+
+
+Removal = collections.namedtuple('Removal', ('names',
+                                             'module',
+                                             'lineno',
+                                             'lexpos',
+                                             'num_ops'))
+
+
+class TreeShaker(object):
+
+    """
+    Removes unused definitions from compiled MWEL modules.
+
+    A definition is a top-level statement that only binds globals to a
+    value built without side effects, such as a function statement or an
+    assignment of a constant.  (The value may load other globals, which
+    are assumed to be defined.  Operators may be applied only to constant
+    operands, and only if the Specializer can evaluate them without
+    error.)  Every other top-level statement is a use
+    that must be kept, and so are the globals in `roots`, which the host
+    reads after running the modules.  The globals read by the kept code,
+    including the bodies of its functions, are reachable, and so are those
+    read by the definitions of reachable globals.  shake() removes the
+    definitions that bind only unreachable globals, and records a Removal
+    for each one in `removed`.
+
+    Modules share a single global scope, as in Linker.link, so a module can
+    use the definitions in another.  Shaking should precede linking.  Code
+    is never modified in place.
+    """
+
+    def __init__(self, roots=(), compiler_class=Compiler,
+                 executor_class=Executor):
+        self.roots = frozenset(roots)
+        self.removed = []
+
+        op_codes = compiler_class.op_codes
+        self._op_names = compiler_class.op_names
+        self._stores = frozenset((op_codes['STORE_GLOBAL'],
+                                  op_codes['DUP_STORE_GLOBAL']))
+        self._pure = self._stores.union(
+            op_codes[name] for name in ('BUILD_ARRAY',
+                                        'BUILD_OBJECT',
+                                        'DUP_TOP',
+                                        'LOAD_CONST',
+                                        'LOAD_GLOBAL',
+                                        'MAKE_FUNCTION')
+            )
+        # Ops that the Specializer can fold to a constant
+        operators = ['BINARY_OP',
+                     'BUILD_RANGE_ARRAY',
+                     'COMPARE_OP',
+                     'CONCAT_ARRAYS',
+                     'UNARY_OP']
+        for specializations in (compiler_class.specialized_binary_ops,
+                                compiler_class.specialized_comparison_ops,
+                                compiler_class.specialized_unary_ops):
+            operators.extend(specializations.values())
+        self._foldable = self._pure.union(op_codes[name] for name in
+                                          operators)
+        self._specializer = Specializer({}, compiler_class, executor_class)
+        self.count_ops = Optimizer(compiler_class).count_ops
+
+    def shake(self, modules):
+        """
+        Returns a copy of the compiled `modules`, without their unused
+        definitions
+        """
+        statements = [self._split(code) for code in modules]
+
+        definitions = collections.defaultdict(list)
+        reachable = set(self.roots)
+        for module in statements:
+            for ops in module:
+                names = self._defined_names(ops)
+                if names:
+                    for name in names:
+                        definitions[name].append(ops)
+                else:
+                    reachable.update(opcodes.free_names(ops))
+
+        pending = list(reachable)
+        while pending:
+            for ops in definitions.pop(pending.pop(), ()):
+                for name in opcodes.free_names(ops):
+                    if name not in reachable:
+                        reachable.add(name)
+                        pending.append(name)
+
+        shaken = []
+        for index, (code, module) in enumerate(zip(modules, statements)):
+            out = []
+            for ops in module:
+                names = self._defined_names(ops)
+                if names and reachable.isdisjoint(names):
+                    binding = ops[-1]
+                    self.removed.append(Removal(names,
+                                                index,
+                                                binding[1],
+                                                binding[2],
+                                                self.count_ops(ops)))
+                else:
+                    out.extend(ops)
+            if len(out) < len(code):
+                code = Code(out, code.version)
+                opcodes.verify_stack(code, False)
+            shaken.append(code)
+        return tuple(shaken)
+
+    def _split(self, code):
+        # Splits `code` into statements, each of which starts and ends with
+        # an empty stack
+        statements = []
+        start = depth = 0
+        for index, op in enumerate(code):
+            pops, pushes = opcodes.stack_effect(self._op_names[op[0]], op[3])
+            depth += pushes - pops
+            if depth == 0:
+                statements.append(code[start:index+1])
+                start = index + 1
+        return statements
+
+    def _defined_names(self, ops):
+        # Returns the names bound by `ops`, if it's a definition
+        if ((ops[-1][0] not in self._stores) or
+            any(op[0] not in self._foldable for op in ops)):
+            return ()
+        if any(op[0] not in self._pure for op in ops):
+            # The operators must fold away
+            try:
+                folded = self._specializer.specialize(ops)
+            except Exception:
+                return ()
+            if any(op[0] not in self._pure for op in folded):
+                return ()
+        return tuple(op[3][0] for op in ops if op[0] in self._stores)
+
+    def report(self):
+        """Returns a line describing each removed definition"""
+        return ['%-30s module %d, line %s (%d ops)' %
+                (', '.join(r.names), r.module, r.lineno, r.num_ops)
+                for r in self.removed]
+
+
+def main(paths, roots):
+    modules = []
+    for path in paths:
+        with open(path) as fp:
+            root = parse(fp.read())
+        modules.append(Compiler().compile(root) if root else Code())
+
+    shaker = TreeShaker(roots)
+    shaken = shaker.shake(modules)
+    for line in shaker.report():
+        print(line)
+    print()
+    print('%-30s %8s %8s' % ('file', 'before', 'after'))
+    for path, code, shaken_code in zip(paths, modules, shaken):
+        print('%-30s %8d %8d' % (path,
+                                 shaker.count_ops(code),
+                                 shaker.count_ops(shaken_code)))
+
+
+if __name__ == '__main__':
+    # Usage: python -m mwel.shaker file.mwel... [--roots name,...]
+    args = sys.argv[1:]
+    roots = ()
+    if '--roots' in args:
+        index = args.index('--roots')
+        roots = args[index+1].split(',')
+        del args[index:index+2]
+    main(args, roots)
@@ -0,0 +1,308 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+
+from jel import opcodes
+
+from . import ast
+from .compiler import Compiler
+from .executor import Executor
+from .peephole import Optimizer
+
+
+class Specializer(Optimizer):
+
+    """
+    Partial evaluator for compiled MWEL modules.
+
+    `constants` maps global names to values that are known, and won't
+    change, when the module runs.  specialize() returns a copy of a module
+    in which every read of one of those globals loads its value as a
+    constant.  The constants are then propagated: operators whose operands
+    are all constant are evaluated (unless evaluating them raises an
+    error, which is left to happen at run time), and a global that the
+    module binds to a constant exactly once, at its top level, is also
+    treated as a constant by the top-level code that follows the binding
+    (so host functions mustn't rebind it).
+    Finally, 'if' clauses whose conditions are constant are resolved, and
+    'while' loops whose conditions are constantly false are removed.
+
+    Like Compiler(inline_control_flow=True), pruning assumes that 'if:'
+    and 'while:' compounds are run by the standard handlers, and a pruned
+    'if' is compiled to IF_ELSE.  Rewrites are counted in `stats`, as by
+    Optimizer, along with the peephole optimizations, which are also
+    applied.
+    """
+
+    def __init__(self, constants, compiler_class=Compiler,
+                 executor_class=Executor):
+        super(Specializer, self).__init__(compiler_class)
+        self.constants = dict(constants)
+        self.compiler_class = compiler_class
+
+        cc = compiler_class
+        self._binary_ops = dict(
+            (cc.op_codes[name], executor_class.binary_ops[op]) for op, name in
+            cc.specialized_binary_ops.items()
+            )
+        self._comparison_ops = dict(
+            (cc.op_codes[name], executor_class.comparison_ops[op]) for op, name
+            in cc.specialized_comparison_ops.items()
+            )
+        self._generic_binary_ops = tuple(executor_class.binary_ops[op]
+                                         for op in cc.binary_op_names)
+        self._generic_comparison_ops = tuple(
+            executor_class.comparison_ops[op] for op in cc.comparison_op_names
+            )
+
+        op_codes = self.op_codes
+        self._load_global = op_codes['LOAD_GLOBAL']
+        self._store_globals = frozenset((op_codes['STORE_GLOBAL'],
+                                         op_codes['DUP_STORE_GLOBAL']))
+        self._make_function = op_codes['MAKE_FUNCTION']
+
+        self._module = None
+        self._bound_once = frozenset()
+        self._function_code = frozenset()
+        self._derived = {}
+        self._context = []
+
+        self._patterns[self._load_global] = ('load_global',
+                                             self._load_constant)
+        self._patterns[op_codes['BINARY_OP']] = ('binary_op',
+                                                 self._fold_binary_op)
+        for code in self._binary_ops:
+            self._patterns[code] = ('binary_op', self._fold_binary_op)
+        self._patterns[op_codes['COMPARE_OP']] = ('compare_op',
+                                                  self._fold_compare_op)
+        for code in self._comparison_ops:
+            self._patterns[code] = ('compare_op', self._fold_compare_op)
+        for name in ('LOGICAL_AND', 'LOGICAL_OR'):
+            self._patterns[op_codes[name]] = ('logical_op',
+                                              self._fold_logical_op)
+        self._patterns[op_codes['CALL_COMPOUND']] = ('call_compound',
+                                                     self._prune_compound)
+        self._patterns[op_codes['IF_ELSE']] = ('if_else', self._prune_if_else)
+        self._patterns[op_codes['WHILE_LOOP']] = ('while_loop',
+                                                  self._prune_while_loop)
+        for code in self._store_globals:
+            self._patterns[code] = ('dup_store', self._bind_constant)
+
+    def specialize(self, module):
+        """
+        Returns a specialized copy of `module` (compiled code, or a Module
+        AST, which is compiled first).  Raises ValueError if the module
+        binds any of the known globals.
+        """
+        if isinstance(module, ast.Module):
+            module = self.compiler_class().compile(module)
+
+        bindings = collections.Counter()
+        function_code = set()
+
+        def scan(ops, in_function):
+            for op in ops:
+                if op[0] in self._store_globals:
+                    bindings[op[3][0]] += 1
+                nested_in_function = (in_function or
+                                      op[0] == self._make_function)
+
+                def visit(nested_ops, is_expr, num_args):
+                    if nested_in_function:
+                        function_code.add(id(nested_ops))
+                    scan(nested_ops, nested_in_function)
+                    return nested_ops
+
+                opcodes.map_nested_code(op, visit)
+
+        scan(module, False)
+        for name in sorted(bindings):
+            if name in self.constants:
+                raise ValueError('Global name %r is bound by the module' %
+                                 str(name))
+
+        self._module = module
+        self._bound_once = frozenset(n for n, count in bindings.items() if
+                                     count == 1)
+        self._function_code = function_code
+        self._derived = {}
+        return self.optimize(module)
+
+    def _optimize(self, ops, is_expr=None, num_args=None):
+        self._context.append(ops)
+        try:
+            return super(Specializer, self)._optimize(ops, is_expr, num_args)
+        finally:
+            self._context.pop()
+
+    #
+    # Constants
+    #
+
+    def _load_constant(self, out):
+        op = out[-1]
+        name = op[3][0]
+        if name in self.constants:
+            value = self.constants[name]
+        elif (name in self._derived and
+              id(self._context[-1]) not in self._function_code):
+            value = self._derived[name]
+        else:
+            return 0
+        out[-1] = self._load_const(op, value)
+        return 0
+
+    def _bind_constant(self, out):
+        # A global that the module's top-level code binds once, to a
+        # constant, is constant for the rest of that code (including the
+        # clauses of compound calls, but not functions, which might be
+        # called before the binding)
+        removed = 0
+        if out[-1][0] == self.op_codes['STORE_GLOBAL']:
+            removed = self._fuse_dup_store(out)
+        name = out[-1][3][0]
+        if (self._context[-1] is self._module) and (name in self._bound_once):
+            value = self._trailing_consts(out, 1)
+            if value is not None:
+                self._derived[name] = value[0]
+        return removed
+
+    def _fold_binary_op(self, out):
+        op = out[-1]
+        operands = self._trailing_consts(out, 2)
+        if operands is None:
+            return 0
+        if op[0] in self._binary_ops:
+            func = self._binary_ops[op[0]]
+        else:
+            func = self._generic_binary_ops[op[3][0]]
+        try:
+            value = func(*operands)
+        except Exception:
+            return 0
+        return self._replace_tail(out, 3, self._load_const(op, value))
+
+    def _fold_compare_op(self, out):
+        op = out[-1]
+        if op[0] in self._comparison_ops:
+            operands = self._trailing_consts(out, 2)
+            funcs = (self._comparison_ops[op[0]],)
+        else:
+            operands = tuple(self._const_value(o) for o in op[3][1])
+            if any(o is _nonconst for o in operands):
+                operands = None
+            funcs = tuple(self._generic_comparison_ops[c] for c in op[3][0])
+        if operands is None:
+            return 0
+        try:
+            value = all(f(lhs, rhs) for f, lhs, rhs in
+                        zip(funcs, operands, operands[1:]))
+        except Exception:
+            return 0
+        if op[0] in self._comparison_ops:
+            return self._replace_tail(out, 3, self._load_const(op, value))
+        out[-1] = self._load_first_const(op, value)
+        return self.count_ops((op,)) - 1
+
+    def _fold_logical_op(self, out):
+        # Constant operands that can't decide the result (true ones for
+        # 'and', false ones for 'or') are dropped, as are all operands after
+        # one that does
+        op = out[-1]
+        deciding = (op[0] == self.op_codes['LOGICAL_OR'])
+        operands = []
+        for operand in op[3][0]:
+            value = self._const_value(operand)
+            if value is _nonconst:
+                operands.append(operand)
+            elif bool(value) == deciding:
+                operands.append(operand)
+                break
+        if not any(self._const_value(o) is _nonconst for o in operands):
+            new_op = self._load_first_const(op, (bool(operands) == deciding))
+        elif len(operands) < len(op[3][0]):
+            new_op = op[:3] + ((tuple(operands),),)
+        else:
+            return 0
+        out[-1] = new_op
+        return self.count_ops((op,)) - self.count_ops((new_op,))
+
+    def _load_first_const(self, op, value):
+        # Like _load_const, for ops (such as COMPARE_OP and LOGICAL_AND)
+        # whose positions are tuples, with one item per operator
+        return (self.op_codes['LOAD_CONST'], op[1][0], op[2][0], (value,))
+
+    def _const_value(self, ops):
+        # Returns the value of `ops` if it's a single LOAD_CONST, or
+        # _nonconst otherwise
+        if len(ops) == 1 and ops[0][0] == self.op_codes['LOAD_CONST']:
+            return ops[0][3][0]
+        return _nonconst
+
+    #
+    # Control flow
+    #
+
+    def _prune_compound(self, out):
+        # Only calls that Compiler(inline_control_flow=True) would lower are
+        # candidates
+        op = out[-1]
+        name, clauses = op[3]
+        family = name[:name.index(':') + 1]
+        if ((family not in ('if:', 'while:')) or
+            any(num_locals or len(arg_list) > 1
+                for arg_list, num_locals, body in clauses)):
+            return 0
+
+        conditions = []
+        for arg_list, num_locals, body in clauses:
+            if isinstance(arg_list, collections.OrderedDict):
+                arg_list = tuple(arg_list.values())
+            conditions.append(((arg_list[0] if arg_list else None), body))
+
+        if family == 'if:':
+            return self._prune_if(out, op, conditions)
+        if len(conditions) != 1 or conditions[0][0] is None:
+            return 0
+        return self._prune_while(out, op, conditions[0][0])
+
+    def _prune_if_else(self, out):
+        op = out[-1]
+        return self._prune_if(out, op, op[3][0])
+
+    def _prune_while_loop(self, out):
+        op = out[-1]
+        return self._prune_while(out, op, op[3][0])
+
+    def _prune_if(self, out, op, clauses):
+        # Clauses with constantly false conditions are dropped, and a clause
+        # with a constantly true condition becomes the else clause
+        if all(self._const_value(cond) is _nonconst for cond, body in
+               clauses if cond is not None):
+            return 0
+        remaining = []
+        for cond, body in clauses:
+            value = (True if cond is None else self._const_value(cond))
+            if value is _nonconst:
+                remaining.append((cond, body))
+            elif value:
+                remaining.append((None, body))
+                break
+
+        if (not remaining) or (remaining[0][0] is None and
+                               not remaining[0][1]):
+            # Nothing, or an empty clause, runs
+            del out[-1]
+            return self.count_ops((op,))
+        new_op = (self.op_codes['IF_ELSE'], op[1], op[2], (tuple(remaining),))
+        out[-1] = new_op
+        return self.count_ops((op,)) - self.count_ops((new_op,))
+
+    def _prune_while(self, out, op, cond):
+        value = self._const_value(cond)
+        if (value is _nonconst) or value:
+            return 0
+        del out[-1]
+        return self.count_ops((op,))
+
+
+_nonconst = object()
@@ -0,0 +1,86 @@
+from __future__ import division, print_function, unicode_literals
+
+from ..codegen import PythonExecutor
+from .test_executor import TestExecutor
+
+
+class TestPythonExecutor(TestExecutor):
+
+    executor_class = PythonExecutor
+
+    def test_native_return(self):
+        code = self.compile('''
+function f(x):
+    if (x > 1):
+        return 'a'
+    end
+    return 'b'
+end
+return [f(2), f(0)]
+''')
+        executor = PythonExecutor()
+        self.assertEqual(('a', 'b'), executor.run(code))
+        function = executor.names['f']
+        self.assertIn((PythonExecutor, 1, True),
+                      function.body.python_functions)
+        # The if clause's body is executed as part of a compound call, so
+        # its return statement raises Return
+        clause_body = function.body[1][3][1][0][2]
+        self.assertIn((PythonExecutor, 0, False),
+                      clause_body.python_functions)
+
+    def test_inline_control_flow(self):
+        code = self.compile('''
+function f(x):
+    while (x > 0):
+        if (x > 1):
+            return 'a'
+        end
+        x = x - 1
+    end
+    return 'b'
+end
+return [f(2), f(1)]
+''', inline_control_flow=True)
+        executor = PythonExecutor()
+        self.assertEqual(('a', 'b'), executor.run(code))
+        # Lowered clause bodies are generated inline, so their return
+        # statements return from the function's generated code
+        body = executor.names['f'].body
+        cond, loop_body = body[1][3]
+        self.assertFalse(hasattr(loop_body, 'python_functions'))
+
+    def test_deep_nesting(self):
+        # Python limits the number of nested blocks, so deeply nested
+        # clauses run as separate functions
+        depth = 30
+        s = ('function f(x):\n' +
+             ''.join('    ' * i + 'if (x > %d):\n' % i for i in
+                     range(1, depth + 1)) +
+             '    ' * (depth + 1) + 'return x\n' +
+             ''.join('    ' * i + 'end\n' for i in range(depth, 0, -1)) +
+             '    i = 0\n    while (i < x):\n' +
+             ''.join('    ' * i + 'if (x > 0):\n' for i in
+                     range(2, depth + 2)) +
+             '    ' * (depth + 2) + 'i = i + 1\n' +
+             ''.join('    ' * i + 'end\n' for i in range(depth + 1, 0, -1)) +
+             '    return -i\nend\n'
+             'return [f(31), f(5)]\n')
+        for inline_control_flow in (False, True):
+            self.assertEqual((31.0, -5.0), self.run_module(
+                s,
+                inline_control_flow = inline_control_flow,
+                ))
+
+    def test_long_if_chain(self):
+        # Clauses don't add levels of indentation, which Python limits
+        s = ('function f(x):\n    if (x == 0):\n        return 0\n' +
+             ''.join('    else if (x == %d):\n        return %d\n' % (i, i)
+                     for i in range(1, 120)) +
+             '    else:\n        y = -1\n    end\n    return y\nend\n'
+             'return [f(0), f(57), f(119), f(500)]\n')
+        for inline_control_flow in (False, True):
+            self.assertEqual((0.0, 57.0, 119.0, -1.0), self.run_module(
+                s,
+                inline_control_flow = inline_control_flow,
+                ))
@@ -2,21 +2,21 @@ from __future__ import division, print_function, unicode_literals
 import collections
 import unittest
 
-from jel.test.test_compiler import CompilerTestMixin
+from jel.test.test_compiler import CompilerTestMixin as JELCompilerTestMixin
 
 from ..compiler import Compiler
 from ..lexer import Lexer
 from ..parser import Parser
 
 
-class TestCompiler(CompilerTestMixin, unittest.TestCase):
+class CompilerTestMixin(JELCompilerTestMixin):
 
     lexer_class = Lexer
     parser_class = Parser
     compiler_class = Compiler
 
     def setUp(self):
-        super(TestCompiler, self).setUp()
+        super(CompilerTestMixin, self).setUp()
 
         orig_compile = self.compile
         def compile_wrapper(s):
@@ -37,11 +37,18 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
         self.compile = compile_wrapper
 
     def assertOp(self, op_name, lineno, colno, *args):
-        lexpos = self.lineno_to_lexpos[lineno] + colno - 1
-        return super(TestCompiler, self).assertOp(op_name,
-                                                  lineno,
-                                                  lexpos,
-                                                  *args)
+        if isinstance(lineno, tuple):
+            lexpos = tuple(self.lineno_to_lexpos[l] + c - 1 for l, c in
+                           zip(lineno, colno))
+        else:
+            lexpos = self.lineno_to_lexpos[lineno] + colno - 1
+        return super(CompilerTestMixin, self).assertOp(op_name,
+                                                       lineno,
+                                                       lexpos,
+                                                       *args)
+
+
+class TestCompiler(CompilerTestMixin, unittest.TestCase):
 
     def test_chained_assignment_stmt(self):
         with self.compile('''
@@ -105,6 +112,15 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
         test_augassign('%')
         test_augassign('**')
 
+        self.compiler = Compiler(specialized_ops=True)
+        with self.compile('''
+                          foo -= 1
+                          '''):
+            self.assertOp('LOAD_GLOBAL', 2, 27, 'foo')
+            self.assertOp('LOAD_CONST', 2, 34, 1.0)
+            self.assertOp('BINARY_SUB', 2, 31)
+            self.assertOp('STORE_GLOBAL', 2, 31, 'foo')
+
     def get_call_stmt_body(self, lineno, lexpos):
         args = self.assertOp('CALL_COMPOUND', lineno, lexpos)
         return args[1][0][2]
@@ -331,6 +347,73 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
                 self.assertOp('LOAD_CONST', 7, 35, 6.0)
                 self.assertOp('STORE_GLOBAL', 7, 33, 'z')
  
+    def test_inline_control_flow(self):
+        self.compiler = Compiler(inline_control_flow=True)
+
+        with self.compile('''
+                          if (a):
+                              local x = 1
+                          else if (cond = b):
+                              y = 2
+                          else:
+                              y = 3
+                          end
+                          '''):
+            args = self.assertOp('IF_ELSE', 2, 27)
+            self.assertEqual(1, len(args))
+            clauses = args[0]
+            self.assertEqual(3, len(clauses))
+
+            cond, body = clauses[0]
+            with self.assertOpList(cond):
+                self.assertOp('LOAD_GLOBAL', 2, 31, 'a')
+            with self.assertOpList(body):
+                self.assertOp('LOAD_CONST', 3, 41, 1.0)
+                self.assertOp('INIT_LOCAL', 3, 31, 'x')
+
+            cond, body = clauses[1]
+            with self.assertOpList(cond):
+                self.assertOp('LOAD_GLOBAL', 4, 43, 'b')
+            with self.assertOpList(body):
+                self.assertOp('LOAD_CONST', 5, 35, 2.0)
+                self.assertOp('STORE_GLOBAL', 5, 33, 'y')
+
+            cond, body = clauses[2]
+            self.assertIsNone(cond)
+            with self.assertOpList(body):
+                self.assertOp('LOAD_CONST', 7, 35, 3.0)
+                self.assertOp('STORE_GLOBAL', 7, 33, 'y')
+
+        with self.compile('''
+                          while (a):
+                              local x = a
+                              a = x
+                          end
+                          '''):
+            cond, body = self.assertOp('WHILE_LOOP', 2, 27)
+            with self.assertOpList(cond):
+                self.assertOp('LOAD_GLOBAL', 2, 34, 'a')
+            with self.assertOpList(body):
+                self.assertOp('LOAD_GLOBAL', 3, 41, 'a')
+                self.assertOp('INIT_LOCAL', 3, 31, 'x')
+                self.assertOp('LOAD_LOCAL', 4, 35, 'x')
+                self.assertOp('STORE_GLOBAL', 4, 33, 'a')
+
+        # Calls that the standard handlers reject, and calls to other
+        # compounds, aren't lowered
+        for s in ('if (a, b):\nend\n',
+                  'if (a) -> x:\nend\n',
+                  'while ():\nend\n',
+                  'while (a):\nelse:\nend\n',
+                  'when (a):\nend\n'):
+            with self.compile(s):
+                self.assertOp('CALL_COMPOUND', 1, 1)
+
+        # Lowering is optional
+        self.compiler = Compiler()
+        with self.compile('if (a):\nend\n'):
+            self.assertOp('CALL_COMPOUND', 1, 1)
+
     def test_call_expr_with_named_args(self):
         with self.compile('''
                           x = foo(a=true, b=false, c <- foo[0].bar, d=null)
@@ -523,6 +606,32 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
 
             self.assertOp('STORE_LOCAL', 3, 33, 'foo')
 
+    def test_max_stack_depth(self):
+        compiled = []
+        def compile_root(root):
+            compiled.append(self.compiler.compile(root))
+            return ()
+        self.compile_root = compile_root
+
+        with self.compile('''
+                          a[b] = c.d = e = [1, 2]
+                          function foo(x, y):
+                              return x + y
+                          end
+                          bar () -> z:
+                              z += 1
+                          end
+                          '''):
+            pass
+
+        ops = compiled[0]
+        self.assertEqual(3, ops.max_stack_depth)
+        func = ops[11]
+        self.assertEqual('MAKE_FUNCTION', self.compiler.op_names[func[0]])
+        self.assertEqual(2, func[3][1].max_stack_depth)
+        clause = ops[-1][3][1][0]
+        self.assertEqual(2, clause[2].max_stack_depth)
+
     def test_return_stmt(self):
         with self.compile('''
                           return 2*x
@@ -748,3 +857,28 @@ class TestCompiler(CompilerTestMixin, unittest.TestCase):
             self.assertOp('CONCAT_ARRAYS', 2, 31, 5)
 
             self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+
+    def test_deeply_nested_functions(self):
+        # Deeper than Python's recursion limit
+        depth = 1500
+        lines = []
+        for level in range(depth):
+            lines.append('%sfunction f%d(a%d):' % (' ' * level, level, level))
+        lines.append('%sreturn a0' % (' ' * depth))
+        for level in reversed(range(depth)):
+            lines.append('%send' % (' ' * level))
+
+        code = self.compiler.compile(self.parse('\n'.join(lines) + '\n'))
+        closure = ()
+        for level in range(depth):
+            self.assertEqual((2 if level == 0 else 3), len(code))
+            make_function = code[-2]
+            self.assertEqual(self.compiler.op_codes['MAKE_FUNCTION'],
+                             make_function[0])
+            self.assertEqual(closure, make_function[3][2])
+            code = make_function[3][1]
+            closure = (('a0', -level),)
+
+        self.assertEqual(3, len(code))
+        self.assertEqual(self.compiler.op_codes['LOAD_CLOSURE'], code[1][0])
+        self.assertEqual(('a0',), code[1][3])
@@ -0,0 +1,163 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from .. import ast
+from ..compiler import Compiler
+from ..cse import Eliminator
+from ..executor import Executor
+from ..lexer import Lexer
+from ..parser import Parser
+
+
+class TestEliminator(unittest.TestCase):
+
+    def setUp(self):
+        def error_logger(*info):
+            self.fail('unexpected error in input: ' + repr(info))
+
+        l = Lexer(error_logger)
+        p = Parser(l.tokens, error_logger)
+        self.lexer = l.build()
+        self.parser = p.build()
+        self.eliminator = Eliminator()
+
+    def parse(self, s):
+        self.lexer.lineno = 1  # Reset lineno
+        return self.parser.parse(s, lexer=self.lexer)
+
+    def eliminate(self, s):
+        root = self.parse(s)
+        result = self.eliminator.eliminate(root)
+        self.assertEqual(self.parse(s), root)  # Input is unchanged
+        return result
+
+    def assertEliminated(self, expected, s):
+        self.assertEqual(self.parse(expected), self.eliminate(s))
+
+    def run_module(self, root, names):
+        Executor(names).run(Compiler().compile(root))
+        return names
+
+    def test_across_statements(self):
+        s = '''
+x = w / 2 + 1
+y = (w / 2 + 1) * 3
+'''
+        result = self.eliminate(s)
+        self.assertEqual(3, len(result.statements))
+        local = result.statements[0]
+        self.assertIsInstance(local, ast.LocalStmt)
+        self.assertEqual('$cse0', local.name)
+        self.assertEqual(ast.IdentifierExpr(value='$cse0'),
+                         result.statements[1].value)
+        self.assertEqual(ast.IdentifierExpr(value='$cse0'),
+                         result.statements[2].value.operands[0])
+
+        self.assertEqual(1, self.eliminator.stats['expressions'])
+        self.assertEqual(2, self.eliminator.stats['occurrences'])
+        name, expr, locations = self.eliminator.eliminated[0]
+        self.assertEqual('$cse0', name)
+        self.assertEqual(self.parse('x = w / 2 + 1\n').statements[0].value,
+                         expr)
+        self.assertEqual(((2, 11), (3, 26)), locations)
+        self.assertEqual('$cse0: 2 occurrences '
+                         '(line 2, column 11, line 3, column 12)',
+                         self.eliminator.report(s))
+
+        for root in (self.parse(s), result):
+            names = self.run_module(root, {'w': 4.0})
+            self.assertEqual(3.0, names['x'])
+            self.assertEqual(9.0, names['y'])
+
+    def test_within_statement(self):
+        result = self.eliminate('y = -w * -w\n')
+        self.assertEqual(2, len(result.statements))
+        self.assertEqual(self.parse('y = -w\n').statements[0].value,
+                         result.statements[0].value)
+        self.assertEqual(self.run_module(self.parse('y = -w * -w\n'),
+                                         {'w': 3.0})['y'],
+                         self.run_module(result, {'w': 3.0})['y'])
+
+    def test_largest_expression_wins(self):
+        result = self.eliminate('''
+x = (a + b) * c
+y = (a + b) * c
+z = a + b
+''')
+        self.assertEqual(4, len(result.statements))
+        self.assertEqual(['$cse0'], [e.name for e in
+                                     self.eliminator.eliminated])
+
+    def test_assignment_ends_reuse(self):
+        self.assertEliminated('''
+x = w + 1
+w = 2
+y = w + 1
+''', '''
+x = w + 1
+w = 2
+y = w + 1
+''')
+
+        # Stores to attributes and items modify their base value
+        for stmt in ('w.x = 2', 'w[0] += 2', 'local w = 2',
+                     'function w():\n    return\nend'):
+            s = 'x = w + 1\n%s\ny = w + 1\n' % stmt
+            self.assertEliminated(s, s)
+
+        # Assigning an unrelated name doesn't
+        result = self.eliminate('''
+x = w + 1
+v = 2
+y = w + 1
+''')
+        self.assertEqual(4, len(result.statements))
+
+    def test_calls_end_reuse(self):
+        for stmt in ('f()', 'v = f()', 'if (true):\nend'):
+            s = 'x = w + 1\n%s\ny = w + 1\n' % stmt
+            self.assertEliminated(s, s)
+
+        # The arguments of a call are evaluated before the call
+        result = self.eliminate('''
+x = w + 1
+f(w + 1)
+y = w + 1
+''')
+        self.assertEqual(4, len(result.statements))
+        self.assertEqual(2, self.eliminator.stats['occurrences'])
+
+    def test_conditional_operands(self):
+        for s in ('x = w or (w + 1)\ny = w + 1\n',
+                  'x = w < 1 < w + 1\ny = w + 1\n',
+                  'x = function () w + 1 end\ny = w + 1\n'):
+            self.assertEliminated(s, s)
+
+        # The first operand is always evaluated
+        result = self.eliminate('x = (w + 1) and w\ny = w + 1\n')
+        self.assertEqual(3, len(result.statements))
+
+    def test_constants_are_ignored(self):
+        s = 'x = -1 + 2\ny = -1 + 2\n'
+        self.assertEliminated(s, s)
+
+    def test_nested_statement_lists(self):
+        s = '''
+function g(a):
+    x = a * 2
+    return a * 2
+end
+if (true):
+    y = v * 2
+    z = v * 2
+end
+'''
+        result = self.eliminate(s)
+        self.assertEqual(2, self.eliminator.stats['expressions'])
+        self.assertEqual(3, len(result.statements[0].body))
+        self.assertEqual(3, len(result.statements[1].clauses[0].body))
+
+        names = self.run_module(result, {'v': 5.0})
+        self.assertEqual(10.0, names['y'])
+        self.assertEqual(10.0, names['z'])
+        self.assertEqual(4.0, Executor(names).call(names['g'], (2.0,)))
@@ -0,0 +1,197 @@
+from __future__ import division, print_function, unicode_literals
+import collections
+import unittest
+
+from jel.executor import ExecutionError
+from jel.test.test_executor import ExecutorTestMixin, Position
+
+from ..compiler import Compiler
+from ..executor import Executor
+from ..lexer import Lexer
+from ..parser import Parser
+
+
+class TestExecutor(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+    executor_class = Executor
+
+    def run_module(self, s, names=None, compounds=None, **compiler_options):
+        executor = self.executor_class(names, compounds=compounds)
+        return executor.run(self.compile(s, **compiler_options))
+
+    def test_assignment(self):
+        names = {'obj': {'a': 1.0}, 'arr': [1.0, 2.0]}
+        self.assertEqual((3.0, 6.0, 5.0), self.run_module('''
+x = y = 3
+obj.a += 5
+arr[1] = arr[0] = 5
+return [x, obj.a, arr[1]]
+''', names))
+        self.assertEqual(3.0, names['y'])
+
+        # Only public attributes of host objects can be assigned
+        names = {'p': Position(1.0), 's': 'foo'}
+        self.assertEqual(3.0, self.run_module('p.h *= 3\nreturn p.h\n',
+                                              names))
+        for s, msg in (('s.count = 1', "TypeError: 'str' object does not "
+                                       "support attribute access"),
+                       ('p._h = 1', "AttributeError: 'Position' object has "
+                                    "no attribute '_h'")):
+            with self.assertRaises(ExecutionError) as cm:
+                self.run_module(s + '\n', names)
+            self.assertEqual(msg, cm.exception.args[0])
+        self.assertEqual(1.0, names['p']._h)
+
+    def test_compounds(self):
+        self.assertEqual((10.0, 'medium'), self.run_module('''
+total = 0
+i = 0
+while (i < 5):
+    local j = i
+    total = total + j
+    i = i + 1
+end
+if (total > 100):
+    size = 'big'
+else if (total > 5):
+    size = 'medium'
+else:
+    size = 'small'
+end
+return [total, size]
+'''))
+
+        calls = []
+        def repeat(clauses):
+            count, = clauses[0].evaluate_args()
+            for index in range(int(count)):
+                clauses[0].run()
+            calls.append(count)
+
+        names = {'n': 0.0}
+        self.run_module('''
+repeat (3):
+    n = n + 1
+end
+''', names, compounds={'repeat:': repeat})
+        self.assertEqual(3.0, names['n'])
+        self.assertEqual([3.0], calls)
+
+        with self.assertRaises(ExecutionError) as cm:
+            self.run_module('x = 1\nunknown():\nend\n')
+        self.assertEqual("Unknown compound call: 'unknown:'",
+                         cm.exception.args[0])
+        self.assertEqual(2, cm.exception.lineno)
+
+    def test_inline_control_flow(self):
+        s = '''
+total = 0
+i = 0
+while (i < 5):
+    local j = i
+    if (j % 2 == 0):
+        total = total + j
+    else if (j == 3):
+        total = total + 100
+    else:
+        local k = j * 10
+        total = total + k
+    end
+    adders[j] = function (v) v + j end
+    i = i + 1
+end
+function sign(x):
+    if (x < 0):
+        return -1
+    else if (x > 0):
+        return 1
+    end
+    return 0
+end
+return [total, sign(-3), sign(0), sign(2), adders[3](1)]
+'''
+        expected = (116.0, -1.0, 0.0, 1.0, 4.0)
+        for inline_control_flow in (False, True):
+            self.assertEqual(expected, self.run_module(
+                s,
+                {'adders': [None] * 5},
+                inline_control_flow = inline_control_flow,
+                ))
+
+        # Lowered compounds don't use the executor's handlers
+        self.assertEqual(1.0, self.run_module(
+            'if (true):\n    return 1\nend\n',
+            compounds = {},
+            inline_control_flow = True,
+            ))
+
+        # Calls that the standard handlers reject still fail at run time
+        with self.assertRaises(ExecutionError) as cm:
+            self.run_module('x = 1\nif (x, x):\nend\n',
+                            inline_control_flow=True)
+        self.assertEqual('if takes exactly one argument',
+                         cm.exception.args[0])
+        self.assertEqual(2, cm.exception.lineno)
+
+        with self.assertRaises(ExecutionError) as cm:
+            self.run_module('x = 1\nwhile (x < 2):\n    x = y\nend\n',
+                            inline_control_flow=True)
+        self.assertEqual("Undefined name: 'y'", cm.exception.args[0])
+        self.assertEqual(3, cm.exception.lineno)
+
+    def test_functions(self):
+        self.assertEqual((5.0, 'a', 'b', 7.0, 2.0), self.run_module('''
+function add(x, y):
+    return x + y
+end
+function choose(x):
+    if (x > 1):
+        return 'a'
+    end
+    return 'b'
+end
+function make_adder(k):
+    return function (v) v + k end
+end
+function counter():
+    local n = 0
+    function next():
+        n = n + 1
+        return n
+    end
+    return next
+end
+next = counter()
+first = next()
+return [add(2, 3), choose(2), choose(x = 0), make_adder(3)(4), next()]
+'''))
+
+    def test_call_statement(self):
+        values = []
+        def append(value):
+            values.append(value)
+
+        self.run_module('append(1)\nappend(value = 2)\n',
+                        {'append': append})
+        self.assertEqual([1.0, 2.0], values)
+
+        with self.assertRaises(ExecutionError) as cm:
+            self.run_module('x = 1\nabs(1)\n', {'abs': abs})
+        self.assertEqual('Result of call statement must be null',
+                         cm.exception.args[0])
+        self.assertEqual(2, cm.exception.lineno)
+
+    def test_arrays(self):
+        self.assertEqual((1.0, 2.0, 3.0, 4.0, 6.0),
+                         self.run_module('n = 6\nreturn [1, 2:4, n]\n'))
+
+    def test_errors(self):
+        with self.assertRaises(ExecutionError) as cm:
+            self.run_module('x = 1\nfunction f(a):\n    return a[5]\nend\n'
+                            'x = f([1])\n')
+        self.assertEqual('IndexError: tuple index out of range',
+                         cm.exception.args[0])
+        self.assertEqual(3, cm.exception.lineno)
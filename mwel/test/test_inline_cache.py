@@ -0,0 +1,107 @@
+from __future__ import division, print_function, unicode_literals
+
+from jel.executor import ExecutionError, HostObject
+from jel.inline_cache import CacheStats
+
+from ..executor import Executor
+from ..inline_cache import caching_executor_class
+from .test_executor import TestExecutor
+
+
+class Point(object):
+
+    def __init__(self, x):
+        self.x = x
+
+
+HostObject.register(Point)
+
+
+class TestCachingExecutor(TestExecutor):
+
+    executor_class = caching_executor_class(Executor)
+
+    def test_store_attr(self):
+        names = {'p': Point(1.0), 'd': {'x': 1.0}}
+        executor = self.executor_class(names)
+        code = self.compile('''
+i = 0
+while (i < 3):
+    p.x = p.x + 1
+    d.x = d.x * 2
+    i = i + 1
+end
+''')
+        executor.run(code)
+        self.assertEqual(4.0, names['p'].x)
+        self.assertEqual(8.0, names['d']['x'])
+        stats = executor.cache_stats()
+        self.assertEqual(CacheStats(4, 2, 0), stats['STORE_ATTR'])
+        self.assertEqual(CacheStats(4, 2, 0), stats['LOAD_ATTR'])
+
+    def test_calls(self):
+        values = []
+        names = {'append': values.append}
+        executor = self.executor_class(names)
+        code = self.compile('''
+function sub(a, b):
+    return a - b
+end
+total = 0
+i = 0
+while (i < 4):
+    total = total + sub(b = i, a = 2 * i) + sub(0, 0)
+    append(i)
+    i = i + 1
+end
+return total
+''')
+        self.assertEqual(6.0, executor.run(code))
+        self.assertEqual([0.0, 1.0, 2.0, 3.0], values)
+
+        # Callees that aren't MWEL functions are cached by type
+        stats = executor.cache_stats()
+        self.assertEqual(CacheStats(6, 2, 0), stats['CALL_FUNCTION'])
+        self.assertEqual(CacheStats(3, 1, 0), stats['CALL_SIMPLE'])
+
+    def test_call_invalidation(self):
+        executor = self.executor_class()
+        code = self.compile('''
+function f(x):
+    return x + 1
+end
+function g(x):
+    return x * 10
+end
+''')
+        executor.run(code)
+        call = self.compile('return f(2)\n')
+        self.assertEqual(3.0, executor.run(call))
+        self.assertEqual(3.0, executor.run(call))
+
+        # Calling a different function misses
+        f = executor.names['f']
+        executor.names['f'] = executor.names['g']
+        self.assertEqual(20.0, executor.run(call))
+
+        # Replacing the body of the cached function invalidates the cache
+        g = executor.names['g']
+        g.body = f.body
+        self.assertEqual(3.0, executor.run(call))
+        self.assertEqual({'CALL_FUNCTION': CacheStats(1, 2, 1)},
+                         executor.cache_stats())
+
+    def test_argument_errors(self):
+        executor = self.executor_class()
+        executor.run(self.compile('''
+function f(a, b):
+    return a
+end
+'''))
+        for call, msg in (('f(1)', 'Function takes 2 arguments (1 given)'),
+                          ('f(a = 1, c = 2)', "Unexpected argument: 'c'")):
+            code = self.compile('return %s\n' % call)
+            for i in range(2):
+                with self.assertRaises(ExecutionError) as cm:
+                    executor.run(code)
+                self.assertEqual('TypeError: ' + msg, cm.exception.args[0])
@@ -0,0 +1,192 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from jel import opcodes
+from jel.executor import ExecutionError
+from jel.test.test_executor import ExecutorTestMixin
+
+from ..codegen import PythonExecutor
+from ..compiler import Compiler
+from ..executor import Executor
+from ..lexer import Lexer
+from ..linker import LinkError, Linker, unbound
+from ..parser import Parser
+from ..peephole import Optimizer
+
+
+class TestLinker(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+
+    def link(self, *sources, **kwargs):
+        return Linker(**kwargs).link([self.compile(s) for s in sources])
+
+    def assertLinkError(self, problems, *sources, **kwargs):
+        with self.assertRaises(LinkError) as cm:
+            self.link(*sources, **kwargs)
+        self.assertEqual(problems, cm.exception.problems)
+
+    def op_names(self, ops):
+        names = []
+
+        def visit(ops, is_expr=None, num_args=None):
+            for op in ops:
+                names.append(Compiler.op_names[op[0]])
+                opcodes.map_nested_code(op, visit)
+            return ops
+
+        visit(ops)
+        return names
+
+    def test_slots(self):
+        orig_code = self.compile('''
+x = y = ext
+function f(a):
+    return a + x
+end
+''')
+        program = Linker(externals=('ext',)).link([orig_code])
+        self.assertEqual([('ext', 0), ('y', 1), ('x', 2), ('f', 3)],
+                         list(program.slots.items()))
+        self.assertEqual(frozenset(('ext',)), program.externals)
+
+        code = program.modules[0]
+        self.assertIsInstance(code, opcodes.Code)
+        self.assertIsNot(orig_code, code)
+        self.assertIn('LOAD_GLOBAL', self.op_names(orig_code))
+
+        names = self.op_names(code)
+        self.assertNotIn('LOAD_GLOBAL', names)
+        self.assertNotIn('STORE_GLOBAL', names)
+        self.assertEqual(2, names.count('LOAD_GLOBAL_SLOT'))
+        self.assertEqual(3, names.count('STORE_GLOBAL_SLOT'))
+
+        self.assertEqual(
+            (Compiler.op_codes['LOAD_GLOBAL_SLOT'], 2, 9, ('ext', 0)),
+            code[0],
+            )
+
+        self.assertEqual([1.0, unbound, unbound, unbound],
+                         program.new_globals({'ext': 1.0, 'x': 2.0}))
+
+    def test_optimized_code(self):
+        code = Optimizer().optimize(self.compile('x = y = 1\n'))
+        self.assertIn('DUP_STORE_GLOBAL', self.op_names(code))
+        program = Linker().link([code])
+        self.assertIn('DUP_STORE_GLOBAL_SLOT',
+                      self.op_names(program.modules[0]))
+
+    def test_unbound(self):
+        self.assertLinkError([("Undefined name: 'y'", 0, 1, 4),
+                              ("Undefined name: 'z'", 1, 1, 0)],
+                             'x = y\n',
+                             'z()\n')
+
+        # Functions can read globals bound later, or by later modules
+        self.link('''
+function f():
+    return x + y
+end
+x = 1
+''', 'y = 2\n')
+
+    def test_bound_twice(self):
+        self.assertLinkError([("Global name 'x' is bound more than once",
+                               0, 2, 8)],
+                             'x = 1\nx = 2\n')
+        self.assertLinkError([("Global name 'x' is bound more than once",
+                               1, 2, 8)],
+                             'x = 1\n',
+                             'y = x\nx += 1\n')
+        self.assertLinkError([("Global name 'f' is already defined", 0, 1, 0)],
+                             'function f():\n    return\nend\n',
+                             externals=('f',))
+
+        # Locals can be rebound
+        self.link('local x = 1\nx = 2\n')
+
+    def test_bound_in_branches(self):
+        # Only one clause of an 'if' runs
+        s = ('if (c):\n'
+             '    z = 1\n'
+             'else if (d):\n'
+             '    z = 2\n'
+             'else:\n'
+             '    z = 3\n'
+             'end\n')
+        for inline_control_flow in (False, True):
+            code = self.compile(s, inline_control_flow=inline_control_flow)
+            Linker(externals=('c', 'd')).link([code])
+
+            code = self.compile(s + 'z = 4\n',
+                                inline_control_flow=inline_control_flow)
+            with self.assertRaises(LinkError) as cm:
+                Linker(externals=('c', 'd')).link([code])
+            self.assertEqual([("Global name 'z' is bound more than once",
+                               0, 8, 63)],
+                             cm.exception.problems)
+
+    def test_bound_in_loop(self):
+        s = ('local i = 0\n'
+             'while (i < 3):\n'
+             '    x = i\n'
+             '    i += 1\n'
+             'end\n')
+        for inline_control_flow in (False, True):
+            code = self.compile(s, inline_control_flow=inline_control_flow)
+            with self.assertRaises(LinkError) as cm:
+                Linker().link([code])
+            self.assertEqual([("Global name 'x' cannot be bound within a "
+                               "loop", 0, 3, 33)],
+                             cm.exception.problems)
+
+    def test_bound_in_function(self):
+        self.assertLinkError([("Global name 'x' cannot be bound within a "
+                               "function", 0, 2, 20)],
+                             'function f():\n    x = 1\nend\n')
+        self.assertLinkError([("Global name 'x' cannot be bound within a "
+                               "function", 0, 4, 59)],
+                             'function f():\n'
+                             '    if (true):\n'
+                             '        local y = 1\n'
+                             '        x = y\n'
+                             '    end\n'
+                             'end\n')
+
+    def test_run_program(self):
+        program = self.link('''
+scale = 2
+function f(a):
+    return a * scale + offset
+end
+''', '''
+offset = base + 1
+result = f(4)
+return result
+''', externals=('base',))
+
+        for executor_class in (Executor, PythonExecutor):
+            names = {'base': 10.0}
+            executor = executor_class(names)
+            self.assertEqual(19.0, executor.run_program(program))
+            self.assertEqual(19.0, names['result'])
+            self.assertEqual(2.0, names['scale'])
+
+            # Functions keep using the program's globals
+            self.assertEqual(13.0, names['f'](1.0))
+
+    def test_unbound_at_run_time(self):
+        program = self.link('x = y\ny = 1\n')
+        for executor_class in (Executor, PythonExecutor):
+            with self.assertRaises(ExecutionError) as cm:
+                executor_class().run_program(program)
+            self.assertEqual("Undefined name: 'y'", cm.exception.args[0])
+            self.assertEqual(1, cm.exception.lineno)
+            self.assertEqual(4, cm.exception.lexpos)
+
+        # Externals missing from the executor's names are unbound
+        program = self.link('x = y\n', externals=('y',))
+        with self.assertRaises(ExecutionError):
+            Executor({}).run_program(program)
@@ -0,0 +1,154 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from ..peephole import Optimizer
+from ..ranges import RangeArray
+from .test_compiler import CompilerTestMixin
+
+
+class TestOptimizer(CompilerTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(TestOptimizer, self).setUp()
+        self.optimizer = Optimizer()
+
+    def compile_root(self, root):
+        return self.optimizer.optimize(self.compiler.compile(root))
+
+    def test_dup_store(self):
+        with self.compile('''
+                          a[b] = c.d = e = f = null
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 48, None)
+            self.assertOp('DUP_STORE_GLOBAL', 2, 46, 'f')
+            self.assertOp('DUP_STORE_GLOBAL', 2, 42, 'e')
+            self.assertOp('DUP_TOP', 2, 38)
+            self.assertOp('LOAD_GLOBAL', 2, 34, 'c')
+            self.assertOp('STORE_ATTR', 2, 38, 'd')
+            self.assertOp('LOAD_GLOBAL', 2, 27, 'a')
+            self.assertOp('LOAD_GLOBAL', 2, 29, 'b')
+            self.assertOp('STORE_SUBSCR', 2, 32)
+        self.assertEqual(2, self.optimizer.stats['dup_store'])
+
+    def test_return_const(self):
+        with self.compile('''
+                          return
+                          '''):
+            self.assertOp('RETURN_CONST', 2, 27, None)
+
+        with self.compile('''
+                          two = function () 2 end
+                          '''):
+            args = self.assertOp('MAKE_FUNCTION', 2, 33)
+            with self.assertOpList(args[1]):
+                self.assertOp('RETURN_CONST', 2, 45, 2.0)
+            self.assertOp('STORE_GLOBAL', 2, 31, 'two')
+
+        self.assertEqual(2, self.optimizer.stats['return_const'])
+
+    def test_unreachable(self):
+        with self.compile('''
+                          function foo(x):
+                              return x
+                              y = bar(x, function () 2 end)
+                          end
+                          '''):
+            args = self.assertOp('MAKE_FUNCTION', 2, 27)
+            with self.assertOpList(args[1]):
+                self.assertOp('INIT_LOCAL', 2, 40, 'x')
+                self.assertOp('LOAD_LOCAL', 3, 38, 'x')
+                self.assertOp('RETURN_VALUE', 3, 31)
+            self.assertOp('STORE_GLOBAL', 2, 27, 'foo')
+
+        # LOAD_GLOBAL, CALL_SIMPLE, LOAD_LOCAL, MAKE_FUNCTION, LOAD_CONST,
+        # RETURN_VALUE, STORE_GLOBAL
+        self.assertEqual(7, self.optimizer.stats['unreachable'])
+
+    def test_unary_op(self):
+        with self.compile('''
+                          x = -2
+                          y = not 0
+                          z = -'a'
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 31, -2.0)
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+            self.assertOp('LOAD_CONST', 3, 31, True)
+            self.assertOp('STORE_GLOBAL', 3, 29, 'y')
+            self.assertOp('LOAD_CONST', 4, 32, 'a')
+            self.assertOp('UNARY_OP', 4, 31,
+                          self.compiler.unary_op_codes['-'])
+            self.assertOp('STORE_GLOBAL', 4, 29, 'z')
+
+        self.compiler = self.compiler_class(specialized_ops=True)
+        with self.compile('''
+                          x = -2
+                          z = -'a'
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 31, -2.0)
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+            self.assertOp('LOAD_CONST', 3, 32, 'a')
+            self.assertOp('UNARY_NEG', 3, 31)
+            self.assertOp('STORE_GLOBAL', 3, 29, 'z')
+
+    def test_array_literal_expr(self):
+        with self.compile('''
+                          x = [1, -2, 'a']
+                          y = [1, a]
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 31, (1.0, -2.0, 'a'))
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+            self.assertOp('LOAD_CONST', 3, 32, 1.0)
+            self.assertOp('LOAD_GLOBAL', 3, 35, 'a')
+            self.assertOp('BUILD_ARRAY', 3, 31, 2)
+            self.assertOp('STORE_GLOBAL', 3, 29, 'y')
+
+        with self.compile('''
+                          x = [1, 2:4, 6:10:2, 11]
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 31,
+                          (1.0, 2.0, 3.0, 4.0, 6.0, 8.0, 10.0, 11.0))
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+
+        with self.compile('''
+                          x = [a, 1:3]
+                          '''):
+            self.assertOp('LOAD_GLOBAL', 2, 32, 'a')
+            self.assertOp('BUILD_ARRAY', 2, 31, 1)
+            self.assertOp('LOAD_CONST', 2, 31, (1.0, 2.0, 3.0))
+            self.assertOp('CONCAT_ARRAYS', 2, 31, 2)
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+
+    def test_large_range(self):
+        with self.compile('''
+                          x = [0:1000000000]
+                          y = [1:0]
+                          z = [a:5]
+                          w = [0:1e400]
+                          '''):
+            args = self.assertOp('LOAD_CONST', 2, 31)
+            self.assertIsInstance(args[0], RangeArray)
+            self.assertEqual(1000000001, len(args[0]))
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+            self.assertOp('LOAD_CONST', 3, 31, ())
+            self.assertOp('STORE_GLOBAL', 3, 29, 'y')
+            self.assertOp('LOAD_GLOBAL', 4, 32, 'a')
+            self.assertOp('LOAD_CONST', 4, 34, 5.0)
+            self.assertOp('LOAD_CONST', 4, 31, None)
+            self.assertOp('BUILD_RANGE_ARRAY', 4, 31)
+            self.assertOp('STORE_GLOBAL', 4, 29, 'z')
+            # Errors are left to happen at run time
+            self.assertOp('LOAD_CONST', 5, 32, 0.0)
+            self.assertOp('LOAD_CONST', 5, 34, float('inf'))
+            self.assertOp('LOAD_CONST', 5, 31, None)
+            self.assertOp('BUILD_RANGE_ARRAY', 5, 31)
+            self.assertOp('STORE_GLOBAL', 5, 29, 'w')
+
+    def test_count_ops(self):
+        with self.compile('''
+                          foo (a and b):
+                              x = 1
+                          end
+                          '''):
+            ops = tuple(self.ops[-1])
+            self.assertEqual(6, self.optimizer.count_ops(ops))
+            self.ops[-1].clear()
@@ -0,0 +1,108 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from jel.arrays import ConcatArray, concat_arrays
+
+from ..ranges import RangeArray, build_range_array
+
+
+class TestRangeArray(unittest.TestCase):
+
+    def test_items(self):
+        r = build_range_array(1.0, 3.0)
+        self.assertEqual(3, len(r))
+        self.assertEqual((1.0, 2.0, 3.0), r.materialize())
+        self.assertEqual(1.0, r[0])
+        self.assertEqual(3.0, r[-1])
+        with self.assertRaises(IndexError):
+            r[3]
+
+        self.assertEqual((0.0, 2.5, 5.0), build_range_array(0.0, 6.0, 2.5))
+        self.assertEqual((5.0, 4.0, 3.0), build_range_array(5.0, 3.0, -1.0))
+        self.assertEqual((), build_range_array(3.0, 1.0))
+        self.assertEqual(11, len(build_range_array(0.0, 1.0, 0.1)))
+
+        with self.assertRaises(ValueError):
+            build_range_array(0.0, 1.0, 0.0)
+
+    def test_large(self):
+        r = build_range_array(0.0, 1e12)
+        self.assertEqual(1000000000001, len(r))
+        self.assertEqual(123456789.0, r[123456789])
+        self.assertEqual(1e12, r[-1])
+
+        for stop in (1e300, 1e400):
+            with self.assertRaises(OverflowError):
+                build_range_array(0.0, stop)
+
+    def test_contains(self):
+        r = build_range_array(0.0, 1e12, 2.0)
+        self.assertIn(0.0, r)
+        self.assertIn(4e11, r)
+        self.assertIn(1e12, r)
+        self.assertNotIn(3.0, r)
+        self.assertNotIn(-2.0, r)
+        self.assertNotIn(1e12 + 2.0, r)
+        self.assertNotIn(0.5, r)
+        self.assertNotIn('a', r)
+        self.assertNotIn(float('nan'), r)
+        self.assertNotIn(float('inf'), r)
+
+    def test_slice(self):
+        r = build_range_array(0.0, 10.0)
+        s = r[2:8:2]
+        self.assertIsInstance(s, RangeArray)
+        self.assertEqual((2.0, 4.0, 6.0), s)
+        self.assertEqual((10.0, 9.0, 8.0), r[:-4:-1])
+        self.assertEqual((), r[5:2])
+
+    def test_equality(self):
+        r = build_range_array(1.0, 3.0)
+        self.assertEqual(r, (1.0, 2.0, 3.0))
+        self.assertEqual((1.0, 2.0, 3.0), r)
+        self.assertEqual(r, build_range_array(1.0, 3.5))
+        self.assertNotEqual(r, build_range_array(1.0, 3.0, 2.0))
+        self.assertNotEqual(r, (1.0, 2.0))
+        self.assertNotEqual(r, [1.0, 2.0, 3.0])
+        self.assertEqual(hash((1.0, 2.0, 3.0)), hash(r))
+
+
+class TestConcatArrays(unittest.TestCase):
+
+    def test_concat(self):
+        a = concat_arrays(((1.0,), build_range_array(2.0, 4.0), (5.0,), (6.0,)))
+        self.assertIsInstance(a, ConcatArray)
+        self.assertEqual(3, len(a.parts))
+        self.assertEqual((5.0, 6.0), a.parts[-1])
+        self.assertEqual(6, len(a))
+        self.assertEqual((1.0, 2.0, 3.0, 4.0, 5.0, 6.0), a)
+        self.assertEqual((1.0, 2.0, 3.0, 4.0, 5.0, 6.0),
+                         tuple(a[i] for i in range(6)))
+        self.assertEqual(6.0, a[-1])
+        self.assertEqual((2.0, 4.0), a[1:4:2])
+        self.assertIn(3.0, a)
+        self.assertNotIn(7.0, a)
+        with self.assertRaises(IndexError):
+            a[6]
+
+    def test_nested(self):
+        r = build_range_array(0.0, 1e9)
+        a = concat_arrays((r, (1.0,)))
+        b = concat_arrays((a, a))
+        self.assertEqual(4, len(b.parts))
+        self.assertEqual(2000000004, len(b))
+        self.assertEqual(1.0, b[1000000001])
+        self.assertEqual(0.0, b[1000000002])
+
+    def test_simplification(self):
+        r = build_range_array(0.0, 3.0)
+        self.assertEqual((), concat_arrays(()))
+        self.assertEqual((1.0, 2.0), concat_arrays(((1.0,), (), (2.0,))))
+        self.assertIsInstance(concat_arrays(((1.0,), (2.0,))), tuple)
+        self.assertIs(r, concat_arrays(((), r, ())))
+
+    def test_add(self):
+        r = build_range_array(0.0, 2.0)
+        self.assertEqual((0.0, 1.0, 2.0, 3.0), r + (3.0,))
+        self.assertEqual((3.0, 0.0, 1.0, 2.0), (3.0,) + r)
+        self.assertEqual(6, len(r + r))
@@ -0,0 +1,108 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from jel.test.test_executor import ExecutorTestMixin
+
+from ..compiler import Compiler
+from ..executor import Executor
+from ..lexer import Lexer
+from ..parser import Parser
+from ..shaker import Removal, TreeShaker
+
+
+library = '''
+threshold = 3
+unused_items = [1, 2, 3]
+function helper(x):
+    return x * threshold
+end
+function unused(x):
+    return helper(x) + unused_items[1]
+end
+function step(x):
+    return helper(x) + 1
+end
+a = b = 5
+log('loaded')
+'''
+
+
+class TestTreeShaker(ExecutorTestMixin, unittest.TestCase):
+
+    lexer_class = Lexer
+    parser_class = Parser
+    compiler_class = Compiler
+
+    def shake(self, *sources, **kwargs):
+        shaker = TreeShaker(**kwargs)
+        modules = [self.compile(s) for s in sources]
+        return modules, shaker.shake(modules), shaker
+
+    def test_reachability(self):
+        modules, shaken, shaker = self.shake(library, 'result = step(2)\n')
+        self.assertEqual([Removal(('unused_items',), 0, 3, 28, 5),
+                          Removal(('unused',), 0, 7, 89, 11),
+                          Removal(('b', 'a'), 0, 13, 201, 4)],
+                         shaker.removed)
+        self.assertEqual(['unused_items                   module 0, '
+                          'line 3 (5 ops)',
+                          'unused                         module 0, '
+                          'line 7 (11 ops)',
+                          'b, a                           module 0, '
+                          'line 13 (4 ops)'],
+                         shaker.report())
+
+        # Modules that lose nothing are returned as is
+        self.assertIs(modules[1], shaken[1])
+        self.assertEqual(41, shaker.count_ops(modules[0]))
+        self.assertEqual(21, shaker.count_ops(shaken[0]))
+
+        logged = []
+        names = {'log': logged.append}
+        executor = Executor(names)
+        for code in shaken:
+            executor.run(code)
+        self.assertEqual(7.0, names['result'])
+        self.assertEqual(['loaded'], logged)
+        self.assertNotIn('unused', names)
+
+    def test_roots(self):
+        modules, shaken, shaker = self.shake(library,
+                                             roots=('a', 'step', 'unused'))
+        self.assertEqual([], shaker.removed)
+        self.assertIs(modules[0], shaken[0])
+
+        # A definition is kept if any of the names it binds is reachable
+        modules, shaken, shaker = self.shake(library, roots=('b',))
+        self.assertEqual(['threshold', 'unused_items', 'helper', 'unused',
+                          'step'],
+                         [r.names[0] for r in shaker.removed])
+
+    def test_uses(self):
+        # Statements with side effects are always kept
+        modules, shaken, shaker = self.shake('''
+x = f()
+y = 1 + 2
+z = {'a': 1}
+if (true):
+    w = 2
+end
+''')
+        self.assertEqual([('y',), ('z',)], [r.names for r in shaker.removed])
+
+    def test_operators(self):
+        # Operators on constant operands are definitions, unless evaluating
+        # them raises an error
+        modules, shaken, shaker = self.shake('''
+z = -1
+w = [1:3]
+v = [-2, 2 ** 3] < [1]
+u = 1 / 0
+t = -x
+s = [0:1e400]
+''')
+        self.assertEqual([('z',), ('w',), ('v',)],
+                         [r.names for r in shaker.removed])
+        store = self.compiler_class.op_codes['STORE_GLOBAL']
+        self.assertEqual(['u', 't', 's'], [op[3][0] for op in shaken[0] if
+                                           op[0] == store])
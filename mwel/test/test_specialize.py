@@ -0,0 +1,161 @@
+from __future__ import division, print_function, unicode_literals
+import unittest
+
+from ..executor import Executor
+from ..specialize import Specializer
+from .test_compiler import CompilerTestMixin
+
+
+class TestSpecializer(CompilerTestMixin, unittest.TestCase):
+
+    constants = {'debug': False, 'level': 2.0}
+
+    def setUp(self):
+        super(TestSpecializer, self).setUp()
+        self.specializer = Specializer(self.constants)
+
+    def compile_root(self, root):
+        return self.specializer.specialize(self.compiler.compile(root))
+
+    def test_constants(self):
+        with self.compile('''
+                          x = debug
+                          y = level * 2 + 1
+                          z = 1 < level <= 3
+                          w = level / 0
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 31, False)
+            self.assertOp('STORE_GLOBAL', 2, 29, 'x')
+            self.assertOp('LOAD_CONST', 3, 41, 5.0)
+            self.assertOp('STORE_GLOBAL', 3, 29, 'y')
+            self.assertOp('LOAD_CONST', 4, 33, True)
+            self.assertOp('STORE_GLOBAL', 4, 29, 'z')
+            # Errors are left to happen at run time
+            self.assertOp('LOAD_CONST', 5, 31, 2.0)
+            self.assertOp('LOAD_CONST', 5, 39, 0.0)
+            self.assertOp('BINARY_OP', 5, 37,
+                          self.compiler.binary_op_codes['/'])
+            self.assertOp('STORE_GLOBAL', 5, 29, 'w')
+
+        # LOAD_CONST, LOAD_CONST, BINARY_OP, LOAD_CONST, BINARY_OP
+        self.assertEqual(4, self.specializer.stats['binary_op'])
+        # LOAD_CONST, LOAD_CONST, LOAD_CONST
+        self.assertEqual(3, self.specializer.stats['compare_op'])
+
+    def test_logical_op(self):
+        with self.compile('''
+                          a = debug and ready
+                          b = debug or ready
+                          c = ready and not debug
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 37, False)
+            self.assertOp('STORE_GLOBAL', 2, 29, 'a')
+            args = self.assertOp('LOGICAL_OR', (3,), (37,))
+            self.assertEqual(1, len(args[0]))
+            with self.assertOpList(args[0][0]):
+                self.assertOp('LOAD_GLOBAL', 3, 40, 'ready')
+            self.assertOp('STORE_GLOBAL', 3, 29, 'b')
+            args = self.assertOp('LOGICAL_AND', (4,), (37,))
+            self.assertEqual(1, len(args[0]))
+            with self.assertOpList(args[0][0]):
+                self.assertOp('LOAD_GLOBAL', 4, 31, 'ready')
+            self.assertOp('STORE_GLOBAL', 4, 29, 'c')
+
+    def test_control_flow(self):
+        with self.compile('''
+                          if (debug):
+                              log(1)
+                          else if (ready):
+                              log(2)
+                          else if (level > 1):
+                              log(3)
+                          else:
+                              log(4)
+                          end
+                          while (debug):
+                              log(5)
+                          end
+                          if (debug):
+                              log(6)
+                          end
+                          '''):
+            args = self.assertOp('IF_ELSE', 2, 27)
+            self.assertEqual(2, len(args[0]))
+            cond, body = args[0][0]
+            with self.assertOpList(cond):
+                self.assertOp('LOAD_GLOBAL', 4, 36, 'ready')
+            with self.assertOpList(body):
+                self.assertOp('LOAD_GLOBAL', 5, 31, 'log')
+                self.assertOp('CALL_SIMPLE', 5, 34)
+            cond, body = args[0][1]
+            self.assertIsNone(cond)
+            with self.assertOpList(body):
+                self.assertOp('LOAD_GLOBAL', 7, 31, 'log')
+                self.assertOp('CALL_SIMPLE', 7, 34)
+
+    def test_derived_constants(self):
+        with self.compile('''
+                          limit = level * 10
+                          y = limit + 1
+                          function f():
+                              return limit
+                          end
+                          n = 1
+                          n = n + 1
+                          '''):
+            self.assertOp('LOAD_CONST', 2, 41, 20.0)
+            self.assertOp('STORE_GLOBAL', 2, 33, 'limit')
+            self.assertOp('LOAD_CONST', 3, 37, 21.0)
+            self.assertOp('STORE_GLOBAL', 3, 29, 'y')
+            # Functions might run before the binding
+            args = self.assertOp('MAKE_FUNCTION', 4, 27)
+            with self.assertOpList(args[1]):
+                self.assertOp('LOAD_GLOBAL', 5, 38, 'limit')
+                self.assertOp('RETURN_VALUE', 5, 31)
+            self.assertOp('STORE_GLOBAL', 4, 27, 'f')
+            # Globals bound more than once aren't constant
+            self.assertOp('LOAD_CONST', 7, 31, 1.0)
+            self.assertOp('STORE_GLOBAL', 7, 29, 'n')
+            self.assertOp('LOAD_GLOBAL', 8, 31, 'n')
+            self.assertOp('LOAD_CONST', 8, 35, 1.0)
+            self.assertOp('BINARY_OP', 8, 33,
+                          self.compiler.binary_op_codes['+'])
+            self.assertOp('STORE_GLOBAL', 8, 29, 'n')
+
+    def test_bound_constant(self):
+        with self.assertRaises(ValueError) as cm:
+            self.compile('function f():\n    level = 3\nend\n')
+        self.assertEqual("Global name 'level' is bound by the module",
+                         cm.exception.args[0])
+
+    def test_execution(self):
+        s = '''
+scale = level * 2
+if (debug and verbose):
+    log('x')
+else if (mode == 'fast' or extra):
+    y = scale + 1
+else:
+    y = 0
+end
+while (debug):
+    log('loop')
+end
+function f(v):
+    return v * scale + level
+end
+return [y, f(1), 1 < level <= 3]
+'''
+        constants = {'debug': False, 'verbose': True, 'mode': 'fast',
+                     'level': 3.0}
+        root = self.parse(s)
+        code = self.compiler.compile(root)
+        specializer = Specializer(constants)
+        specialized = specializer.specialize(root)
+        self.assertLess(specializer.count_ops(specialized),
+                        specializer.count_ops(code))
+
+        names = dict(constants, extra=False)
+        self.assertEqual((7.0, 9.0, True), Executor(names).run(code))
+        self.assertEqual((7.0, 9.0, True),
+                         Executor({'extra': False}).run(specialized))
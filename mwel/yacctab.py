@@ -0,0 +1,154 @@
+
+# yacctab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'moduleADDITIVEOP AND ASSIGN AUGASSIGN COLON COMMA COMPARISONOP DOT ELSE END FALSE FUNCTION IDENTIFIER IN LARROW LBRACE LBRACKET LOCAL LPAREN MULTIPLICATIVEOP NEWLINE NOT NULL NUMBER OR POWER RARROW RBRACE RBRACKET RETURN RPAREN STRING TRUE\n        module : newline stmt_list\n               | stmt_list\n        \n        stmt_list : stmt_list_items\n                  | stmt_list_items newline\n                  | empty\n        \n        stmt_list_items : stmt_list_items newline stmt\n                        | stmt\n        \n        stmt : assignment_stmt\n             | local_stmt\n             | call_stmt\n             | function_stmt\n             | return_stmt\n        \n        assignment_stmt : chained_assignment_stmt\n                        | augmented_assignment_stmt\n        \n        chained_assignment_stmt : assignment_target                                     ASSIGN                                     chained_assignment_stmt\n        \n        chained_assignment_stmt : assignment_target ASSIGN expr\n        \n        augmented_assignment_stmt : assignment_target AUGASSIGN expr\n        \n        assignment_target : subscript_expr\n                          | attribute_expr\n                          | identifier_expr\n        \n        local_stmt : LOCAL identifier_expr ASSIGN expr\n        \n        call_stmt : simple_call_stmt\n                  | compound_call_stmt\n        \n        simple_call_stmt : call_expr\n        \n        expr : or_expr\n        \n        compound_call_stmt : simple_call_stmt                                call_stmt_local_names                                call_stmt_body                                call_stmt_tail\n        \n        or_expr : or_expr OR and_expr\n        \n        or_expr : and_expr\n        \n        call_stmt_local_names : RARROW call_stmt_local_name_list\n                              | empty\n        \n        and_expr : and_expr AND not_expr\n        \n        call_stmt_local_name_list : call_stmt_local_name_list                                       COMMA                                       identifier_expr\n                                  | identifier_expr\n        \n        and_expr : not_expr\n        \n        not_expr : NOT not_expr\n                 | comparison_expr\n        \n        call_stmt_body : COLON newline stmt_list\n        \n        call_stmt_tail : ELSE compound_call_stmt\n        \n        comparison_expr : comparison_expr COMPARISONOP additive_expr\n        \n        call_stmt_tail : ELSE call_stmt_body END\n        \n        call_stmt_tail : END\n        \n        function_stmt : LOCAL function_def\n                      | function_def\n        \n        comparison_expr : comparison_expr IN additive_expr\n        \n        function_def : FUNCTION                          identifier_expr                          function_args                          COLON                          newline                          stmt_list                          END\n        \n        comparison_expr : comparison_expr NOT IN additive_expr\n        \n        comparison_expr : additive_expr\n        \n        additive_expr : additive_expr ADDITIVEOP multiplicative_expr\n                      | multiplicative_expr\n        \n        newline : NEWLINE newline\n                | NEWLINE\n        \n        return_stmt : RETURN expr\n                    | RETURN\n        \n        multiplicative_expr : multiplicative_expr MULTIPLICATIVEOP unary_expr\n                            | unary_expr\n        \n        call_arg_list : named_expr_list\n        \n        unary_expr : ADDITIVEOP unary_expr\n                   | exponentiation_expr\n        \n        named_expr_list : named_expr_list_items\n                        | named_expr_list_items COMMA\n        \n        exponentiation_expr : postfix_expr POWER unary_expr\n                            | postfix_expr\n        \n        named_expr_list_items : named_expr_list_items                                   COMMA                                   named_expr_list_item\n                              | named_expr_list_item\n        \n        postfix_expr : call_expr\n                     | subscript_expr\n                     | attribute_expr\n                     | primary_expr\n        \n        named_expr_list_item : identifier_expr ASSIGN expr\n        \n        named_expr_list_item : identifier_expr LARROW attribute_expr\n        \n        call_expr : postfix_expr LPAREN call_arg_list RPAREN\n        \n        call_arg_list : expr_list\n        \n        primary_expr : function_expr\n        \n        expr_list : expr_list_items\n                  | expr_list_items COMMA\n                  | empty\n        \n        function_expr : FUNCTION function_args expr END\n        \n        function_args : LPAREN function_arg_list RPAREN\n        \n        expr_list_items : expr_list_items COMMA expr\n                        | expr\n        \n        function_arg_list : function_arg_list_items\n                          | function_arg_list_items COMMA\n                          | empty\n        \n        subscript_expr : postfix_expr LBRACKET expr RBRACKET\n        \n        function_arg_list_items : function_arg_list_items                                     COMMA                                     function_arg_list_item\n                                | function_arg_list_item\n        \n        attribute_expr : postfix_expr DOT identifier_expr\n        \n        function_arg_list_item : identifier_expr\n        \n        primary_expr : parenthetic_expr\n                     | literal_expr\n                     | identifier_expr\n        \n        array_item : expr COLON expr COLON expr\n                   | expr COLON expr\n        \n        parenthetic_expr : LPAREN expr RPAREN\n        \n        literal_expr : object_literal_expr\n                     | array_literal_expr\n                     | string_literal_expr\n                     | number_literal_expr\n                     | boolean_literal_expr\n                     | null_literal_expr\n        \n        object_literal_expr : LBRACE object_item_list RBRACE\n        \n        object_item_list : object_item_list_items\n                         | object_item_list_items COMMA\n                         | empty\n        \n        object_item_list_items : object_item_list_items COMMA object_item\n                               | object_item\n        \n        object_item : object_key COLON expr\n        \n        object_key : string_literal_expr\n                   | identifier_expr\n        \n        array_literal_expr : LBRACKET array_item_list RBRACKET\n        \n        array_item_list : array_item_list_items\n                        | array_item_list_items COMMA\n                        | empty\n        \n        array_item_list_items : array_item_list_items COMMA array_item\n                              | array_item\n        \n        array_item : expr\n        \n        string_literal_expr : STRING string_literal_expr\n                            | STRING\n        \n        number_literal_expr : NUMBER\n        \n        boolean_literal_expr : TRUE\n                             | FALSE\n        \n        null_literal_expr : NULL\n        \n        identifier_expr : IDENTIFIER\n        \n        empty :\n        '
+    
+_lr_action_items = {'NEWLINE':([0,4,5,7,8,9,10,11,12,13,14,16,17,18,19,20,22,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,50,55,56,57,58,60,61,63,64,65,66,67,68,69,70,93,94,97,102,107,111,112,113,114,132,133,134,137,140,141,143,146,147,148,149,151,152,153,154,155,158,163,168,173,183,186,],[4,4,4,-7,-8,-9,-10,-11,-12,-13,-14,-91,-22,-23,-43,-53,-24,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-42,-52,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-6,4,-35,-57,-15,-16,-62,-17,-87,-94,-110,-101,-21,-26,-41,-27,-31,-39,-44,-48,-54,-61,4,-77,-71,-84,-38,-46,-40,-45,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,16,17,18,19,20,22,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,50,55,56,57,58,60,61,63,64,65,66,67,68,69,70,93,94,102,107,111,112,113,114,132,133,134,137,140,141,143,146,147,148,149,151,152,153,155,158,163,168,173,183,186,],[-124,0,-124,-2,-51,-3,-5,-7,-8,-9,-10,-11,-12,-13,-14,-91,-22,-23,-43,-53,-24,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-1,-50,-4,-42,-52,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-6,-35,-57,-15,-16,-62,-17,-87,-94,-110,-101,-21,-26,-41,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-38,-46,-40,-45,]),'LOCAL':([0,2,4,47,48,144,174,],[15,15,-51,-50,15,15,15,]),'RETURN':([0,2,4,47,48,144,174,],[20,20,-51,-50,20,20,20,]),'FUNCTION':([0,2,4,15,20,27,28,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,156,160,161,162,174,182,],[23,23,-51,51,71,71,71,-50,23,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,23,71,-78,71,71,71,23,71,]),'IDENTIFIER':([0,2,4,15,20,23,27,28,40,47,48,51,53,59,62,72,73,75,76,77,78,79,95,100,101,103,104,106,108,109,135,136,138,139,142,144,145,150,156,157,159,160,161,162,174,182,],[29,29,-51,29,29,29,29,29,29,-50,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-78,29,29,29,29,29,29,29,]),'LPAREN':([0,2,4,16,20,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,47,48,59,62,66,67,68,69,70,71,72,73,74,75,77,78,93,95,100,101,103,104,106,108,109,113,130,132,133,134,135,136,137,139,142,144,150,155,156,158,160,161,162,163,174,180,181,182,],[27,27,-51,-91,27,-65,76,-66,-67,77,27,27,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-50,27,27,27,77,-65,-66,-67,-91,76,27,27,76,27,27,27,-117,27,27,27,27,27,27,27,27,77,-91,-87,-94,-110,27,27,-101,27,27,27,27,-77,-78,-71,27,27,27,-84,27,-67,77,27,]),'LBRACE':([0,2,4,20,27,28,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,156,160,161,162,174,182,],[40,40,-51,40,40,40,-50,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-78,40,40,40,40,40,]),'LBRACKET':([0,2,4,16,20,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,47,48,59,62,66,67,68,69,70,72,73,75,77,78,93,95,100,101,103,104,106,108,109,113,130,132,133,134,135,136,137,139,142,144,150,155,156,158,160,161,162,163,174,180,181,182,],[28,28,-51,-91,28,-65,-66,-67,78,28,28,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-50,28,28,28,78,-65,-66,-67,-91,28,28,28,28,28,-117,28,28,28,28,28,28,28,28,78,-91,-87,-94,-110,28,28,-101,28,28,28,28,-77,-78,-71,28,28,28,-84,28,-67,78,28,]),'STRING':([0,2,4,20,27,28,40,41,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,138,139,142,144,150,156,160,161,162,174,182,],[41,41,-51,41,41,41,41,41,-50,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-78,41,41,41,41,41,]),'NUMBER':([0,2,4,20,27,28,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,156,160,161,162,174,182,],[42,42,-51,42,42,42,-50,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-78,42,42,42,42,42,]),'TRUE':([0,2,4,20,27,28,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,156,160,161,162,174,182,],[43,43,-51,43,43,43,-50,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-78,43,43,43,43,43,]),'FALSE':([0,2,4,20,27,28,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,156,160,161,162,174,182,],[44,44,-51,44,44,44,-50,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-78,44,44,44,44,44,]),'NULL':([0,2,4,20,27,28,47,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,156,160,161,162,174,182,],[45,45,-51,45,45,45,-50,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-78,45,45,45,45,45,]),'ELSE':([4,5,6,7,8,9,10,11,12,13,14,16,17,18,19,20,22,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,47,48,50,55,56,57,58,60,61,63,64,65,66,67,68,69,70,93,94,96,102,107,111,112,113,114,132,133,134,137,140,141,143,144,146,147,148,149,151,152,153,155,158,163,168,171,173,183,186,],[-51,-3,-5,-7,-8,-9,-10,-11,-12,-13,-14,-91,-22,-23,-43,-53,-24,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-50,-4,-42,-52,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-6,142,-35,-57,-15,-16,-62,-17,-87,-94,-110,-101,-21,-26,-41,-124,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-38,-37,-46,-40,-45,]),'END':([4,5,6,7,8,9,10,11,12,13,14,16,17,18,19,20,22,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,47,48,50,55,56,57,58,60,61,63,64,65,66,67,68,69,70,93,94,96,102,107,111,112,113,114,116,132,133,134,137,140,141,143,144,146,147,148,149,151,152,153,155,158,163,168,169,171,173,174,183,184,186,],[-51,-3,-5,-7,-8,-9,-10,-11,-12,-13,-14,-91,-22,-23,-43,-53,-24,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-50,-4,-42,-52,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-6,143,-35,-57,-15,-16,-62,-17,155,-87,-94,-110,-101,-21,-26,-41,-124,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-38,183,-37,-46,-124,-40,186,-45,]),'ASSIGN':([16,21,24,25,29,49,110,130,132,163,177,],[-20,72,-18,-19,-123,95,72,161,-87,-84,161,]),'AUGASSIGN':([16,21,24,25,29,132,163,],[-20,73,-18,-19,-123,-87,-84,]),'DOT':([16,22,24,25,26,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,66,67,68,69,70,93,113,130,132,133,134,137,155,158,163,180,181,],[-91,-65,-66,-67,79,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,79,-65,-66,-67,-91,-117,79,-91,-87,-94,-110,-101,-77,-71,-84,-67,79,]),'POWER':([16,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,66,67,68,69,70,93,113,130,132,133,134,137,155,158,163,],[-91,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,109,-65,-66,-67,-91,-117,109,-91,-87,-94,-110,-101,-77,-71,-84,]),'MULTIPLICATIVEOP':([16,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,63,64,65,66,67,68,69,70,93,107,113,130,132,133,134,137,151,152,153,155,158,163,],[-91,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,108,-55,-58,-62,-65,-66,-67,-91,-117,-57,-62,-91,-87,-94,-110,-101,108,-54,-61,-77,-71,-84,]),'ADDITIVEOP':([16,20,24,25,27,28,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,59,61,62,63,64,65,66,67,68,69,70,72,73,75,77,78,93,95,100,101,103,104,106,107,108,109,113,130,132,133,134,135,136,137,139,148,149,150,151,152,153,155,156,158,160,161,163,173,182,],[-91,62,-66,-67,62,62,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,62,106,62,-49,-55,-58,-62,-65,-66,-67,-91,62,62,62,62,62,-117,62,62,62,62,62,62,-57,62,62,-62,-91,-87,-94,-110,62,62,-101,62,106,106,62,-48,-54,-61,-77,-78,-71,62,62,-84,106,62,]),'COMPARISONOP':([16,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,60,61,63,64,65,66,67,68,69,70,93,107,113,130,132,133,134,137,148,149,151,152,153,155,158,163,173,],[-91,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,103,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-57,-62,-91,-87,-94,-110,-101,-39,-44,-48,-54,-61,-77,-71,-84,-46,]),'IN':([16,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,60,61,63,64,65,66,67,68,69,70,93,105,107,113,130,132,133,134,137,148,149,151,152,153,155,158,163,173,],[-91,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,104,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,150,-57,-62,-91,-87,-94,-110,-101,-39,-44,-48,-54,-61,-77,-71,-84,-46,]),'NOT':([16,20,24,25,27,28,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,59,60,61,63,64,65,66,67,68,69,70,72,73,75,77,78,93,95,100,101,107,113,130,132,133,134,135,136,137,139,148,149,151,152,153,155,156,158,160,161,163,173,182,],[-91,59,-66,-67,59,59,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,59,105,-47,-49,-55,-58,-62,-65,-66,-67,-91,59,59,59,59,59,-117,59,59,59,-57,-62,-91,-87,-94,-110,59,59,-101,59,-39,-44,-48,-54,-61,-77,-78,-71,59,59,-84,-46,59,]),'AND':([16,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,57,58,60,61,63,64,65,66,67,68,69,70,93,102,107,113,130,132,133,134,137,146,147,148,149,151,152,153,155,158,163,173,],[-91,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,101,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-35,-57,-62,-91,-87,-94,-110,-101,101,-31,-39,-44,-48,-54,-61,-77,-71,-84,-46,]),'OR':([16,24,25,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,56,57,58,60,61,63,64,65,66,67,68,69,70,93,102,107,113,130,132,133,134,137,146,147,148,149,151,152,153,155,158,163,173,],[-91,-66,-67,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,100,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-117,-35,-57,-62,-91,-87,-94,-110,-101,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-46,]),'RARROW':([17,22,158,170,],[53,-24,-71,53,]),'COLON':([17,22,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,52,54,56,57,58,60,61,63,64,65,66,67,68,69,70,85,90,91,92,93,98,99,102,107,115,132,133,134,137,142,146,147,148,149,151,152,153,155,156,158,163,165,170,172,173,],[-124,-24,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,97,-30,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,136,139,-108,-109,-117,-29,-33,-35,-57,154,-87,-94,-110,-101,97,-27,-31,-39,-44,-48,-54,-61,-77,-78,-71,-84,182,-124,-32,-46,]),'RBRACKET':([28,29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,56,57,58,60,61,63,64,65,66,67,68,69,70,81,82,83,84,85,93,102,107,131,132,133,134,135,137,146,147,148,149,151,152,153,155,158,163,164,165,173,185,],[-124,-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,134,-111,-113,-115,-116,-117,-35,-57,163,-87,-94,-110,-112,-101,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-114,-93,-46,-92,]),'RPAREN':([29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,56,57,58,60,61,63,64,65,66,67,68,69,70,76,77,80,93,102,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,132,133,134,137,146,147,148,149,151,152,153,155,157,158,159,160,163,173,175,176,178,179,180,],[-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,-124,-124,133,-117,-35,-57,156,-81,-83,-86,-88,158,-56,-72,-59,-74,-76,-64,-80,-91,-87,-94,-110,-101,-27,-31,-39,-44,-48,-54,-61,-77,-82,-71,-60,-75,-84,-46,-85,-63,-79,-69,-70,]),'COMMA':([29,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,56,57,58,60,61,63,64,65,66,67,68,69,70,82,84,85,87,89,93,98,99,102,107,118,120,121,125,126,128,129,130,132,133,134,137,146,147,148,149,151,152,153,155,158,163,164,165,166,167,172,173,175,176,178,179,180,185,],[-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-118,-119,-120,-121,-122,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,135,-115,-116,138,-106,-117,145,-33,-35,-57,157,-86,-88,159,160,-64,-80,-91,-87,-94,-110,-101,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-114,-93,-105,-107,-32,-46,-85,-63,-79,-69,-70,-92,]),'RBRACE':([29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,56,57,58,60,61,63,64,65,66,67,68,69,70,86,87,88,89,93,102,107,132,133,134,137,138,146,147,148,149,151,152,153,155,158,163,166,167,173,],[-123,-68,-73,-89,-90,-95,-96,-97,-98,-99,-100,-124,-118,-119,-120,-121,-122,-25,-28,-34,-36,-47,-49,-55,-58,-62,-65,-66,-67,-91,137,-102,-104,-106,-117,-35,-57,-87,-94,-110,-101,-103,-27,-31,-39,-44,-48,-54,-61,-77,-71,-84,-105,-107,-46,]),'LARROW':([29,130,177,],[-123,162,162,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'module':([0,],[1,]),'newline':([0,4,5,97,154,],[2,47,48,144,174,]),'stmt_list':([0,2,144,174,],[3,46,171,184,]),'stmt_list_items':([0,2,144,174,],[5,5,5,5,]),'empty':([0,2,17,28,40,76,77,144,170,174,],[6,6,54,83,88,119,127,6,54,6,]),'stmt':([0,2,48,144,174,],[7,7,94,7,7,]),'assignment_stmt':([0,2,48,144,174,],[8,8,8,8,8,]),'local_stmt':([0,2,48,144,174,],[9,9,9,9,9,]),'call_stmt':([0,2,48,144,174,],[10,10,10,10,10,]),'function_stmt':([0,2,48,144,174,],[11,11,11,11,11,]),'return_stmt':([0,2,48,144,174,],[12,12,12,12,12,]),'chained_assignment_stmt':([0,2,48,72,144,174,],[13,13,13,111,13,13,]),'augmented_assignment_stmt':([0,2,48,144,174,],[14,14,14,14,14,]),'identifier_expr':([0,2,15,20,23,27,28,40,48,51,53,59,62,72,73,75,76,77,78,79,95,100,101,103,104,106,108,109,135,136,138,139,142,144,145,150,157,159,160,161,162,174,182,],[16,16,49,70,74,70,70,92,16,74,99,70,70,16,70,70,121,130,70,132,70,70,70,70,70,70,70,70,70,70,92,70,70,16,172,70,121,177,70,70,70,16,70,]),'simple_call_stmt':([0,2,48,142,144,174,],[17,17,17,170,17,17,]),'compound_call_stmt':([0,2,48,142,144,174,],[18,18,18,168,18,18,]),'function_def':([0,2,15,48,144,174,],[19,19,50,19,19,19,]),'assignment_target':([0,2,48,72,144,174,],[21,21,21,110,21,21,]),'call_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[22,22,67,67,67,22,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,22,22,67,67,67,67,22,67,]),'subscript_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[24,24,68,68,68,24,68,68,24,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,24,68,68,68,68,24,68,]),'attribute_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[25,25,69,69,69,25,69,69,25,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,25,69,69,69,180,25,69,]),'postfix_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[26,26,66,66,66,26,66,66,113,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,26,26,66,66,66,181,26,66,]),'primary_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'function_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'parenthetic_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'literal_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'object_literal_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'array_literal_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'string_literal_expr':([0,2,20,27,28,40,41,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,138,139,142,144,150,160,161,162,174,182,],[36,36,36,36,36,91,93,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,91,36,36,36,36,36,36,36,36,36,]),'number_literal_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'boolean_literal_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'null_literal_expr':([0,2,20,27,28,48,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,142,144,150,160,161,162,174,182,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'call_stmt_local_names':([17,170,],[52,52,]),'expr':([20,27,28,72,73,75,77,78,95,135,136,139,160,161,182,],[55,80,85,112,114,116,129,131,140,85,165,167,178,179,185,]),'or_expr':([20,27,28,72,73,75,77,78,95,135,136,139,160,161,182,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'and_expr':([20,27,28,72,73,75,77,78,95,100,135,136,139,160,161,182,],[57,57,57,57,57,57,57,57,57,146,57,57,57,57,57,57,]),'not_expr':([20,27,28,59,72,73,75,77,78,95,100,101,135,136,139,160,161,182,],[58,58,58,102,58,58,58,58,58,58,58,147,58,58,58,58,58,58,]),'comparison_expr':([20,27,28,59,72,73,75,77,78,95,100,101,135,136,139,160,161,182,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'additive_expr':([20,27,28,59,72,73,75,77,78,95,100,101,103,104,135,136,139,150,160,161,182,],[61,61,61,61,61,61,61,61,61,61,61,61,148,149,61,61,61,173,61,61,61,]),'multiplicative_expr':([20,27,28,59,72,73,75,77,78,95,100,101,103,104,106,135,136,139,150,160,161,182,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,151,63,63,63,63,63,63,63,]),'unary_expr':([20,27,28,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,150,160,161,182,],[64,64,64,64,107,64,64,64,64,64,64,64,64,64,64,64,152,153,64,64,64,64,64,64,64,]),'exponentiation_expr':([20,27,28,59,62,72,73,75,77,78,95,100,101,103,104,106,108,109,135,136,139,150,160,161,182,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'function_args':([23,71,74,],[75,75,115,]),'array_item_list':([28,],[81,]),'array_item_list_items':([28,],[82,]),'array_item':([28,135,],[84,164,]),'object_item_list':([40,],[86,]),'object_item_list_items':([40,],[87,]),'object_item':([40,138,],[89,166,]),'object_key':([40,138,],[90,90,]),'call_stmt_body':([52,142,],[96,169,]),'call_stmt_local_name_list':([53,],[98,]),'function_arg_list':([76,],[117,]),'function_arg_list_items':([76,],[118,]),'function_arg_list_item':([76,157,],[120,175,]),'call_arg_list':([77,],[122,]),'named_expr_list':([77,],[123,]),'expr_list':([77,],[124,]),'named_expr_list_items':([77,],[125,]),'expr_list_items':([77,],[126,]),'named_expr_list_item':([77,159,],[128,176,]),'call_stmt_tail':([96,],[141,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> module","S'",1,None,None,None),
+  ('module -> newline stmt_list','module',2,'p_module','parser.py',16),
+  ('module -> stmt_list','module',1,'p_module','parser.py',17),
+  ('stmt_list -> stmt_list_items','stmt_list',1,'p_stmt_list','parser.py',23),
+  ('stmt_list -> stmt_list_items newline','stmt_list',2,'p_stmt_list','parser.py',24),
+  ('stmt_list -> empty','stmt_list',1,'p_stmt_list','parser.py',25),
+  ('stmt_list_items -> stmt_list_items newline stmt','stmt_list_items',3,'p_stmt_list_items','parser.py',31),
+  ('stmt_list_items -> stmt','stmt_list_items',1,'p_stmt_list_items','parser.py',32),
+  ('stmt -> assignment_stmt','stmt',1,'p_stmt','parser.py',38),
+  ('stmt -> local_stmt','stmt',1,'p_stmt','parser.py',39),
+  ('stmt -> call_stmt','stmt',1,'p_stmt','parser.py',40),
+  ('stmt -> function_stmt','stmt',1,'p_stmt','parser.py',41),
+  ('stmt -> return_stmt','stmt',1,'p_stmt','parser.py',42),
+  ('assignment_stmt -> chained_assignment_stmt','assignment_stmt',1,'p_assignment_stmt','parser.py',48),
+  ('assignment_stmt -> augmented_assignment_stmt','assignment_stmt',1,'p_assignment_stmt','parser.py',49),
+  ('chained_assignment_stmt -> assignment_target ASSIGN chained_assignment_stmt','chained_assignment_stmt',3,'p_chained_assignment_stmt','parser.py',55),
+  ('chained_assignment_stmt -> assignment_target ASSIGN expr','chained_assignment_stmt',3,'p_chained_assignment_stmt_single','parser.py',66),
+  ('augmented_assignment_stmt -> assignment_target AUGASSIGN expr','augmented_assignment_stmt',3,'p_augmented_assignment_stmt','parser.py',75),
+  ('assignment_target -> subscript_expr','assignment_target',1,'p_assignment_target','parser.py',85),
+  ('assignment_target -> attribute_expr','assignment_target',1,'p_assignment_target','parser.py',86),
+  ('assignment_target -> identifier_expr','assignment_target',1,'p_assignment_target','parser.py',87),
+  ('local_stmt -> LOCAL identifier_expr ASSIGN expr','local_stmt',4,'p_local_stmt','parser.py',93),
+  ('call_stmt -> simple_call_stmt','call_stmt',1,'p_call_stmt','parser.py',102),
+  ('call_stmt -> compound_call_stmt','call_stmt',1,'p_call_stmt','parser.py',103),
+  ('simple_call_stmt -> call_expr','simple_call_stmt',1,'p_simple_call_stmt','parser.py',109),
+  ('expr -> or_expr','expr',1,'p_expr','parser.py',114),
+  ('compound_call_stmt -> simple_call_stmt call_stmt_local_names call_stmt_body call_stmt_tail','compound_call_stmt',4,'p_compound_call_stmt','parser.py',118),
+  ('or_expr -> or_expr OR and_expr','or_expr',3,'p_or_expr','parser.py',124),
+  ('or_expr -> and_expr','or_expr',1,'p_or_expr_passthrough','parser.py',145),
+  ('call_stmt_local_names -> RARROW call_stmt_local_name_list','call_stmt_local_names',2,'p_call_stmt_local_names','parser.py',147),
+  ('call_stmt_local_names -> empty','call_stmt_local_names',1,'p_call_stmt_local_names','parser.py',148),
+  ('and_expr -> and_expr AND not_expr','and_expr',3,'p_and_expr','parser.py',151),
+  ('call_stmt_local_name_list -> call_stmt_local_name_list COMMA identifier_expr','call_stmt_local_name_list',3,'p_call_stmt_local_name_list','parser.py',154),
+  ('call_stmt_local_name_list -> identifier_expr','call_stmt_local_name_list',1,'p_call_stmt_local_name_list','parser.py',155),
+  ('and_expr -> not_expr','and_expr',1,'p_and_expr_passthrough','parser.py',157),
+  ('not_expr -> NOT not_expr','not_expr',2,'p_not_expr','parser.py',163),
+  ('not_expr -> comparison_expr','not_expr',1,'p_not_expr','parser.py',164),
+  ('call_stmt_body -> COLON newline stmt_list','call_stmt_body',3,'p_call_stmt_body','parser.py',163),
+  ('call_stmt_tail -> ELSE compound_call_stmt','call_stmt_tail',2,'p_call_stmt_tail','parser.py',173),
+  ('comparison_expr -> comparison_expr COMPARISONOP additive_expr','comparison_expr',3,'p_comparison_expr','parser.py',179),
+  ('call_stmt_tail -> ELSE call_stmt_body END','call_stmt_tail',3,'p_call_stmt_tail_bare_else','parser.py',179),
+  ('call_stmt_tail -> END','call_stmt_tail',1,'p_call_stmt_tail_empty','parser.py',185),
+  ('function_stmt -> LOCAL function_def','function_stmt',2,'p_function_stmt','parser.py',191),
+  ('function_stmt -> function_def','function_stmt',1,'p_function_stmt','parser.py',192),
+  ('comparison_expr -> comparison_expr IN additive_expr','comparison_expr',3,'p_comparison_expr_in','parser.py',198),
+  ('function_def -> FUNCTION identifier_expr function_args COLON newline stmt_list END','function_def',7,'p_function_def','parser.py',202),
+  ('comparison_expr -> comparison_expr NOT IN additive_expr','comparison_expr',4,'p_comparison_expr_not_in','parser.py',204),
+  ('comparison_expr -> additive_expr','comparison_expr',1,'p_comparison_expr_passthrough','parser.py',212),
+  ('additive_expr -> additive_expr ADDITIVEOP multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',218),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','parser.py',219),
+  ('newline -> NEWLINE newline','newline',2,'p_newline','parser.py',219),
+  ('newline -> NEWLINE','newline',1,'p_newline','parser.py',220),
+  ('return_stmt -> RETURN expr','return_stmt',2,'p_return_stmt','parser.py',226),
+  ('return_stmt -> RETURN','return_stmt',1,'p_return_stmt','parser.py',227),
+  ('multiplicative_expr -> multiplicative_expr MULTIPLICATIVEOP unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',234),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','parser.py',235),
+  ('call_arg_list -> named_expr_list','call_arg_list',1,'p_call_arg_list_named','parser.py',235),
+  ('unary_expr -> ADDITIVEOP unary_expr','unary_expr',2,'p_unary_expr','parser.py',241),
+  ('unary_expr -> exponentiation_expr','unary_expr',1,'p_unary_expr','parser.py',242),
+  ('named_expr_list -> named_expr_list_items','named_expr_list',1,'p_named_expr_list','parser.py',241),
+  ('named_expr_list -> named_expr_list_items COMMA','named_expr_list',2,'p_named_expr_list','parser.py',242),
+  ('exponentiation_expr -> postfix_expr POWER unary_expr','exponentiation_expr',3,'p_exponentiation_expr','parser.py',248),
+  ('exponentiation_expr -> postfix_expr','exponentiation_expr',1,'p_exponentiation_expr','parser.py',249),
+  ('named_expr_list_items -> named_expr_list_items COMMA named_expr_list_item','named_expr_list_items',3,'p_named_expr_list_items','parser.py',248),
+  ('named_expr_list_items -> named_expr_list_item','named_expr_list_items',1,'p_named_expr_list_items','parser.py',249),
+  ('postfix_expr -> call_expr','postfix_expr',1,'p_postfix_expr','parser.py',255),
+  ('postfix_expr -> subscript_expr','postfix_expr',1,'p_postfix_expr','parser.py',256),
+  ('postfix_expr -> attribute_expr','postfix_expr',1,'p_postfix_expr','parser.py',257),
+  ('postfix_expr -> primary_expr','postfix_expr',1,'p_postfix_expr','parser.py',258),
+  ('named_expr_list_item -> identifier_expr ASSIGN expr','named_expr_list_item',3,'p_named_expr_list_item','parser.py',257),
+  ('named_expr_list_item -> identifier_expr LARROW attribute_expr','named_expr_list_item',3,'p_named_expr_list_item_attribute_ref','parser.py',263),
+  ('call_expr -> postfix_expr LPAREN call_arg_list RPAREN','call_expr',4,'p_call_expr','parser.py',264),
+  ('call_arg_list -> expr_list','call_arg_list',1,'p_call_arg_list','parser.py',273),
+  ('primary_expr -> function_expr','primary_expr',1,'p_primary_expr_function_expr','parser.py',273),
+  ('expr_list -> expr_list_items','expr_list',1,'p_expr_list','parser.py',279),
+  ('expr_list -> expr_list_items COMMA','expr_list',2,'p_expr_list','parser.py',280),
+  ('expr_list -> empty','expr_list',1,'p_expr_list','parser.py',281),
+  ('function_expr -> FUNCTION function_args expr END','function_expr',4,'p_function_expr','parser.py',279),
+  ('function_args -> LPAREN function_arg_list RPAREN','function_args',3,'p_function_args','parser.py',285),
+  ('expr_list_items -> expr_list_items COMMA expr','expr_list_items',3,'p_expr_list_items','parser.py',287),
+  ('expr_list_items -> expr','expr_list_items',1,'p_expr_list_items','parser.py',288),
+  ('function_arg_list -> function_arg_list_items','function_arg_list',1,'p_function_arg_list','parser.py',291),
+  ('function_arg_list -> function_arg_list_items COMMA','function_arg_list',2,'p_function_arg_list','parser.py',292),
+  ('function_arg_list -> empty','function_arg_list',1,'p_function_arg_list','parser.py',293),
+  ('subscript_expr -> postfix_expr LBRACKET expr RBRACKET','subscript_expr',4,'p_subscript_expr','parser.py',294),
+  ('function_arg_list_items -> function_arg_list_items COMMA function_arg_list_item','function_arg_list_items',3,'p_function_arg_list_items','parser.py',299),
+  ('function_arg_list_items -> function_arg_list_item','function_arg_list_items',1,'p_function_arg_list_items','parser.py',300),
+  ('attribute_expr -> postfix_expr DOT identifier_expr','attribute_expr',3,'p_attribute_expr','parser.py',303),
+  ('function_arg_list_item -> identifier_expr','function_arg_list_item',1,'p_function_arg_list_item','parser.py',308),
+  ('primary_expr -> parenthetic_expr','primary_expr',1,'p_primary_expr','parser.py',312),
+  ('primary_expr -> literal_expr','primary_expr',1,'p_primary_expr','parser.py',313),
+  ('primary_expr -> identifier_expr','primary_expr',1,'p_primary_expr','parser.py',314),
+  ('array_item -> expr COLON expr COLON expr','array_item',5,'p_array_item_range_expr','parser.py',314),
+  ('array_item -> expr COLON expr','array_item',3,'p_array_item_range_expr','parser.py',315),
+  ('parenthetic_expr -> LPAREN expr RPAREN','parenthetic_expr',3,'p_parenthetic_expr','parser.py',320),
+  ('literal_expr -> object_literal_expr','literal_expr',1,'p_literal_expr','parser.py',327),
+  ('literal_expr -> array_literal_expr','literal_expr',1,'p_literal_expr','parser.py',328),
+  ('literal_expr -> string_literal_expr','literal_expr',1,'p_literal_expr','parser.py',329),
+  ('literal_expr -> number_literal_expr','literal_expr',1,'p_literal_expr','parser.py',330),
+  ('literal_expr -> boolean_literal_expr','literal_expr',1,'p_literal_expr','parser.py',331),
+  ('literal_expr -> null_literal_expr','literal_expr',1,'p_literal_expr','parser.py',332),
+  ('object_literal_expr -> LBRACE object_item_list RBRACE','object_literal_expr',3,'p_object_literal_expr','parser.py',338),
+  ('object_item_list -> object_item_list_items','object_item_list',1,'p_object_item_list','parser.py',348),
+  ('object_item_list -> object_item_list_items COMMA','object_item_list',2,'p_object_item_list','parser.py',349),
+  ('object_item_list -> empty','object_item_list',1,'p_object_item_list','parser.py',350),
+  ('object_item_list_items -> object_item_list_items COMMA object_item','object_item_list_items',3,'p_object_item_list_items','parser.py',356),
+  ('object_item_list_items -> object_item','object_item_list_items',1,'p_object_item_list_items','parser.py',357),
+  ('object_item -> object_key COLON expr','object_item',3,'p_object_item','parser.py',375),
+  ('object_key -> string_literal_expr','object_key',1,'p_object_key','parser.py',381),
+  ('object_key -> identifier_expr','object_key',1,'p_object_key','parser.py',382),
+  ('array_literal_expr -> LBRACKET array_item_list RBRACKET','array_literal_expr',3,'p_array_literal_expr','parser.py',388),
+  ('array_item_list -> array_item_list_items','array_item_list',1,'p_array_item_list','parser.py',426),
+  ('array_item_list -> array_item_list_items COMMA','array_item_list',2,'p_array_item_list','parser.py',427),
+  ('array_item_list -> empty','array_item_list',1,'p_array_item_list','parser.py',428),
+  ('array_item_list_items -> array_item_list_items COMMA array_item','array_item_list_items',3,'p_array_item_list_items','parser.py',434),
+  ('array_item_list_items -> array_item','array_item_list_items',1,'p_array_item_list_items','parser.py',435),
+  ('array_item -> expr','array_item',1,'p_array_item','parser.py',441),
+  ('string_literal_expr -> STRING string_literal_expr','string_literal_expr',2,'p_string_literal_expr','parser.py',447),
+  ('string_literal_expr -> STRING','string_literal_expr',1,'p_string_literal_expr','parser.py',448),
+  ('number_literal_expr -> NUMBER','number_literal_expr',1,'p_number_literal_expr','parser.py',459),
+  ('boolean_literal_expr -> TRUE','boolean_literal_expr',1,'p_boolean_literal_expr','parser.py',477),
+  ('boolean_literal_expr -> FALSE','boolean_literal_expr',1,'p_boolean_literal_expr','parser.py',478),
+  ('null_literal_expr -> NULL','null_literal_expr',1,'p_null_literal_expr','parser.py',486),
+  ('identifier_expr -> IDENTIFIER','identifier_expr',1,'p_identifier_expr','parser.py',492),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',500),
+]